@@ -12,17 +12,7 @@ from langchain_core.messages import HumanMessage
 from pydantic import ValidationError
 
 from glu import ROOT_DIR
-from glu.config import (
-    DEFAULT_ANTHROPIC_MODEL,
-    DEFAULT_GEMINI_MODEL,
-    DEFAULT_OLLAMA_MODEL,
-    DEFAULT_OPENAI_MODEL,
-    DEFAULT_XAI_MODEL,
-    JIRA_ISSUE_TEMPLATES,
-    MODEL_TOKEN_LIMITS,
-    PREFERENCES,
-    REPO_CONFIGS,
-)
+from glu.config import DEFAULT_TOKEN_LIMIT, MODEL_TOKEN_LIMITS, default_model, get_config
 from glu.models import (
     TICKET_PLACEHOLDER,
     ChatProvider,
@@ -39,6 +29,8 @@ class ChatClient:
     _client: BaseChatModel | None = None
 
     def __init__(self, model: str | None):
+        get_config()  # exports configured provider API keys to the environment
+
         # if os.getenv("GLEAN_API_TOKEN"): # currently not supported
         #     providers.append("Glean")
 
@@ -80,7 +72,7 @@ class ChatClient:
                 from openai import OpenAI
 
                 client = OpenAI()
-                self._model = self._model or DEFAULT_OPENAI_MODEL
+                self._model = self._model or default_model("OpenAI")
                 models = [model.id for model in client.models.list()]
                 if self._model not in models:
                     print_error(f"Invalid model for OpenAI: {self._model}")
@@ -89,22 +81,22 @@ class ChatClient:
             case "Gemini":
                 from langchain_google_genai import ChatGoogleGenerativeAI
 
-                self._model = self._model or DEFAULT_GEMINI_MODEL
+                self._model = self._model or default_model("Gemini")
                 self._client = ChatGoogleGenerativeAI(model=self._model)
             case "Anthropic":
                 from langchain_anthropic.chat_models import ChatAnthropic
 
-                self._model = self._model or DEFAULT_ANTHROPIC_MODEL
+                self._model = self._model or default_model("Anthropic")
                 self._client = ChatAnthropic(model_name=self._model, timeout=None, stop=None)
             case "Ollama":
                 from langchain_ollama.chat_models import ChatOllama
 
-                self._model = self._model or DEFAULT_OLLAMA_MODEL
+                self._model = self._model or default_model("Ollama")
                 self._client = ChatOllama(model=self._model)
             case "xAI":
                 from langchain_xai.chat_models import ChatXAI
 
-                self._model = self._model or DEFAULT_XAI_MODEL
+                self._model = self._model or default_model("xAI")
                 self._client = ChatXAI(model=self._model)
 
     @property
@@ -143,8 +135,9 @@ def generate_description(
         raise typer.Exit(1)
 
     if not template:
-        if REPO_CONFIGS.get(repo_name) and REPO_CONFIGS[repo_name].pr_template:
-            template_text: str = REPO_CONFIGS[repo_name].pr_template  # type: ignore
+        repo_configs = get_config().repos
+        if repo_configs.get(repo_name) and repo_configs[repo_name].pr_template:
+            template_text: str = repo_configs[repo_name].pr_template  # type: ignore
         else:
             template_dir = "glu/data/pull_request_template.md"
             with open(ROOT_DIR / template_dir, "r", encoding="utf-8") as f:
@@ -245,7 +238,7 @@ def generate_ticket(
     Description:
     {description}
     """
-    template = JIRA_ISSUE_TEMPLATES.get(issuetype.lower(), default_template)
+    template = get_config().jira_issue.get(issuetype.lower(), default_template)
 
     response_format = {
         "description": "{ticket description}",
@@ -321,8 +314,9 @@ def prompt_for_chat_provider(
     if len(providers) == 1:
         return providers[0]
 
-    if PREFERENCES.preferred_provider in providers:
-        return PREFERENCES.preferred_provider
+    preferences = get_config().preferences
+    if preferences.preferred_provider in providers:
+        return preferences.preferred_provider
 
     return inquirer.select("Select provider:", providers).execute()
 
@@ -452,8 +446,12 @@ def generate_final_commit_message(
         )
 
 
+def model_token_limit(model: str | None) -> int:
+    return MODEL_TOKEN_LIMITS.get(model or "", DEFAULT_TOKEN_LIMIT)
+
+
 def _trim_text_to_fit_token_limit(text: str, model: str, buffer_tokens: int = 1000) -> str:
-    max_tokens = MODEL_TOKEN_LIMITS.get(model, 200_000) - buffer_tokens
+    max_tokens = model_token_limit(model) - buffer_tokens
     try:
         encoding = tiktoken.encoding_for_model(model)
     except KeyError:
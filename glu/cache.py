@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from glu.config import cache_dir
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class DiskCache:
+    """
+    Pickle-backed key/value store under the glu cache dir. Total size is bounded, evicting
+    the least recently used entries first.
+    """
+
+    def __init__(self, namespace: str, max_bytes: int = 50 * 1024 * 1024):
+        self._dir = cache_dir() / namespace
+        self._max_bytes = max_bytes
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_at, value = pickle.load(f)
+        except Exception:
+            return None  # missing, or unreadable by this version
+
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((time.time(), value), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            return  # caching is only an optimization
+
+        self._evict()
+
+    def clear(self) -> None:
+        for path in self._dir.glob("*"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str):
+        return self._dir / hashlib.sha256(key.encode()).hexdigest()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._dir.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    link: str | None
+    checked_at: float
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode()
+
+
+def cached_get(
+    client: "httpx.Client",
+    cache: DiskCache,
+    url: str,
+    params: dict[str, Any] | None = None,
+    ttl: float = 0,
+    headers: dict[str, str] | None = None,
+) -> CachedResponse:
+    """
+    GET a url, serving it from the cache for `ttl` seconds and revalidating it with a
+    conditional request (If-None-Match/If-Modified-Since) afterwards.
+
+    Raises:
+        httpx.HTTPStatusError: on any response other than 200 or 304.
+    """
+    request = client.build_request("GET", url, params=params, headers=headers)
+    # responses depend on who is asking, so never share entries between credentials
+    credentials = hashlib.sha256(request.headers.get("Authorization", "").encode()).hexdigest()
+    key = f"{credentials}:{request.headers.get('Accept')}:{request.url}"
+
+    cached: CachedResponse | None = cache.get(key)
+    if cached and time.time() - cached.checked_at < ttl:
+        return cached
+
+    if cached and cached.etag:
+        request.headers["If-None-Match"] = cached.etag
+    elif cached and cached.last_modified:
+        request.headers["If-Modified-Since"] = cached.last_modified
+
+    response = client.send(request)
+    if response.status_code == 304 and cached:
+        cached.checked_at = time.time()
+        cache.set(key, cached)
+        return cached
+
+    response.raise_for_status()
+
+    fresh = CachedResponse(
+        response.status_code,
+        response.content,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        response.headers.get("Link"),
+        time.time(),
+    )
+    if fresh.etag or fresh.last_modified or ttl:
+        cache.set(key, fresh)
+
+    return fresh
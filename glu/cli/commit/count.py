@@ -2,8 +2,7 @@ import rich
 import typer
 from git import InvalidGitRepositoryError
 
-from glu.gh import get_github_client
-from glu.local import get_git_client
+from glu.local import get_default_branch, get_git_client
 from glu.utils import print_error, suppress_traceback
 
 
@@ -15,11 +14,7 @@ def count_commits(branch: str | None) -> None:
         print_error("Not valid a git repository")
         raise typer.Exit(1) from err
 
-    if branch:
-        branch_name = branch
-    else:
-        gh = get_github_client(git.repo_name)
-        branch_name = gh.default_branch
+    branch_name = branch or get_default_branch(git)
 
     num_commits = git.get_commit_count_since_checkout(branch_name)
 
@@ -2,9 +2,6 @@ from typing import Annotated
 
 import typer
 
-from glu.cli.commit.count import count_commits
-from glu.cli.commit.list import list_commits
-
 app = typer.Typer()
 
 
@@ -20,6 +17,8 @@ def list(
         ),
     ] = None,
 ):
+    from glu.cli.commit.list import list_commits
+
     list_commits(limit)
 
 
@@ -35,4 +34,6 @@ def count(
         ),
     ] = None,
 ):
+    from glu.cli.commit.count import count_commits
+
     count_commits(branch)
@@ -3,8 +3,7 @@ from git import InvalidGitRepositoryError
 from rich.table import Column, Table
 from rich.text import Text
 
-from glu.gh import get_github_client
-from glu.local import get_git_client
+from glu.local import get_default_branch, get_git_client
 from glu.utils import print_error, print_panel, suppress_traceback
 
 
@@ -16,13 +15,13 @@ def list_commits(limit: int | None) -> None:
         print_error("Not valid a git repository")
         raise typer.Exit(1) from err
 
-    gh = get_github_client(git.repo_name)
+    default_branch = get_default_branch(git)
 
-    num_commits = min(limit or max(git.get_commit_count_since_checkout(gh.default_branch), 5), 100)
+    num_commits = min(limit or max(git.get_commit_count_since_checkout(default_branch), 5), 100)
 
     commits = git.get_commit_log(num_commits)
 
-    branch_map = git.get_branch_commit_map(gh.default_branch)
+    branch_map = git.get_branch_commit_map(default_branch)
 
     commit_table = Table(
         Column(width=19, style="deep_sky_blue1"),
@@ -41,7 +40,7 @@ def list_commits(limit: int | None) -> None:
         commit_table.add_row(
             commit.committed_datetime.astimezone().strftime("%a %b %d %H:%M:%S"),
             commit.summary if isinstance(commit.summary, str) else commit.summary.decode(),
-            Text(branch, "bold turquoise2" if branch == gh.default_branch else "magenta2"),
+            Text(branch, "bold turquoise2" if branch == default_branch else "magenta2"),
             commit.author.name.replace('"', "") if commit.author.name else "",
             commit.hexsha[:7],
         )
@@ -0,0 +1,31 @@
+from typing import Annotated
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command(short_help="Start the glu daemon")
+def start(
+    foreground: Annotated[
+        bool,
+        typer.Option("--foreground", "-f", help="Run in the foreground instead of detaching"),
+    ] = False,
+):
+    from glu.cli.daemon.start import start_daemon
+
+    start_daemon(foreground)
+
+
+@app.command(short_help="Stop the glu daemon")
+def stop():
+    from glu.cli.daemon.stop import stop_daemon
+
+    stop_daemon()
+
+
+@app.command(short_help="Show whether the glu daemon is running")
+def status():
+    from glu.cli.daemon.status import daemon_status
+
+    daemon_status()
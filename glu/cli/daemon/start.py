@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import time
+
+import rich
+
+from glu.config import cache_dir
+from glu.daemon import ping, serve, socket_path
+from glu.utils import print_error, suppress_traceback
+
+STARTUP_TIMEOUT_S = 15
+
+
+@suppress_traceback
+def start_daemon(foreground: bool) -> None:
+    if running := ping():
+        rich.print(f"glu daemon is already running [grey70](pid {running['pid']})[/]")
+        return
+
+    path = socket_path()
+    if foreground:
+        rich.print(f":zap: glu daemon listening on [blue]{path}[/]")
+        serve(path)
+        return
+
+    log_path = cache_dir() / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "glu.daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if running := ping(path):
+            rich.print(f":zap: Started glu daemon [grey70](pid {running['pid']})[/]")
+            return
+        time.sleep(0.1)
+
+    print_error(f"glu daemon did not start, see {log_path}")
@@ -0,0 +1,17 @@
+import rich
+
+from glu.daemon import ping, socket_path
+from glu.utils import suppress_traceback
+
+
+@suppress_traceback
+def daemon_status() -> None:
+    running = ping()
+    if not running:
+        rich.print("glu daemon is [red]not running[/]")
+        return
+
+    rich.print(
+        f"glu daemon is [green]running[/] [grey70](pid {running['pid']}, "
+        f"v{running['version']}, {socket_path()})[/]"
+    )
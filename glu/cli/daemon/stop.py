@@ -0,0 +1,15 @@
+import rich
+
+from glu.daemon import send_request, socket_path
+from glu.utils import suppress_traceback
+
+
+@suppress_traceback
+def stop_daemon() -> None:
+    try:
+        send_request(socket_path(), {"control": "stop"})
+    except (OSError, ValueError):
+        rich.print("glu daemon is not running")
+        return
+
+    rich.print(":stop_sign: Stopped glu daemon")
@@ -0,0 +1,38 @@
+from urllib.parse import urlparse
+
+from glu.config import get_config
+from glu.gh import get_github_transport
+from glu.jira import get_jira_client
+from glu.scheduler import HostBudget, get_scheduler, print_budgets
+from glu.utils import suppress_traceback
+
+# GitHub reports a dozen budgets; these are the ones glu spends
+GITHUB_RESOURCES = ["core", "graphql", "search"]
+
+
+@suppress_traceback
+def show_diagnostics() -> None:
+    config = get_config()
+    scheduler = get_scheduler()
+
+    github = get_github_transport(config.env.github_pat).client
+    response = github.get("/rate_limit")  # doesn't count against the rate limit
+    response.raise_for_status()
+    for resource, rate_limit in response.json()["resources"].items():
+        if resource not in GITHUB_RESOURCES:
+            continue
+
+        blocked_until = scheduler.budget(github.base_url.host, resource).blocked_until
+        scheduler.record_budget(
+            github.base_url.host,
+            resource,
+            HostBudget(
+                rate_limit["remaining"], rate_limit["limit"], rate_limit["reset"], blocked_until
+            ),
+        )
+
+    # Jira has no rate limit endpoint; its headers come along with any request
+    get_jira_client().myself()
+    scheduler.budget(urlparse(config.env.jira_server).hostname or "")
+
+    print_budgets(scheduler.budgets())
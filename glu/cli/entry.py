@@ -0,0 +1,18 @@
+import sys
+
+from glu.daemon import forward_to_daemon
+
+
+def main() -> None:
+    # hand off to a running `glu daemon` before paying for any heavy imports
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from glu.cli.main import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
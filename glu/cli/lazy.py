@@ -0,0 +1,59 @@
+import importlib
+from dataclasses import dataclass
+
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass
+class LazySubcommand:
+    import_path: str
+    help: str
+    rich_help_panel: str | None = None
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Typer group that only imports a sub-app (and its dependencies) once that sub-app is
+    actually invoked. Help output lists every registered sub-app from its static metadata.
+    """
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    _listing: bool = False
+
+    def list_commands(self, ctx) -> list[str]:
+        return super().list_commands(ctx) + [
+            name for name in self.lazy_subcommands if name not in self.commands
+        ]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in self.commands or cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        subcommand = self.lazy_subcommands[cmd_name]
+        if self._listing:
+            # don't import anything just to render the command list
+            return TyperGroup(
+                name=cmd_name, help=subcommand.help, rich_help_panel=subcommand.rich_help_panel
+            )
+
+        return self._load(cmd_name, subcommand)
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def _load(self, cmd_name: str, subcommand: LazySubcommand):
+        sub_app: typer.Typer = importlib.import_module(subcommand.import_path).app
+
+        group = typer.main.get_group(sub_app)
+        group.name = cmd_name
+        group.help = subcommand.help
+        group.rich_help_panel = subcommand.rich_help_panel
+
+        self.commands[cmd_name] = group
+        return group
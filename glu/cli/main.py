@@ -3,15 +3,39 @@ from typing import Annotated
 import typer
 
 from glu import __version__
-from glu.cli.commit import index as commit
-from glu.cli.init import init_config
-from glu.cli.pr import index as pr
-from glu.cli.ticket import index as ticket
+from glu.cli.lazy import LazySubcommand, LazyTyperGroup
 from glu.config import (
     EnvConfig,
 )
 
-app = typer.Typer(rich_markup_mode="rich")
+
+class GluGroup(LazyTyperGroup):
+    # sub-apps are only imported when invoked, keeping startup fast
+    lazy_subcommands = {
+        "pr": LazySubcommand(
+            "glu.cli.pr.index",
+            help="Interact with pull requests.",
+            rich_help_panel=":rocket: Commands",
+        ),
+        "ticket": LazySubcommand(
+            "glu.cli.ticket.index",
+            help="Interact with Jira tickets.",
+            rich_help_panel=":rocket: Commands",
+        ),
+        "commit": LazySubcommand(
+            "glu.cli.commit.index",
+            help="Interact with commits.",
+            rich_help_panel=":rocket: Commands",
+        ),
+        "daemon": LazySubcommand(
+            "glu.cli.daemon.index",
+            help="Manage the optional background daemon that keeps API clients warm.",
+            rich_help_panel=":hammer_and_wrench: Config",
+        ),
+    }
+
+
+app = typer.Typer(cls=GluGroup, rich_markup_mode="rich")
 
 DEFAULTS = EnvConfig.defaults()
 
@@ -32,7 +56,17 @@ def main(
         is_eager=True,
         help="Show the version and exit",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Refetch cached Jira projects, issue types and workflow transitions",
+    ),
 ):
+    if refresh:
+        from glu.cache import DiskCache
+
+        DiskCache("jira").clear()
+
     if ctx.invoked_subcommand is None and not version:
         typer.echo(ctx.get_help())
 
@@ -120,6 +154,8 @@ def init(
     """
     Initialize the Glu configuration file interactively.
     """
+    from glu.cli.init import init_config
+
     init_config(
         jira_api_token,
         email,
@@ -133,22 +169,24 @@ def init(
     )
 
 
-app.add_typer(
-    pr.app, name="pr", help="Interact with pull requests.", rich_help_panel=":rocket: Commands"
-)
-app.add_typer(
-    ticket.app,
-    name="ticket",
-    help="Interact with Jira tickets.",
-    rich_help_panel=":rocket: Commands",
-)
+@app.command(rich_help_panel=":rocket: Commands")
+def status() -> None:
+    """
+    Show my open PRs with their reviews and checks, and my Jira tickets in progress.
+    """
+    from glu.cli.status import show_status
 
-app.add_typer(
-    commit.app,
-    name="commit",
-    help="Interact with commits.",
-    rich_help_panel=":rocket: Commands",
-)
+    show_status()
+
+
+@app.command(rich_help_panel=":hammer_and_wrench: Config")
+def diagnostics() -> None:
+    """
+    Show how much of the GitHub and Jira API rate limits is left.
+    """
+    from glu.cli.diagnostics import show_diagnostics
+
+    show_diagnostics()
 
 
 if __name__ == "__main__":
@@ -11,7 +11,7 @@ from glu.ai import (
     get_ai_client,
     prompt_for_chat_provider,
 )
-from glu.config import JIRA_IN_PROGRESS_TRANSITION, JIRA_READY_FOR_REVIEW_TRANSITION, PREFERENCES
+from glu.config import get_config
 from glu.gh import get_github_client, prompt_for_reviewers
 from glu.jira import (
     add_jira_key_to_pr_description,
@@ -20,6 +20,7 @@ from glu.jira import (
     get_jira_client,
     get_jira_project,
     get_user_from_jira,
+    move_ticket_for_pr,
 )
 from glu.local import checkout_to_branch, get_git_client, prompt_commit_edit
 from glu.utils import add_generated_with_glu_tag, print_error, suppress_traceback
@@ -35,12 +36,18 @@ def create_pr(  # noqa: C901
     model: str | None,
     ready_for_review: bool,
 ) -> None:
+    config = get_config()
+
     try:
         git = get_git_client()
     except InvalidGitRepositoryError as err:
         print_error("Not a valid git repository")
         raise typer.Exit(1) from err
 
+    # a ticket may only come up after committing and generating the description
+    jira = get_jira_client()
+    jira.warm_up()
+
     chat_client = get_ai_client(model)
     chat_provider = prompt_for_chat_provider(chat_client, provider)
     chat_client.set_chat_model(chat_provider)
@@ -95,8 +102,6 @@ def create_pr(  # noqa: C901
         if confirm_push:
             git.push()
 
-    jira = get_jira_client()
-
     first_commit = git.get_first_commit_since_checkout(gh.default_branch)
     commit = latest_commit or first_commit
 
@@ -137,7 +142,7 @@ def create_pr(  # noqa: C901
             myself_ref = get_user_from_jira(jira, user_query=None, user_type="reporter")
 
             ticket_description = ticket_data.description
-            if PREFERENCES.add_generated_with_glu_tag:
+            if config.preferences.add_generated_with_glu_tag:
                 ticket_description = add_generated_with_glu_tag(
                     ticket_description, supports_markdown=False
                 )
@@ -161,7 +166,7 @@ def create_pr(  # noqa: C901
     if ticket and jira_project:
         formatted_ticket = format_jira_ticket(jira_project, ticket, with_brackets=True)
         pr_description = add_jira_key_to_pr_description(pr_description, formatted_ticket)
-    if PREFERENCES.add_generated_with_glu_tag:
+    if config.preferences.add_generated_with_glu_tag:
         pr_description = add_generated_with_glu_tag(pr_description)
 
     pr = gh.create_pr(
@@ -169,11 +174,9 @@ def create_pr(  # noqa: C901
         title=title,
         body=pr_description,
         draft=draft,
+        reviewers=selected_reviewers,
     )
 
-    if selected_reviewers:
-        gh.add_reviewers_to_pr(pr, selected_reviewers)
-
     rich.print(Markdown(f"## {title}", style="grey70"))
     rich.print(Markdown(pr_description or "", style="grey70"))
     rich.print(
@@ -188,15 +191,7 @@ def create_pr(  # noqa: C901
     ticket_id = format_jira_ticket(jira_project, ticket or "")
 
     try:
-        transitions = jira.get_transitions(ticket_id)
-
-        if JIRA_IN_PROGRESS_TRANSITION in transitions:
-            jira.transition_issue(ticket_id, JIRA_IN_PROGRESS_TRANSITION)
-            transitions = jira.get_transitions(ticket_id)
-
-        if ready_for_review and not draft and JIRA_READY_FOR_REVIEW_TRANSITION in transitions:
-            jira.transition_issue(ticket_id, JIRA_READY_FOR_REVIEW_TRANSITION)
-            rich.print(f":eyes: Moved ticket [blue]{ticket_id}[/] to [green]Ready for review[/]")
+        move_ticket_for_pr(jira, ticket_id, ready_for_review and not draft)
     except JIRAError as err:
         rich.print(err)
         raise typer.Exit(1) from err
@@ -2,13 +2,6 @@ from typing import Annotated
 
 import typer
 
-from glu.cli.pr.create import create_pr
-from glu.cli.pr.list import list_prs as list_prs_core
-from glu.cli.pr.merge import merge_pr
-from glu.cli.pr.open import open_pr as open_pr_core
-from glu.cli.pr.update import update_pr
-from glu.cli.pr.view import view_pr as view_pr_core
-
 app = typer.Typer()
 
 
@@ -56,6 +49,8 @@ def create(
         ),
     ] = False,
 ):
+    from glu.cli.pr.create import create_pr
+
     create_pr(ticket, project, draft, reviewers, provider, model, ready_for_review)
 
 
@@ -95,8 +90,17 @@ def merge(
             help="Move Jira ticket to done",
         ),
     ] = False,
+    when_green: Annotated[
+        bool,
+        typer.Option(
+            "--when-green",
+            help="Wait for pending CI checks and only merge if they all pass",
+        ),
+    ] = False,
 ):
-    merge_pr(pr_num, ticket, project, provider, model, mark_as_done)
+    from glu.cli.pr.merge import merge_pr
+
+    merge_pr(pr_num, ticket, project, provider, model, mark_as_done, when_green)
 
 
 @app.command(name="list", short_help="List PRs")
@@ -116,8 +120,21 @@ def list_prs(
     no_draft: Annotated[
         bool, typer.Option("--no-draft", "-d", help="Filter PRs to exclude draft")
     ] = False,
+    repos: Annotated[
+        str | None,
+        typer.Option(
+            "--repos",
+            help="Comma-separated repos to list PRs across, e.g. org/a,org/b",
+            show_default=False,
+        ),
+    ] = None,
+    all_configured: Annotated[
+        bool, typer.Option("--all-configured", help="List PRs across all repos in the config")
+    ] = False,
 ):
-    list_prs_core(repo_name, only_mine, no_draft)
+    from glu.cli.pr.list import list_prs as list_prs_core
+
+    list_prs_core(repo_name, only_mine, no_draft, repos, all_configured)
 
 
 @app.command(name="open", short_help="Open PR in web browser")
@@ -133,6 +150,8 @@ def open_pr(
         ),
     ] = None,
 ):
+    from glu.cli.pr.open import open_pr as open_pr_core
+
     open_pr_core(pr_num, repo_name)
 
 
@@ -157,8 +176,18 @@ def view(
             help="Show CI checks (not enabled by default for performance reasons)",
         ),
     ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep CI checks updating until they complete, exiting with 1 if any failed",
+        ),
+    ] = False,
 ):
-    view_pr_core(pr_num, repo_name, show_checks)
+    from glu.cli.pr.view import view_pr as view_pr_core
+
+    view_pr_core(pr_num, repo_name, show_checks, watch)
 
 
 @app.command(short_help="Update a PR with description")
@@ -206,4 +235,6 @@ def update(
         ),
     ] = False,
 ):
+    from glu.cli.pr.update import update_pr
+
     update_pr(pr_num, ticket, project, draft, reviewers, provider, model, ready_for_review)
@@ -1,23 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
 import rich
 import typer
 from git import InvalidGitRepositoryError
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Column, Table
 from rich.text import Text
 
-from glu.gh import get_github_client
+from glu.config import get_config
+from glu.gh import PAGE_FETCH_WORKERS, GraphQLError, get_github_client
 from glu.local import get_git_client
+from glu.models import PRSummary
 from glu.utils import print_error, replace_emoji, suppress_traceback
 
 
 @suppress_traceback
-def list_prs(  # noqa: C901
+def list_prs(
     repo_name: str | None = None,
     only_mine: bool = False,
     no_draft: bool = False,
+    repos: str | None = None,
+    all_configured: bool = False,
 ) -> None:
-    if not repo_name:
+    if all_configured:
+        repo_names = list(get_config().repos)
+        if not repo_names:
+            print_error("No repos configured")
+            raise typer.Exit(1)
+    elif repos:
+        repo_names = [repo.strip() for repo in repos.split(",") if repo.strip()]
+    else:
+        repo_names = []
+
+    if len(repo_names) > 1:
+        _list_prs_across_repos(repo_names, only_mine, no_draft)
+        return
+
+    if repo_names:
+        repo_name = repo_names[0]
+    elif not repo_name:
         try:
             git = get_git_client()
             repo_name = git.repo_name
@@ -33,30 +57,9 @@ def list_prs(  # noqa: C901
         rich.print("Currently no open PRs")
         return
 
-    pr_table = Table(
-        Column(style="deep_sky_blue1"),
-        Column(no_wrap=True),
-        Column(no_wrap=True, style="yellow1"),
-        Column(no_wrap=True, style="green3"),
-        box=None,
-        padding=(0, 1),
-        show_header=False,
-    )
-
+    pr_table = _pr_table()
     for pr in prs:
-        title = Text(pr.title, style="grey46" if pr.draft else "bright_white")
-        if pr.labels:
-            for label in pr.labels:
-                title.append(" ")
-                text_with_emojis = replace_emoji(label.name)
-                title.append(Text(f"[{text_with_emojis}]", style=f"on #{label.color}"))
-
-        pr_table.add_row(
-            str(pr.number),
-            title,
-            pr.assignee.login if pr.assignee else "",
-            f"⍿ {pr.head.ref}",
-        )
+        pr_table.add_row(*_pr_row(pr))
 
     console = Console()
     console.print(
@@ -68,3 +71,75 @@ def list_prs(  # noqa: C901
             border_style="grey70",
         )
     )
+
+
+def _list_prs_across_repos(repo_names: list[str], only_mine: bool, no_draft: bool) -> None:
+    orgs = {repo_name.split("/")[0] for repo_name in repo_names}
+    # within a single org the org prefix is noise that eats into the title's width
+    org_prefix = f"{orgs.pop()}/" if len(orgs) == 1 else ""
+    # rows stream in, so reserve room for "repo#number" up front rather than let rich squeeze it
+    pr_table = _pr_table(max(len(name.removeprefix(org_prefix)) for name in repo_names) + 6)
+    panel = Panel(
+        pr_table,
+        title=Text(f"PRs (0/{len(repo_names)} repos)"),
+        title_align="left",
+        expand=False,
+        border_style="grey70",
+    )
+
+    # clients for the same token share one connection pool, so fetching all repos at once
+    # costs about as much as the slowest one
+    with (
+        ThreadPoolExecutor(PAGE_FETCH_WORKERS) as executor,
+        Live(panel, console=Console(), auto_refresh=False) as live,
+    ):
+        futures = {
+            executor.submit(get_github_client(repo_name).get_prs, only_mine, no_draft): repo_name
+            for repo_name in repo_names
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            repo_name = futures[future].removeprefix(org_prefix)
+            try:
+                prs = future.result()
+            except httpx.HTTPStatusError as err:
+                error = f"failed to fetch PRs ({err.response.status_code})"
+                pr_table.add_row(repo_name, Text(error, style="red"))
+            except GraphQLError as err:
+                pr_table.add_row(repo_name, Text(f"failed to fetch PRs: {err}", style="red"))
+            else:
+                for pr in prs:
+                    pr_table.add_row(*_pr_row(pr, repo_name))
+
+            panel.title = Text(f"PRs ({done}/{len(repo_names)} repos)")
+            live.refresh()
+
+    if not pr_table.row_count:
+        rich.print("Currently no open PRs")
+
+
+def _pr_table(number_width: int | None = None) -> Table:
+    return Table(
+        Column(style="deep_sky_blue1", no_wrap=True, min_width=number_width),
+        Column(no_wrap=True),
+        Column(no_wrap=True, style="yellow1"),
+        Column(no_wrap=True, style="green3"),
+        box=None,
+        padding=(0, 1),
+        show_header=False,
+    )
+
+
+def _pr_row(pr: PRSummary, repo_name: str | None = None) -> tuple[str, Text, str, str]:
+    title = Text(pr.title, style="grey46" if pr.draft else "bright_white")
+    if pr.labels:
+        for label in pr.labels:
+            title.append(" ")
+            text_with_emojis = replace_emoji(label.name)
+            title.append(Text(f"[{text_with_emojis}]", style=f"on #{label.color}"))
+
+    return (
+        f"{repo_name}#{pr.number}" if repo_name else str(pr.number),
+        title,
+        pr.assignee.login if pr.assignee else "",
+        f"⍿ {pr.head.ref}",
+    )
@@ -1,4 +1,6 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
 
 import rich
 import typer
@@ -6,29 +8,32 @@ from git import InvalidGitRepositoryError
 from github import GithubException
 from InquirerPy import inquirer
 from jira import JIRAError
+from rich.console import Group
+from rich.text import Text
 
 from glu.ai import (
     generate_final_commit_message,
     get_ai_client,
     prompt_for_chat_provider,
 )
-from glu.config import (
-    JIRA_DONE_TRANSITION,
-    PREFERENCES,
-)
+from glu.config import get_config
 from glu.gh import (
+    CHECK_STATE_STYLES,
     get_all_from_paginated_list,
     get_github_client,
     get_pr_approval_status,
+    get_pr_diff,
     get_repo_name_from_repo_config,
     print_status_checks,
+    watch_checks,
 )
 from glu.jira import (
     get_jira_client,
     get_jira_project,
     search_and_prompt_for_jira_ticket,
 )
-from glu.local import get_git_client, prompt_commit_edit
+from glu.local import GitClient, get_git_client, prompt_commit_edit
+from glu.models import ChecksSummary
 from glu.utils import print_error, print_panel, suppress_traceback
 
 
@@ -40,11 +45,16 @@ def merge_pr(  # noqa: C901
     provider: str | None,
     model: str | None,
     mark_as_done: bool,
+    when_green: bool = False,
 ) -> None:
+    config = get_config()
+
+    git: GitClient | None
     try:
         git = get_git_client()
         repo_name = git.repo_name
     except InvalidGitRepositoryError:
+        git = None
         repo_name = ""
 
     jira = get_jira_client()
@@ -84,7 +94,19 @@ def merge_pr(  # noqa: C901
         rich.print(message)
         raise typer.Exit(1)
 
-    pr_approval_status = get_pr_approval_status(pr.get_reviews())
+    # everything the pre-flight needs is independent, so fetch it all at once
+    executor = ThreadPoolExecutor(3)
+    approval_status_future = executor.submit(get_pr_approval_status, pr.get_reviews())
+    checks_summary_future = executor.submit(gh.get_pr_checks, pr_num, pr.head.sha)
+    commits_future = executor.submit(get_all_from_paginated_list, pr.get_commits())
+    executor.shutdown(wait=False)
+
+    pr_approval_status = approval_status_future.result()
+    checks_summary = checks_summary_future.result()
+    commits = commits_future.result()
+
+    _print_readiness_report(pr_approval_status, checks_summary, len(commits))
+
     if pr_approval_status == "changes_requested":
         rich.print(f"PR [bold green]#{pr_num}[/] in [blue]{repo_name}[/] has changes requested")
         raise typer.Exit(1)
@@ -92,24 +114,18 @@ def merge_pr(  # noqa: C901
         rich.print(f"PR [bold green]#{pr_num}[/] in [blue]{repo_name}[/] is [red]not approved[/].")
         typer.confirm("Would you like to try to continue anyway?", abort=True)
 
-    relevant_checks = []
-    bad_checks = 0
-    pr_checks = gh.get_pr_checks(pr_num)
-    for check in pr_checks:
-        if check.conclusion == "skipped" or check.status == "waiting":
-            continue
-
-        relevant_checks.append(check)
-        if check.conclusion != "success" and check.name not in [
-            check.name for check in pr_checks if check.conclusion == "success"
-        ]:
-            bad_checks += 1
-
-    if bad_checks:
-        print_status_checks(relevant_checks)
-        typer.confirm("Not all status checks passed. Continue?", abort=True)
+    if when_green and checks_summary.state == "pending":
+        rich.print("[grey70]Waiting for status checks to complete...[/]")
+        checks_summary = watch_checks(gh, pr_num, pr.head.sha)
+
+    if when_green and checks_summary.state == "failure":
+        print_status_checks(checks_summary.checks)
+        print_error("Not all status checks passed")
+        raise typer.Exit(1)
 
-    commits = get_all_from_paginated_list(pr.get_commits())
+    if checks_summary.state in ["failure", "pending"]:
+        print_status_checks(checks_summary.checks)
+        typer.confirm("Not all status checks passed. Continue?", abort=True)
 
     all_commit_messages = [commit_ref.commit.message for commit_ref in commits]
     summary_commit_message = f"{all_commit_messages[0]}\n\n" + "\n".join(
@@ -139,6 +155,11 @@ def merge_pr(  # noqa: C901
             commit_title = proposed_commit_message.split("\n\n")[0]
             commit_body = proposed_commit_message.replace(f"{commit_title}\n\n", "", 1).strip()
         case "Regenerate with AI":
+            # only fetched once needed, as exiting waits on it; the provider is picked meanwhile
+            diff_executor = ThreadPoolExecutor(1)
+            pr_diff_future = diff_executor.submit(get_pr_diff, gh, git, pr)
+            diff_executor.shutdown(wait=False)
+
             chat_client = get_ai_client(model)
             chat_provider = prompt_for_chat_provider(
                 chat_client, provider, raise_if_no_api_key=True
@@ -147,7 +168,7 @@ def merge_pr(  # noqa: C901
 
             rich.print("[grey70]Generating commit...[/]\n")
 
-            pr_diff = gh.get_pr_diff(pr_num)
+            pr_diff = pr_diff_future.result()
 
             commit_data = prompt_commit_edit(
                 generate_final_commit_message(
@@ -177,7 +198,7 @@ def merge_pr(  # noqa: C901
         else commit_body
     )
 
-    if PREFERENCES.add_pr_number_on_merge:
+    if config.preferences.add_pr_number_on_merge:
         commit_title += f" (#{pr.number})"
 
     rich.print("[grey70]Merging PR...[/]\n")
@@ -197,10 +218,7 @@ def merge_pr(  # noqa: C901
     if mark_as_done and formatted_ticket:
         ticket_id = formatted_ticket[1:-1]  # remove brackets
         try:
-            transitions = jira.get_transitions(ticket_id)
-
-            if JIRA_DONE_TRANSITION in transitions:
-                jira.transition_issue(ticket_id, JIRA_DONE_TRANSITION)
+            if jira.move_ticket(ticket_id, config.env.jira_done_transition):
                 rich.print(
                     f":white_check_mark: Marked ticket [blue]{ticket_id}[/] as [green]Done[/]"
                 )
@@ -209,6 +227,37 @@ def merge_pr(  # noqa: C901
             raise typer.Exit(1) from err
 
 
+def _print_readiness_report(
+    approval_status: Literal["approved", "changes_requested"] | None,
+    checks_summary: ChecksSummary,
+    commit_count: int,
+) -> None:
+    match approval_status:
+        case "approved":
+            approval = Text("approved", style="green")
+        case "changes_requested":
+            approval = Text("changes requested", style="red")
+        case _:
+            approval = Text("not approved", style="yellow1")
+
+    checks = Text(
+        f"{len(checks_summary.passed)}/{len(checks_summary.checks)} passed"
+        + (f", {len(checks_summary.pending)} pending" if checks_summary.pending else "")
+        if checks_summary.checks
+        else "none",
+        style=CHECK_STATE_STYLES[checks_summary.state],
+    )
+
+    print_panel(
+        "Merge readiness",
+        Group(
+            Text("Reviews: ", style="grey70") + approval,
+            Text("Checks: ", style="grey70") + checks,
+            Text("Commits: ", style="grey70") + Text(str(commit_count)),
+        ),
+    )
+
+
 def _search_jira_key_in_text(text: str, jira_project: str) -> re.Match[str] | None:
     """
     Search for any substring matching [{jira_project}-NUMBERS/LETTERS] (e.g. [ABC-XX1234]
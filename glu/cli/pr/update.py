@@ -6,15 +6,17 @@ from jira import JIRAError
 from glu.ai import (
     generate_description,
     get_ai_client,
+    model_token_limit,
     prompt_for_chat_provider,
 )
-from glu.config import JIRA_IN_PROGRESS_TRANSITION, JIRA_READY_FOR_REVIEW_TRANSITION, PREFERENCES
-from glu.gh import get_github_client, prompt_for_reviewers
+from glu.config import get_config
+from glu.gh import get_github_client, get_pr_diff, prompt_for_reviewers
 from glu.jira import (
     add_jira_key_to_pr_description,
     format_jira_ticket,
     get_jira_client,
     get_jira_project,
+    move_ticket_for_pr,
     search_and_prompt_for_jira_ticket,
 )
 from glu.local import get_git_client
@@ -32,6 +34,8 @@ def update_pr(
     model: str | None,
     ready_for_review: bool,
 ) -> None:
+    config = get_config()
+
     try:
         git = get_git_client()
     except InvalidGitRepositoryError as err:
@@ -55,7 +59,7 @@ def update_pr(
     )
 
     pr_template = gh.get_contents(".github/pull_request_template.md")
-    pr_diff = gh.get_pr_diff(number)
+    pr_diff = get_pr_diff(gh, git, pr, model_token_limit(chat_client.model))
     rich.print("[grey70]Generating description...[/]")
     pr_gen = generate_description(
         chat_client, pr_template, git.repo_name, pr_diff, pr.body, generate_title=True
@@ -66,7 +70,7 @@ def update_pr(
     pr_description = pr_gen.description
     if formatted_ticket:
         pr_description = add_jira_key_to_pr_description(pr_description, formatted_ticket)
-    if PREFERENCES.add_generated_with_glu_tag:
+    if config.preferences.add_generated_with_glu_tag:
         pr_description = add_generated_with_glu_tag(pr_description)
 
     gh.update_pr(
@@ -74,11 +78,9 @@ def update_pr(
         pr_gen.title,
         body=pr_description,
         draft=draft,
+        reviewers=selected_reviewers,
     )
 
-    if selected_reviewers:
-        gh.add_reviewers_to_pr(pr, selected_reviewers)
-
     rich.print(f"\n[grey70]{pr_description}[/]\n")
     rich.print(
         f":page_facing_up: Updated PR in [blue]{git.repo_name}[/] "
@@ -92,15 +94,7 @@ def update_pr(
     ticket_id = format_jira_ticket(jira_project, ticket or "")
 
     try:
-        transitions = jira.get_transitions(ticket_id)
-
-        if JIRA_IN_PROGRESS_TRANSITION in transitions:
-            jira.transition_issue(ticket_id, JIRA_IN_PROGRESS_TRANSITION)
-            transitions = jira.get_transitions(ticket_id)
-
-        if ready_for_review and not draft and JIRA_READY_FOR_REVIEW_TRANSITION in transitions:
-            jira.transition_issue(ticket_id, JIRA_READY_FOR_REVIEW_TRANSITION)
-            rich.print(f":eyes: Moved ticket [blue]{ticket_id}[/] to [green]Ready for review[/]")
+        move_ticket_for_pr(jira, ticket_id, ready_for_review and not draft)
     except JIRAError as err:
         rich.print(err)
         raise typer.Exit(1) from err
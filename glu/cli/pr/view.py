@@ -4,7 +4,7 @@ from rich.console import Group
 from rich.markdown import Markdown
 from rich.text import Text
 
-from glu.gh import get_check_attrs, get_github_client
+from glu.gh import get_check_attrs, get_github_client, watch_checks
 from glu.local import get_git_client
 from glu.utils import print_panel, replace_emoji, suppress_traceback
 
@@ -14,6 +14,7 @@ def view_pr(  # noqa: C901
     pr_num: int,
     repo_name: str | None,
     show_checks: bool,
+    watch: bool = False,
 ) -> None:
     if not repo_name:
         try:
@@ -71,21 +72,18 @@ def view_pr(  # noqa: C901
             )
         )
 
-    if show_checks:
-        relevant_checks = []
-        pr_checks = gh.get_pr_checks(pr_num)
-        for check in pr_checks:
-            if check.conclusion == "skipped" or check.status == "waiting":
-                continue
-
-            relevant_checks.append(check)
-
-        unique_checks = {check.name: check for check in relevant_checks}
+    if show_checks and not watch:
+        checks_summary = gh.get_pr_checks(pr_num, pr.head.sha)
 
         renderables.append(Text("\nChecks:", style="grey70"))
-        for check_name, check in unique_checks.items():
+        for check in checks_summary.checks:
             emoji, color = get_check_attrs(check)
-            renderables.append(Text(replace_emoji(f"{emoji} {check_name}"), style=color))
+            renderables.append(Text(replace_emoji(f"{emoji} {check.name}"), style=color))
 
     renderable_group = Group(*renderables)  # type: ignore
     print_panel(f"PR #{pr_num}", renderable_group, border_style)
+
+    if watch:
+        checks_summary = watch_checks(gh, pr_num, pr.head.sha)
+        if checks_summary.state == "failure":
+            raise typer.Exit(1)
@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, TypeVar
+
+from jira import Issue
+from rich.console import Group, RenderableType
+from rich.table import Column, Table
+from rich.text import Text
+
+from glu.gh import CHECK_STATE_STYLES, get_github_client
+from glu.jira import get_color_for_status, get_jira_client
+from glu.models import PRStatus
+from glu.utils import print_panel, suppress_traceback
+
+# the dashboard is shown with whatever has arrived by then, rather than wait on a slow backend
+STATUS_TIMEOUT_S = 10
+
+IN_PROGRESS_TICKETS_JQL = (
+    'assignee = currentUser() AND statusCategory = "In Progress" ORDER BY updated DESC'
+)
+
+STATUS_TICKET_FIELDS = ["summary", "status", "resolution"]
+
+TICKET_KEY = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
+
+T = TypeVar("T")
+
+
+@suppress_traceback
+def show_status() -> None:
+    prs_future = _run_in_background(lambda: get_github_client().get_my_open_prs())
+    tickets_future = _run_in_background(
+        lambda: get_jira_client().search_issues(IN_PROGRESS_TICKETS_JQL, STATUS_TICKET_FIELDS)
+    )
+
+    deadline = time.monotonic() + STATUS_TIMEOUT_S
+    prs, prs_error = _result_by(prs_future, deadline)
+    tickets, tickets_error = _result_by(tickets_future, deadline)
+
+    prs_by_ticket: dict[str, list[PRStatus]] = {}
+    for pr in prs or []:
+        for ticket_key in set(TICKET_KEY.findall(f"{pr.title} {pr.body or ''}")):
+            prs_by_ticket.setdefault(ticket_key, []).append(pr)
+
+    print_panel(
+        "Status",
+        Group(
+            Text("My PRs", style="bold"),
+            prs_error or _pr_table(prs or []),
+            Text(""),
+            Text("My tickets in progress", style="bold"),
+            tickets_error or _ticket_table(tickets or [], prs_by_ticket),
+        ),
+    )
+
+
+def _pr_table(prs: list[PRStatus]) -> RenderableType:
+    if not prs:
+        return Text("No open PRs", style="grey70")
+
+    pr_table = Table(
+        Column(style="deep_sky_blue1", no_wrap=True),
+        Column(),  # the title wraps, so the columns around it keep their width
+        Column(no_wrap=True),
+        Column(no_wrap=True),
+        box=None,
+        padding=(0, 1),
+        show_header=False,
+    )
+    for pr in prs:
+        match pr.approval_status:
+            case "approved":
+                approval = Text("approved", style="green")
+            case "changes_requested":
+                approval = Text("changes requested", style="red")
+            case _:
+                approval = Text("not approved", style="yellow1")
+
+        pr_table.add_row(
+            f"{pr.repo}#{pr.number}",
+            Text(pr.title, style="grey46" if pr.draft else "bright_white"),
+            approval,
+            Text(f"checks: {pr.checks_state}", style=CHECK_STATE_STYLES[pr.checks_state]),
+        )
+
+    return pr_table
+
+
+def _ticket_table(issues: list[Issue], prs_by_ticket: dict[str, list[PRStatus]]) -> RenderableType:
+    if not issues:
+        return Text("No tickets in progress", style="grey70")
+
+    ticket_table = Table(
+        Column(style="deep_sky_blue1", no_wrap=True),
+        Column(),
+        Column(no_wrap=True),
+        Column(no_wrap=True, style="grey70"),
+        box=None,
+        padding=(0, 1),
+        show_header=False,
+    )
+    for issue in issues:
+        fields = issue.fields
+        status_color = get_color_for_status(fields.status.name, fields.resolution)
+        linked_prs = prs_by_ticket.get(issue.key, [])
+        ticket_table.add_row(
+            issue.key,
+            Text(fields.summary, style=status_color),
+            Text(fields.status.name, style=status_color),
+            ", ".join(f"{pr.repo}#{pr.number}" for pr in linked_prs) or "no PR",
+        )
+
+    return ticket_table
+
+
+def _run_in_background(fn: Callable[[], T]) -> "Future[T]":
+    # a daemon thread, unlike an executor's, doesn't hold up exiting once the deadline passed
+    future: Future[T] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except Exception as err:
+            future.set_exception(err)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _result_by(future: "Future[T]", deadline: float) -> tuple[T, None] | tuple[None, Text]:
+    try:
+        return future.result(timeout=max(deadline - time.monotonic(), 0)), None
+    except FutureTimeoutError:
+        return None, Text(f"Timed out after {STATUS_TIMEOUT_S}s", style="red")
+    except Exception as err:
+        return None, Text(f"Failed to fetch: {err}", style="red")
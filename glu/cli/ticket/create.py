@@ -1,12 +1,17 @@
+import csv
+from pathlib import Path
 from typing import Any
 
 import rich
 import typer
+import yaml
 from git import InvalidGitRepositoryError
 from InquirerPy import inquirer
+from rich.table import Column, Table
+from rich.text import Text
 
 from glu.ai import get_ai_client, prompt_for_chat_provider
-from glu.config import DEFAULT_JIRA_PROJECT, PREFERENCES
+from glu.config import get_config
 from glu.jira import (
     generate_ticket_with_ai,
     get_jira_client,
@@ -14,7 +19,28 @@ from glu.jira import (
     get_user_from_jira,
 )
 from glu.local import get_git_client
-from glu.utils import add_generated_with_glu_tag, prompt_or_edit, suppress_traceback
+from glu.models import IdReference
+from glu.utils import (
+    add_generated_with_glu_tag,
+    print_error,
+    print_panel,
+    prompt_or_edit,
+    suppress_traceback,
+)
+
+# columns of a tickets file, by the names they may go by
+TICKET_COLUMNS = {
+    "summary": "summary",
+    "title": "summary",
+    "description": "description",
+    "body": "description",
+    "type": "issuetype",
+    "issuetype": "issuetype",
+    "project": "project",
+    "assignee": "assignee",
+    "reporter": "reporter",
+    "priority": "priority",
+}
 
 
 @suppress_traceback
@@ -31,6 +57,7 @@ def create_ticket(
     model: str | None,
     **extra_fields: Any,
 ):
+    config = get_config()
     jira = get_jira_client()
 
     try:
@@ -38,7 +65,7 @@ def create_ticket(
     except InvalidGitRepositoryError:
         repo_name = None
 
-    project = project or DEFAULT_JIRA_PROJECT
+    project = project or config.env.default_jira_project
     if not project:
         project = get_jira_project(jira, repo_name)
 
@@ -68,7 +95,7 @@ def create_ticket(
         )
         summary = ticket_data.summary
         body = ticket_data.description
-        if body and PREFERENCES.add_generated_with_glu_tag:
+        if body and config.preferences.add_generated_with_glu_tag:
             body = add_generated_with_glu_tag(body, supports_markdown=False)
     else:
         if not summary:
@@ -93,3 +120,172 @@ def create_ticket(
 
     rich.print(f":page_with_curl: Created issue [bold red]{issue.key}[/]")
     rich.print(f"View at {issue.permalink()}")
+
+
+@suppress_traceback
+def create_tickets_from_file(  # noqa: C901
+    path: Path,
+    issue_type: str | None,
+    assignee: str | None,
+    reporter: str | None,
+    priority: str | None,
+    project: str | None,
+    **extra_fields: Any,
+) -> None:
+    """Create the tickets listed in a YAML or CSV file, with options as defaults for each row."""
+    config = get_config()
+    jira = get_jira_client()
+
+    defaults = {
+        "issuetype": issue_type,
+        "assignee": assignee,
+        "reporter": reporter,
+        "priority": priority,
+        "project": project,
+        **extra_fields,
+    }
+    rows = [
+        defaults | {key: value for key, value in row.items() if value not in (None, "")}
+        for row in _load_ticket_rows(path)
+    ]
+    if not rows:
+        print_error(f"No tickets found in {path}")
+        raise typer.Exit(1)
+
+    if any(not row["project"] for row in rows):
+        try:
+            repo_name = get_git_client().repo_name
+        except InvalidGitRepositoryError:
+            repo_name = None
+
+        default_project = config.env.default_jira_project or get_jira_project(jira, repo_name)
+        for row in rows:
+            row["project"] = row["project"] or default_project
+
+    # everything is checked before anything is created, and each user and project looked up once
+    errors: dict[int, list[str]] = {}
+    for num, row in enumerate(rows, start=1):
+        # lists and mappings only make sense for extra fields
+        if invalid := [
+            column
+            for column in dict.fromkeys(TICKET_COLUMNS.values())
+            if row.get(column) is not None and not isinstance(row[column], str)
+        ]:
+            errors[num] = [f"invalid {column}" for column in invalid]
+
+    project_keys = jira.project_keys()
+    issuetypes = {
+        project: {issuetype.lower(): issuetype for issuetype in jira.get_issuetypes(project)}
+        for project in {row["project"].upper() for row in rows if isinstance(row["project"], str)}
+        & set(project_keys)
+    }
+    users: dict[str | None, IdReference | None] = {}
+    for num, row in enumerate(rows, start=1):
+        if num in errors:
+            continue
+
+        row_errors = errors.setdefault(num, [])
+        if not row.get("summary"):
+            row_errors.append("missing summary")
+
+        row["project"] = row["project"].upper()
+        if row["project"] not in project_keys:
+            row_errors.append(f"unknown project {row['project']}")
+        elif not row["issuetype"]:
+            row_errors.append("missing type")
+        elif row["issuetype"].lower() not in issuetypes[row["project"]]:
+            row_errors.append(f"unknown type {row['issuetype']} for {row['project']}")
+        else:
+            row["issuetype"] = issuetypes[row["project"]][row["issuetype"].lower()]
+
+        for user_type in ("reporter", "assignee"):
+            if row[user_type] not in users:
+                try:
+                    users[row[user_type]] = get_user_from_jira(jira, row[user_type], user_type)
+                except typer.Exit:
+                    users[row[user_type]] = None
+            if users[row[user_type]] is None:
+                row_errors.append(f"unknown {user_type} {row[user_type]}")
+
+        if not row_errors:
+            errors.pop(num)
+
+    if errors:
+        error_table = Table(Column(style="grey70", no_wrap=True), Column(), box=None)
+        for num, row_errors in errors.items():
+            error_table.add_row(f"Row {num}", Text(", ".join(row_errors), style="red"))
+        print_panel(f"Invalid tickets in {path.name}", error_table, border_style="red")
+        raise typer.Exit(1)
+
+    if not typer.confirm(f"Create {len(rows)} tickets?"):
+        raise typer.Exit(0)
+
+    tickets = []
+    for row in rows:
+        fields = {
+            key: value
+            for key, value in row.items()
+            if key not in ("project", "issuetype", "reporter", "assignee", "priority")
+        }
+        fields |= {
+            "project": {"key": row["project"]},
+            "issuetype": {"name": row["issuetype"]},
+            "reporter": users[row["reporter"]].model_dump(),  # type: ignore[union-attr]
+            "assignee": users[row["assignee"]].model_dump(),  # type: ignore[union-attr]
+        }
+        if row["priority"]:
+            fields["priority"] = {"name": row["priority"]}
+        tickets.append(fields)
+
+    rich.print(f"[grey70]Creating {len(tickets)} tickets...[/]\n")
+    created_tickets = jira.create_tickets(tickets)
+
+    result_table = Table(
+        Column(style="grey70", no_wrap=True),
+        Column(no_wrap=True),
+        Column(),
+        box=None,
+        padding=(0, 1),
+    )
+    for num, (row, created) in enumerate(zip(rows, created_tickets, strict=True), start=1):
+        result_table.add_row(
+            f"Row {num}",
+            Text(created.key or "failed", style="deep_sky_blue1" if created.key else "red"),
+            Text(row["summary"]) if created.key else Text(created.error or "", style="red"),
+        )
+
+    created_count = sum(1 for created in created_tickets if created.key)
+    print_panel(f"Created {created_count} of {len(rows)} tickets", result_table)
+    if created_count < len(rows):
+        raise typer.Exit(1)
+
+
+def _load_ticket_rows(path: Path) -> list[dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            match path.suffix.lower():
+                case ".yaml" | ".yml":
+                    rows = yaml.safe_load(f) or []
+                case ".csv":
+                    rows = list(csv.DictReader(f))
+                case _:
+                    print_error("Tickets file must be YAML (.yaml, .yml) or CSV (.csv)")
+                    raise typer.Exit(1)
+    except (OSError, yaml.YAMLError, csv.Error) as err:
+        print_error(f"Could not read {path}: {err}")
+        raise typer.Exit(1) from err
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        print_error(f"{path} must list one ticket per item")
+        raise typer.Exit(1)
+
+    # YAML reads `project: 123` as a number, or an unquoted date as a date
+    return [
+        {
+            TICKET_COLUMNS.get(str(key).lower(), key): (
+                value if value is None or isinstance(value, list | dict) else str(value)
+            )
+            for key, value in row.items()
+        }
+        for row in rows
+    ]
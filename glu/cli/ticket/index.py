@@ -1,12 +1,9 @@
+from pathlib import Path
 from typing import Annotated, Any
 
 import typer
 from typer import Context
 
-from glu.cli.ticket.create import create_ticket
-from glu.cli.ticket.list import list_tickets as list_tickets_core
-from glu.cli.ticket.open import open_ticket as open_ticket_core
-from glu.cli.ticket.view import view_ticket
 from glu.utils import get_kwargs
 
 app = typer.Typer()
@@ -56,9 +53,27 @@ def create(
             help="AI model",
         ),
     ] = None,
+    from_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--from",
+            help="YAML or CSV file of tickets to create, with the other options as defaults",
+            show_default=False,
+        ),
+    ] = None,
 ):
     extra_fields: dict[str, Any] = get_kwargs(ctx)
 
+    if from_file:
+        from glu.cli.ticket.create import create_tickets_from_file
+
+        create_tickets_from_file(
+            from_file, issue_type, assignee, reporter, priority, project, **extra_fields
+        )
+        return
+
+    from glu.cli.ticket.create import create_ticket
+
     create_ticket(
         summary,
         issue_type,
@@ -154,7 +169,17 @@ def list_tickets(
             help="Show in progress tickets only",
         ),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", "-l", help="Max number of tickets to show", min=1),
+    ] = 50,
+    show_all: Annotated[
+        bool,
+        typer.Option("--all", help="Show all matching tickets", show_default=False),
+    ] = False,
 ):
+    from glu.cli.ticket.list import list_tickets as list_tickets_core
+
     list_tickets_core(
         project,
         search,
@@ -167,6 +192,7 @@ def list_tickets(
         reporter,
         in_progress_only,
         open=not show_closed,
+        limit=None if show_all else limit,
     )
 
 
@@ -175,6 +201,8 @@ def open_ticket(
     ticket_num: Annotated[int, typer.Argument(help="Ticket number")],
     project: Annotated[str | None, typer.Option("--project", "-p", help="Jira project")] = None,
 ):
+    from glu.cli.ticket.open import open_ticket as open_ticket_core
+
     open_ticket_core(ticket_num, project)
 
 
@@ -183,4 +211,22 @@ def view(
     ticket_num: Annotated[int, typer.Argument(help="Ticket number")],
     project: Annotated[str | None, typer.Option("--project", "-p", help="Jira project")] = None,
 ):
+    from glu.cli.ticket.view import view_ticket
+
     view_ticket(ticket_num, project)
+
+
+@app.command(short_help="Sync mirrored Jira projects to their local copy")
+def sync(
+    project: Annotated[
+        str | None,
+        typer.Option("--project", "-p", help="Jira project (defaults to all mirrored projects)"),
+    ] = None,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Refetch all tickets rather than only updated ones"),
+    ] = False,
+):
+    from glu.cli.ticket.sync import sync_tickets
+
+    sync_tickets(project, full)
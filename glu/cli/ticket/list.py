@@ -1,16 +1,33 @@
+from collections.abc import Iterator
+
 import rich
 import typer
 from git import InvalidGitRepositoryError
+from jira import Issue
+from rich.console import Console
+from rich.live import Live
+from rich.panel import Panel
 from rich.table import Column, Table
 from rich.text import Text
 
-from glu.jira import get_color_for_priority, get_color_for_status, get_jira_client, get_jira_project
+from glu.jira import (
+    DEFAULT_SEARCH_LIMIT,
+    get_color_for_priority,
+    get_color_for_status,
+    get_jira_client,
+    get_jira_project,
+)
 from glu.local import get_git_client
-from glu.utils import abbreviate_last_name, print_error, print_panel, suppress_traceback
+from glu.mirror import get_jira_mirror
+from glu.models import IssuePage, TicketQuery
+from glu.utils import abbreviate_last_name, print_error, suppress_traceback
+
+# only what the table shows; descriptions, comments and custom fields are left on the server
+LIST_FIELDS = ["summary", "issuetype", "status", "priority", "assignee", "reporter", "resolution"]
 
 
 @suppress_traceback
-def list_tickets(  # noqa: C901
+def list_tickets(
     project: str | None,
     search: str | None,
     only_mine: bool,
@@ -22,6 +39,7 @@ def list_tickets(  # noqa: C901
     reporter: str | None,
     in_progress_only: bool,
     open: bool,
+    limit: int | None = DEFAULT_SEARCH_LIMIT,
 ) -> None:
     jira = get_jira_client()
     if not project:
@@ -36,38 +54,29 @@ def list_tickets(  # noqa: C901
     else:
         jira_project = project
 
-    issue_filters = [f"project={jira_project}"]
-    if only_mine:
-        issue_filters.append("assignee = currentUser()")
-    elif assignee:
-        issue_filters.append(f'assignee="{assignee}"')
-
-    if reporter:
-        issue_filters.append(f'reporter="{reporter}"')
+    query = TicketQuery(
+        jira_project,
+        search=search,
+        only_mine=only_mine,
+        assignee=assignee,
+        reporter=reporter,
+        statuses=statuses,
+        open=open,
+        in_progress_only=in_progress_only,
+        types=types,
+        priorities=priorities,
+        order_by_priority=order_by_priority,
+    )
 
-    if statuses:
-        issue_filters.append(f"status IN ({','.join(statuses)})")
+    pages: Iterator[IssuePage]
+    if mirror := get_jira_mirror(jira, jira_project):
+        account_id = jira.myself().accountId if only_mine else None
+        pages = iter([mirror.search(query, account_id, limit)])
     else:
-        if open:
-            issue_filters.append("resolution = unresolved")
-        if in_progress_only:
-            issue_filters.append('status != "to do"')
-
-    if types:
-        issue_filters.append(f"issuetype IN ({','.join(types)})")
-
-    if priorities:
-        issue_filters.append(f"priority IN ({','.join(priorities)})")
+        pages = jira.iter_issue_pages(query.to_jql(), LIST_FIELDS, limit)
 
-    if search:
-        issue_filters.append(f'text ~ "{search}"')
-
-    order = "priority" if order_by_priority else "created"
-    issue_filter = f"{' and '.join(issue_filters)} order by {order} desc"
-
-    issues = jira.search_issues(issue_filter)
-
-    if not issues:
+    first_page = next(pages, None)
+    if not first_page or not first_page.issues:
         rich.print("No issues found")
         return
 
@@ -84,26 +93,48 @@ def list_tickets(  # noqa: C901
         padding=(0, 1),
     )
 
-    for issue in issues:
-        fields = issue.fields
-        status_emoji = ""
-        if fields.resolution:
-            status_emoji = ":white_check_mark:"
-        elif fields.status.name.lower() != "to do":
-            status_emoji = ":small_blue_diamond:"
-
-        priority_color = get_color_for_priority(fields.priority.name)
-        status_color = get_color_for_status(fields.status.name, fields.resolution)
-
-        ticket_table.add_row(
-            status_emoji,
-            issue.key,
-            Text(fields.summary, style=status_color),
-            Text(fields.issuetype.name),
-            Text(fields.status.name, style=status_color),
-            Text(fields.priority.name, style=priority_color),
-            abbreviate_last_name(fields.assignee.displayName if fields.assignee else None),
-            abbreviate_last_name(fields.reporter.displayName if fields.reporter else None),
+    panel = Panel(
+        ticket_table,
+        title=Text(f"Tickets ({jira_project})"),
+        title_align="left",
+        expand=False,
+        border_style="grey70",
+    )
+    for issue in first_page.issues:
+        ticket_table.add_row(*_ticket_row(issue))
+
+    # rows are shown as each page arrives rather than after the whole backlog is fetched
+    with Live(panel, console=Console(), auto_refresh=False) as live:
+        for page in pages:
+            for issue in page.issues:
+                ticket_table.add_row(*_ticket_row(issue))
+            live.refresh()
+
+    if ticket_table.row_count < first_page.total:
+        rich.print(
+            f"[grey70]Showing {ticket_table.row_count} of {first_page.total} tickets, "
+            "use --limit or --all to show more[/]"
         )
 
-    print_panel(title=Text(f"Tickets ({jira_project})"), content=ticket_table)
+
+def _ticket_row(issue: Issue) -> tuple[str | Text, ...]:
+    fields = issue.fields
+    status_emoji = ""
+    if fields.resolution:
+        status_emoji = ":white_check_mark:"
+    elif fields.status.name.lower() != "to do":
+        status_emoji = ":small_blue_diamond:"
+
+    priority_color = get_color_for_priority(fields.priority.name)
+    status_color = get_color_for_status(fields.status.name, fields.resolution)
+
+    return (
+        status_emoji,
+        issue.key,
+        Text(fields.summary, style=status_color),
+        Text(fields.issuetype.name),
+        Text(fields.status.name, style=status_color),
+        Text(fields.priority.name, style=priority_color),
+        abbreviate_last_name(fields.assignee.displayName if fields.assignee else None),
+        abbreviate_last_name(fields.reporter.displayName if fields.reporter else None),
+    )
@@ -3,7 +3,7 @@ import webbrowser
 import typer
 from git import InvalidGitRepositoryError
 
-from glu.config import JIRA_SERVER
+from glu.config import get_config
 from glu.jira import get_jira_client, get_jira_project
 from glu.local import get_git_client
 from glu.utils import print_error, suppress_traceback
@@ -14,7 +14,6 @@ def open_ticket(
     ticket_num: int,
     project: str | None = None,
 ):
-    jira = get_jira_client()
     if not project:
         try:
             git = get_git_client()
@@ -23,8 +22,8 @@ def open_ticket(
             print_error("Not a valid git repository. Specify Jira project name")
             raise typer.Exit(1) from err
 
-        jira_project = get_jira_project(jira, repo_name, project)
+        jira_project = get_jira_project(get_jira_client(), repo_name, project)
     else:
         jira_project = project
 
-    webbrowser.open(f"{JIRA_SERVER}/browse/{jira_project}-{ticket_num}")
+    webbrowser.open(f"{get_config().env.jira_server}/browse/{jira_project}-{ticket_num}")
@@ -0,0 +1,28 @@
+import rich
+import typer
+
+from glu.config import get_config
+from glu.jira import get_jira_client
+from glu.mirror import JiraMirror
+from glu.utils import print_error, suppress_traceback
+
+
+@suppress_traceback
+def sync_tickets(project: str | None, full: bool) -> None:
+    config = get_config()
+    mirrored_projects = config.preferences.mirror_jira_projects
+    if project and project not in mirrored_projects:
+        print_error(f"{project} is not mirrored. Add it to mirror_jira_projects in your config")
+        raise typer.Exit(1)
+
+    if not mirrored_projects:
+        print_error("No Jira projects to mirror. Add them to mirror_jira_projects in your config")
+        raise typer.Exit(1)
+
+    jira = get_jira_client()
+    mirror = JiraMirror(config.env.jira_server, config.env.email)
+    for mirrored_project in [project] if project else mirrored_projects:
+        count = mirror.sync(jira, mirrored_project, full)
+        rich.print(
+            f":arrows_counterclockwise: Synced {count} tickets in [blue]{mirrored_project}[/]"
+        )
@@ -1,9 +1,10 @@
 from git import InvalidGitRepositoryError
 from rich.text import Text
 
-from glu.config import DEFAULT_JIRA_PROJECT
+from glu.config import get_config
 from glu.jira import get_color_for_priority, get_color_for_status, get_jira_client, get_jira_project
 from glu.local import get_git_client
+from glu.mirror import get_jira_mirror
 from glu.utils import print_panel, suppress_traceback
 
 
@@ -19,13 +20,16 @@ def view_ticket(
     except InvalidGitRepositoryError:
         repo_name = None
 
-    project = project or DEFAULT_JIRA_PROJECT
+    project = project or get_config().env.default_jira_project
     if not project:
         jira_project = get_jira_project(jira, repo_name)
     else:
         jira_project = project
 
-    issue = jira.get_issue(jira_project, ticket_num)
+    mirror = get_jira_mirror(jira, jira_project)
+    issue = mirror.get_issue(f"{jira_project}-{ticket_num}") if mirror else None
+    if issue is None:
+        issue = jira.get_issue(jira_project, ticket_num)
     fields = issue.fields
 
     issue_text = Text("Title:\n", style="grey70")
@@ -1,9 +1,14 @@
+import hashlib
 import os
+import pickle
+import time
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
-import toml
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from glu import __version__
 from glu.models import ChatProvider
 
 DEFAULT_MODELS: dict[ChatProvider, str] = {
@@ -99,6 +104,8 @@ class Preferences(BaseModel):
     preferred_provider: ChatProvider | None = None
     add_generated_with_glu_tag: bool = True
     add_pr_number_on_merge: bool = True
+    # Jira projects kept in a local copy for `ticket list` and `ticket view`
+    mirror_jira_projects: list[str] = Field(default_factory=list)
 
 
 class Config(BaseModel):
@@ -120,6 +127,8 @@ class Config(BaseModel):
             base.pop("repos")
         if not self.jira_issue:
             base.pop("jira_issue")
+        if not self.preferences.mirror_jira_projects:
+            base["preferences"].pop("mirror_jira_projects")
         return base
 
 
@@ -133,9 +142,21 @@ def config_path() -> Path:
     return base / "glu" / "config.toml"
 
 
+def cache_dir() -> Path:
+    if os.getenv("GLU_TEST"):
+        from tests import TESTS_DATA_DIR
+
+        return TESTS_DATA_DIR / ".cache"
+
+    base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "glu"
+
+
 def ensure_config():
     path = config_path()
     if not path.exists():
+        import toml
+
         path.parent.mkdir(parents=True, exist_ok=True)
 
         default_config = Config(env=EnvConfig.defaults())
@@ -143,80 +164,139 @@ def ensure_config():
         path.write_text(toml.dumps(default_config.model_dump()), encoding="utf-8")
 
 
-def get_config() -> Config:
-    with open(config_path(), "r") as f:
-        config = toml.load(f)
+RACY_SNAPSHOT_WINDOW_NS = 2_000_000_000
 
-    try:
-        return Config.model_validate(config)
-    except ValidationError as e:
-        raise ValueError(f"Error when setting up env variables:\n\n{e}") from e
 
+@dataclass
+class ConfigSnapshot:
+    version: str
+    mtime_ns: int
+    size: int
+    digest: str
+    written_ns: int
+    config: Config
 
-ensure_config()
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        # a file modified within the same clock tick as the snapshot was written could change
+        # again without its mtime moving, so only trust mtime/size when the snapshot is newer
+        is_racy = self.written_ns - stat.st_mtime_ns < RACY_SNAPSHOT_WINDOW_NS
+        return (
+            self.version == __version__
+            and self.mtime_ns == stat.st_mtime_ns
+            and self.size == stat.st_size
+            and not is_racy
+        )
 
-config = get_config()
 
-REPO_CONFIGS = config.repos
-JIRA_ISSUE_TEMPLATES = config.jira_issue
+def snapshot_path() -> Path:
+    # one per config file, so that a snapshot is never served for another one
+    path_digest = hashlib.sha256(str(config_path().resolve()).encode()).hexdigest()[:16]
+    return cache_dir() / f"config-{path_digest}.snapshot"
 
-# jira
-JIRA_SERVER = config.env.jira_server
-EMAIL = config.env.email
-JIRA_API_TOKEN = config.env.jira_api_token
-JIRA_IN_PROGRESS_TRANSITION = config.env.jira_in_progress_transition
-JIRA_READY_FOR_REVIEW_TRANSITION = config.env.jira_ready_for_review_transition
-JIRA_DONE_TRANSITION = config.env.jira_done_transition
-DEFAULT_JIRA_PROJECT = config.env.default_jira_project
 
-# github
-GITHUB_PAT = config.env.github_pat
+@cache
+def get_config() -> Config:
+    """
+    Load the validated config, from the snapshot cache when config.toml hasn't changed.
+    Provider API keys are exported to the environment on first load.
+    """
+    ensure_config()
 
-# glean
-if glean_config := config.env.glean_config:
-    os.environ["GLEAN_API_TOKEN"] = glean_config.api_key
-    os.environ["GLEAN_INSTANCE"] = glean_config.instance
+    config = _load_config()
+    _export_provider_env(config)
+    return config
 
-# openai
-if openai_config := config.env.openai_config:
-    os.environ["OPENAI_API_KEY"] = openai_config.api_key
-    if openai_config.org_id:
-        os.environ["OPENAI_ORG_ID"] = openai_config.org_id
 
-DEFAULT_OPENAI_MODEL = (
-    config.env.openai_config.model if config.env.openai_config else DEFAULT_MODELS["OpenAI"]
-)
+def default_model(provider: ChatProvider) -> str:
+    provider_config: ModelConfig | None = getattr(
+        get_config().env, f"{provider.lower()}_config", None
+    )
+    return provider_config.model if provider_config else DEFAULT_MODELS[provider]
 
-# gemini
-if gemini_config := config.env.gemini_config:
-    os.environ["GOOGLE_API_KEY"] = gemini_config.api_key
 
-DEFAULT_GEMINI_MODEL = (
-    config.env.gemini_config.model if config.env.gemini_config else DEFAULT_MODELS["Gemini"]
-)
+def _load_config() -> Config:
+    path = config_path()
+    stat = path.stat()
 
-# anthropic
-if anthropic_config := config.env.anthropic_config:
-    os.environ["ANTHROPIC_API_KEY"] = anthropic_config.api_key
+    snapshot = _read_snapshot()
+    if snapshot and snapshot.matches_stat(stat):
+        return snapshot.config
 
-DEFAULT_ANTHROPIC_MODEL = (
-    config.env.anthropic_config.model
-    if config.env.anthropic_config
-    else DEFAULT_MODELS["Anthropic"]
-)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot and snapshot.version == __version__ and snapshot.digest == digest:
+        config = snapshot.config  # touched but unchanged, no need to revalidate
+    else:
+        config = _validate_config(raw)
 
-# anthropic
-if xai_config := config.env.xai_config:
-    os.environ["XAI_API_KEY"] = xai_config.api_key
+    _write_snapshot(
+        ConfigSnapshot(__version__, stat.st_mtime_ns, stat.st_size, digest, time.time_ns(), config)
+    )
+    return config
 
-DEFAULT_XAI_MODEL = config.env.xai_config.model if config.env.xai_config else DEFAULT_MODELS["xAI"]
 
-# ollama
-DEFAULT_OLLAMA_MODEL = (
-    config.env.ollama_config.model if config.env.ollama_config else DEFAULT_MODELS["Ollama"]
-)
+def _validate_config(raw: bytes) -> Config:
+    import toml
+
+    config = toml.loads(raw.decode("utf-8"))
+
+    try:
+        return Config.model_validate(config)
+    except ValidationError as e:
+        raise ValueError(f"Error when setting up env variables:\n\n{e}") from e
+
+
+def _read_snapshot() -> ConfigSnapshot | None:
+    try:
+        with open(snapshot_path(), "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        # missing, unreadable or written by an incompatible version
+        return None
 
-PREFERENCES = config.preferences
+    return snapshot if isinstance(snapshot, ConfigSnapshot) else None
+
+
+def _write_snapshot(snapshot: ConfigSnapshot) -> None:
+    path = snapshot_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        # it holds the config's tokens and API keys, so only the user may read it
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            pickle.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the snapshot is only an optimization
+
+
+def _export_provider_env(config: Config) -> None:
+    # glean
+    if glean_config := config.env.glean_config:
+        os.environ["GLEAN_API_TOKEN"] = glean_config.api_key
+        os.environ["GLEAN_INSTANCE"] = glean_config.instance
+
+    # openai
+    if openai_config := config.env.openai_config:
+        os.environ["OPENAI_API_KEY"] = openai_config.api_key
+        if openai_config.org_id:
+            os.environ["OPENAI_ORG_ID"] = openai_config.org_id
+
+    # gemini
+    if gemini_config := config.env.gemini_config:
+        os.environ["GOOGLE_API_KEY"] = gemini_config.api_key
+
+    # anthropic
+    if anthropic_config := config.env.anthropic_config:
+        os.environ["ANTHROPIC_API_KEY"] = anthropic_config.api_key
+
+    # xai
+    if xai_config := config.env.xai_config:
+        os.environ["XAI_API_KEY"] = xai_config.api_key
+
+
+DEFAULT_TOKEN_LIMIT = 200_000
 
 MODEL_TOKEN_LIMITS = {
     # === OpenAI === https://platform.openai.com/docs/models
@@ -0,0 +1,288 @@
+"""
+Optional long-lived glu process that keeps imports, API clients and their connection pools warm.
+
+The client half of this module only uses the standard library so that forwarding a command
+costs next to nothing when a daemon is running, and falls back to in-process execution when
+it is not.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+from glu import __version__
+
+# only non-interactive commands are forwarded; anything that prompts runs in-process
+FORWARDABLE_COMMANDS = {
+    ("pr", "list"),
+    ("pr", "view"),
+    ("ticket", "list"),
+    ("ticket", "view"),
+    ("commit", "list"),
+    ("commit", "count"),
+    ("status",),
+}
+
+# output of these is streamed live, which a forwarded command can't do
+LIVE_OUTPUT_OPTIONS = {"--watch", "-w"}
+
+WARM_MODULES = [
+    "glu.cli.pr.index",
+    "glu.cli.pr.list",
+    "glu.cli.pr.view",
+    "glu.cli.ticket.index",
+    "glu.cli.ticket.list",
+    "glu.cli.ticket.view",
+    "glu.cli.commit.index",
+    "glu.cli.commit.list",
+    "glu.cli.commit.count",
+    "glu.cli.status",
+]
+
+CONNECT_TIMEOUT_S = 0.5
+RESPONSE_TIMEOUT_S = 300
+IDLE_TIMEOUT_S = 60 * 60
+
+
+class InteractiveInputRequired(BaseException):
+    """
+    Raised when a forwarded command tries to read from stdin. Subclasses BaseException so it
+    isn't swallowed by suppress_traceback and the client can rerun the command in-process.
+    """
+
+
+class _NoInput:
+    def read(self, *_: Any) -> str:
+        raise InteractiveInputRequired()
+
+    def readline(self, *_: Any) -> str:
+        raise InteractiveInputRequired()
+
+    def fileno(self) -> int:
+        # prompt_toolkit (behind InquirerPy) reads the terminal through the file descriptor
+        raise InteractiveInputRequired()
+
+    def isatty(self) -> bool:
+        return False
+
+
+def socket_path() -> Path:
+    if path := os.getenv("GLU_DAEMON_SOCKET"):
+        return Path(path)
+
+    base = Path(os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir())
+    return base / f"glu-{os.getuid()}.sock"
+
+
+def forward_to_daemon(argv: list[str]) -> int | None:
+    """
+    Run the command on the daemon if one is running and the command can be forwarded.
+
+    Returns:
+        The command's exit code, or None if the command should run in-process.
+    """
+    if (
+        os.getenv("GLU_NO_DAEMON")
+        or tuple(argv[:2]) not in FORWARDABLE_COMMANDS
+        or LIVE_OUTPUT_OPTIONS.intersection(argv)
+    ):
+        return None
+
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    request = {
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "isatty": sys.stdout.isatty(),
+        "width": _terminal_width(),
+    }
+    try:
+        response = send_request(path, request)
+    except (OSError, ValueError):
+        return None  # not running (stale socket), or died mid-request
+
+    if response.get("fallback"):
+        return None
+
+    sys.stdout.write(response["output"])
+    sys.stdout.flush()
+    sys.stderr.write(response["error_output"])
+    sys.stderr.flush()
+    return response["exit_code"]
+
+
+def send_request(path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(CONNECT_TIMEOUT_S)
+        conn.connect(str(path))
+        conn.settimeout(RESPONSE_TIMEOUT_S)
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        with conn.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def ping(path: Path | None = None) -> dict[str, Any] | None:
+    try:
+        return send_request(path or socket_path(), {"control": "ping"})
+    except (OSError, ValueError):
+        return None
+
+
+def serve(path: Path) -> None:
+    import importlib
+    import signal
+
+    from glu.cli.main import app
+
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    # turn SIGTERM into a normal shutdown so the socket gets cleaned up
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        old_umask = os.umask(0o177)  # socket is only accessible to the current user
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(old_umask)
+
+        server.listen()
+        server.settimeout(IDLE_TIMEOUT_S)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break  # idle for too long
+
+                with conn:
+                    if not _handle(conn, app):
+                        break
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def _handle(conn: socket.socket, app) -> bool:
+    """
+    Serve a single request.
+
+    Returns:
+        Whether the daemon should keep running.
+    """
+    conn.settimeout(None)
+    with conn.makefile("rb") as f:
+        request = json.loads(f.readline() or "{}")
+
+    keep_running = True
+    match request:
+        case {"control": "ping"}:
+            response = {"version": __version__, "pid": os.getpid()}
+        case {"control": "stop"}:
+            response = {"stopped": True}
+            keep_running = False
+        case {"version": version} if version != __version__:
+            response = {"fallback": True}
+        case {"argv": argv} if tuple(argv[:2]) in FORWARDABLE_COMMANDS:
+            response = _run(app, request)
+        case _:
+            response = {"fallback": True}
+
+    conn.sendall(json.dumps(response).encode() + b"\n")
+    return keep_running
+
+
+def _run(app, request: dict[str, Any]) -> dict[str, Any]:
+    import rich
+
+    _refresh_warm_state()
+
+    env_overrides = {"COLUMNS": str(request["width"])}
+    if request["isatty"]:
+        env_overrides["FORCE_COLOR"] = "1"
+
+    saved_env = {key: os.environ.get(key) for key in env_overrides}
+    saved_cwd = os.getcwd()
+    saved_stdin = sys.stdin
+    output = io.StringIO()
+    error_output = io.StringIO()
+    try:
+        os.chdir(request["cwd"])
+        os.environ.update(env_overrides)
+        sys.stdin = _NoInput()  # type: ignore[assignment]
+        rich.reconfigure()  # pick up width and color settings for this client
+
+        with redirect_stdout(output), redirect_stderr(error_output):
+            exit_code = _invoke(app, request["argv"])
+    except InteractiveInputRequired:
+        return {"fallback": True}
+    finally:
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    return {
+        "output": output.getvalue(),
+        "error_output": error_output.getvalue(),
+        "exit_code": exit_code,
+    }
+
+
+def _invoke(app, argv: list[str]) -> int:
+    try:
+        app(args=argv, prog_name="glu")
+    except SystemExit as err:
+        if err.code is None:
+            return 0
+        return err.code if isinstance(err.code, int) else 1
+    except Exception:
+        # Click errors exit above; anything else is left for sys.excepthook, which the
+        # client never sees, so the traceback goes back with the command's error output
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+def _refresh_warm_state() -> None:
+    """
+    Re-read config (cheap thanks to the config snapshot) and drop warm clients if it changed,
+    e.g. after a new PAT was set with `glu init`.
+    """
+    from glu.config import get_config
+    from glu.gh import get_github_client
+    from glu.jira import get_jira_client
+
+    previous = get_config()
+    get_config.cache_clear()
+    if get_config() != previous:
+        get_github_client.cache_clear()
+        get_jira_client.cache_clear()
+
+
+def _terminal_width() -> int:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        return 80
+
+
+if __name__ == "__main__":
+    serve(socket_path())
@@ -1,41 +1,210 @@
+import datetime as dt
+import importlib.util
+import logging
+import math
 import os
-from typing import Callable, Literal, TypeVar
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, TypeVar
 
 import httpx
 import rich
 import typer
-from github import Auth, Github, GithubException, UnknownObjectException
-from github.CheckRun import CheckRun
-from github.Commit import Commit
+from github import Auth, Github
+from github.ContentFile import ContentFile
 from github.GithubObject import GithubObject, NotSet
 from github.NamedUser import NamedUser
 from github.PaginatedList import PaginatedList
 from github.PullRequest import PullRequest
 from github.PullRequestReview import PullRequestReview
-from thefuzz import fuzz
+from github.Repository import Repository
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+from thefuzz import fuzz, process
+
+from glu.cache import CachedResponse, DiskCache, cached_get
+from glu.config import DEFAULT_TOKEN_LIMIT, get_config
+from glu.models import ChecksSummary, CheckStatus, MatchedUser, PRStatus, PRSummary
+from glu.scheduler import HostBudget, get_scheduler, resource_for_path
+from glu.utils import filterable_menu, multi_select_menu, print_error, replace_emoji
+
+if TYPE_CHECKING:
+    from glu.local import GitClient
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# seconds a cached response is trusted without asking GitHub; once stale it is revalidated
+# with a conditional request, which doesn't count against the rate limit when unchanged
+CACHE_TTLS: list[tuple[re.Pattern, float]] = [
+    (re.compile(r"^/repos/[^/]+/[^/]+/contents/"), 10 * 60),
+    (re.compile(r"^/repos/[^/]+/[^/]+$"), 60 * 60),
+    (re.compile(r"^/user$"), 60 * 60),
+]
+# identity and repo settings are resolved once per client and trusted in memory this long
+METADATA_TTL_S = 60 * 60
+
+OPEN_PRS_QUERY = """
+query($searchQuery: String!, $cursor: String) {
+  search(query: $searchQuery, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        isDraft
+        headRefName
+        assignees(first: 1) { nodes { login } }
+        labels(first: 20) { nodes { name color } }
+      }
+    }
+  }
+}
+"""
+
+# everything `glu status` shows about a PR, including its rolled up checks, in one query
+MY_OPEN_PRS_QUERY = """
+query($searchQuery: String!, $cursor: String) {
+  search(query: $searchQuery, type: ISSUE, first: 50, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        isDraft
+        body
+        repository { nameWithOwner }
+        reviewDecision
+        commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }
+      }
+    }
+  }
+}
+"""
+
+REVIEW_DECISIONS = {"APPROVED": "approved", "CHANGES_REQUESTED": "changes_requested"}
+
+ROLLUP_STATES = {
+    "SUCCESS": "success",
+    "FAILURE": "failure",
+    "ERROR": "failure",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+}
+
+CHECK_STATE_STYLES = {"success": "green", "failure": "red", "pending": "yellow1", "none": "grey70"}
+
+LAST_PAGE_LINK = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+PAGE_FETCH_WORKERS = 8
+
+MEMBER_DIRECTORY_TTL_S = 24 * 60 * 60
+
+CHECKS_POLL_INTERVAL_S = 5
+CHECKS_MAX_POLL_INTERVAL_S = 60
+
+# generous, so that the diff is only ever trimmed further by the model's tokenizer
+CHARS_PER_TOKEN = 4
+
+COMMIT_STATUS_CONCLUSIONS = {"success": "success", "failure": "failure", "error": "failure"}
+
+
+class GraphQLError(Exception):
+    """Error GitHub reported for a GraphQL query, e.g. a repo that doesn't exist."""
+
+
+class ScheduledTransport(httpx.BaseTransport):
+    """httpx transport sending every request through the request scheduler."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return get_scheduler().send(
+            request.url.host,
+            resource_for_path(request.url.path),
+            request.method,
+            lambda: self._transport.handle_request(request),
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class GithubTransport:
+    """
+    Keep-alive connection pool for GitHub's REST and GraphQL APIs (over HTTP/2 when h2 is
+    installed), shared by every GithubClient using the same token. Requests are throttled
+    and retried by the request scheduler.
+    """
+
+    def __init__(self, github_pat: str):
+        self.client = httpx.Client(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"token {github_pat}",
+            },
+            timeout=30,
+            transport=ScheduledTransport(
+                httpx.HTTPTransport(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(
+                        max_connections=PAGE_FETCH_WORKERS * 2,
+                        max_keepalive_connections=PAGE_FETCH_WORKERS,
+                    ),
+                )
+            ),
+        )
 
-from glu.config import GITHUB_PAT, REPO_CONFIGS
-from glu.models import MatchedUser
-from glu.utils import filterable_menu, multi_select_menu, print_error
+
+@cache
+def get_github_transport(github_pat: str) -> GithubTransport:
+    return GithubTransport(github_pat)
 
 
 class GithubClient:
-    def __init__(self, repo_name: str):
-        auth = Auth.Token(GITHUB_PAT)
-        self._client = Github(auth=auth)
-        self._repo = self._client.get_repo(repo_name)
+    """
+    Client for a repo's PRs. Without a repo it can only be used for calls that span repos,
+    like get_my_open_prs.
+    """
+
+    def __init__(self, repo_name: str | None = None):
+        github_pat = get_config().env.github_pat
+        # big pages mean fewer round trips; the pool lets pages be fetched concurrently
+        self._client = Github(
+            auth=Auth.Token(github_pat), per_page=100, pool_size=PAGE_FETCH_WORKERS
+        )
+        self._repo_name = repo_name
+        self._transport = get_github_transport(github_pat)
+        self._http = self._transport.client
+        self._cache = DiskCache("github")
+        self._metadata: dict[str, tuple[float, Any]] = {}
+        self._metadata_lock = threading.Lock()
 
     def get_members(self, repo_name: str) -> list[NamedUser]:
         org_name = repo_name.split("/")[0]
-        org = self._client.get_organization(org_name)
-        members_paginated = org.get_members()
-
-        all_members: list[NamedUser] = []
-        for i in range(5):
-            members = members_paginated.get_page(i)
-            if not members:
-                break
-            all_members += members
+        key = self._member_directory_key(org_name)
+        if directory := self._cache.get(key):
+            fetched_at, raw_members = directory
+            if time.time() - fetched_at > MEMBER_DIRECTORY_TTL_S:
+                # serve the stale directory now; it's refreshed by the time we're done
+                threading.Thread(
+                    target=self._refresh_member_directory_quietly, args=(org_name,)
+                ).start()
+        else:
+            raw_members = self._refresh_member_directory(org_name)
+
+        all_members = [
+            self._client.create_from_raw_data(NamedUser, raw_member) for raw_member in raw_members
+        ]
 
         if not all_members:
             print_error(f"No members found in org {org_name}")
@@ -43,12 +212,29 @@ class GithubClient:
 
         return all_members
 
+    def _refresh_member_directory(self, org_name: str) -> list[dict[str, Any]]:
+        raw_members = self._get_json_pages(f"/orgs/{org_name}/members")
+        self._cache.set(self._member_directory_key(org_name), (time.time(), raw_members))
+        return raw_members
+
+    def _refresh_member_directory_quietly(self, org_name: str) -> None:
+        try:
+            self._refresh_member_directory(org_name)
+        except Exception:
+            # the stale directory is kept, and the refresh retried by the next command
+            logger.debug("Failed to refresh the members of %s", org_name, exc_info=True)
+
+    def _member_directory_key(self, org_name: str) -> str:
+        # which members are visible depends on the token; keys are hashed before hitting disk
+        return f"{get_config().env.github_pat}:members:{org_name}"
+
     def create_pr(
         self,
         current_branch: str,
         title: str,
         body: str | None,
         draft: bool,
+        reviewers: list[NamedUser] | None = None,
     ) -> PullRequest:
         pr = self._repo.create_pull(
             self.default_branch,
@@ -57,7 +243,13 @@ class GithubClient:
             body=body or "",
             draft=draft,
         )
-        pr.add_to_assignees(self.myself)
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(pr.add_to_assignees, self.myself)]
+            if reviewers:
+                futures.append(executor.submit(self.add_reviewers_to_pr, pr, reviewers))
+            for future in futures:
+                future.result()
+
         return pr
 
     def update_pr(
@@ -66,76 +258,297 @@ class GithubClient:
         title: str | None,
         body: str | None,
         draft: bool | None,
+        reviewers: list[NamedUser] | None = None,
     ) -> None:
         if draft and not pr.draft:
             pr.convert_to_draft()
 
-        pr.edit(title or NotSet, body or NotSet)
+        with ThreadPoolExecutor(2) as executor:
+            futures = []
+            if title or body:
+                futures.append(executor.submit(pr.edit, title or NotSet, body or NotSet))
+            if reviewers:
+                futures.append(executor.submit(self.add_reviewers_to_pr, pr, reviewers))
+            for future in futures:
+                future.result()
 
     def add_reviewers_to_pr(self, pr: PullRequest, reviewers: list[NamedUser]) -> None:
-        for reviewer in reviewers:
-            try:
-                pr.create_review_request(reviewer.login)
-            except GithubException as e:
-                print_error(f"Failed to add reviewer {reviewer.login}: {e}")
+        """Request reviews from all reviewers at once, reporting any that couldn't be added."""
+        logins = [reviewer.login for reviewer in reviewers]
+        response = self._request_reviews(pr.number, logins)
+        if response.status_code == 422 and len(logins) > 1:
+            # GitHub rejects the whole batch without saying which login was invalid
+            for login in logins:
+                self._request_reviews(pr.number, [login])
+
+    def _request_reviews(self, number: int, logins: list[str]) -> httpx.Response:
+        response = self._http.post(
+            f"/repos/{self._repo_name}/pulls/{number}/requested_reviewers",
+            json={"reviewers": logins},
+        )
+        if response.is_success:
+            requested = {user["login"] for user in response.json()["requested_reviewers"]}
+            for login in logins:
+                if login not in requested:  # e.g. the PR's author, silently dropped by GitHub
+                    print_error(f"Failed to add reviewer {login}: review not requested")
+        else:
+            message = response.json().get("message", response.reason_phrase).rstrip(".")
+            if len(logins) == 1:
+                print_error(f"Failed to add reviewer {logins[0]}: {message}")
+            elif response.status_code != 422:
+                print_error(f"Failed to add reviewers {', '.join(logins)}: {message}")
+
+        return response
 
     def get_contents(self, path: str, ref: str | None = None) -> str | None:
         try:
-            file = self._repo.get_contents(path, ref or self.default_branch)
-        except UnknownObjectException:
-            return None
-
-        if isinstance(file, list):
-            return file[0].decoded_content.decode() if len(file) else None
-
+            raw_file = self._get_json(
+                f"/repos/{self._repo_name}/contents/{path.lstrip('/')}",
+                {"ref": ref or self.default_branch},
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if isinstance(raw_file, list):  # directory listings don't include file content
+            return self.get_contents(raw_file[0]["path"], ref) if len(raw_file) else None
+
+        file = self._client.create_from_raw_data(ContentFile, raw_file)
         return file.decoded_content.decode()
 
     def get_pr(self, number: int) -> PullRequest:
-        return self._repo.get_pull(number)
-
-    def get_pr_checks(self, number: int) -> list[CheckRun]:
-        pr = self.get_pr(number)
-        commits = pr.get_commits()
-        last_commit: Commit = commits[commits.totalCount - 1]
-        return get_all_from_paginated_list(last_commit.get_check_runs())
-
-    def get_prs(self, only_mine: bool = False, no_draft: bool = False) -> list[PullRequest]:
-        prs = get_all_from_paginated_list(self._repo.get_pulls(state="open"))
+        raw_pr = self._get_json(f"/repos/{self._repo_name}/pulls/{number}")
+        return self._client.create_from_raw_data(PullRequest, raw_pr)
+
+    def get_pr_checks(self, number: int, head_sha: str | None = None) -> ChecksSummary:
+        head_sha = head_sha or self.get_pr(number).head.sha
+        commit_path = f"/repos/{self._repo_name}/commits/{head_sha}"
+        with ThreadPoolExecutor(3) as executor:
+            check_runs_future = executor.submit(
+                self._get_json_pages,
+                f"{commit_path}/check-runs",
+                {"filter": "latest"},
+                "check_runs",
+            )
+            check_suites_future = executor.submit(
+                self._get_json_pages, f"{commit_path}/check-suites", None, "check_suites"
+            )
+            combined_status_future = executor.submit(
+                self._get_json, f"{commit_path}/status", {"per_page": 100}
+            )
+
+        checks = [
+            CheckStatus(
+                check_run["name"],
+                check_run["status"],
+                check_run["conclusion"],
+                _parse_datetime(check_run["started_at"]),
+                check_run["html_url"],
+            )
+            for check_run in check_runs_future.result()
+        ]
 
-        filters: list[Callable[[PullRequest], bool]] = []
+        for check_suite in check_suites_future.result():
+            # a running suite that hasn't created its check runs yet would otherwise be missed.
+            # Queued suites are left out: apps that never run on a repo leave them queued forever
+            if (
+                check_suite["status"] == "in_progress"
+                and not check_suite["latest_check_runs_count"]
+            ):
+                checks.append(CheckStatus(check_suite["app"]["name"], "in_progress", None))
+
+        for commit_status in combined_status_future.result()["statuses"]:
+            checks.append(
+                CheckStatus(
+                    commit_status["context"],
+                    "in_progress" if commit_status["state"] == "pending" else "completed",
+                    COMMIT_STATUS_CONCLUSIONS.get(commit_status["state"]),
+                    _parse_datetime(commit_status["created_at"]),
+                    commit_status["target_url"],
+                )
+            )
+
+        return ChecksSummary.from_checks(checks)
+
+    def get_prs(self, only_mine: bool = False, no_draft: bool = False) -> list[PRSummary]:
+        search_query = f"repo:{self._repo_name} is:pr is:open sort:created-desc"
         if only_mine:
-            filters.append(lambda pr: bool(pr.assignee and pr.assignee.login == self.myself))
-
+            search_query += " assignee:@me"
         if no_draft:
-            filters.append(lambda pr: not pr.draft)
-
-        return [pr for pr in prs if all(f(pr) for f in filters)]
-
-    def get_pr_diff(self, number: int) -> str | None:
-        headers = {
-            "Accept": "application/vnd.github.v3.diff",
-            "Authorization": f"token {GITHUB_PAT}",
-        }
-        url = f"https://api.github.com/repos/{self._repo.full_name}/pulls/{number}"
-        res = httpx.get(url, headers=headers)
-        if res.status_code != 200:
+            search_query += " draft:false"
+
+        prs: list[PRSummary] = []
+        for node in self._search(OPEN_PRS_QUERY, search_query):
+            assignees = node["assignees"]["nodes"]
+            pr_data = {
+                "number": node["number"],
+                "title": node["title"],
+                "draft": node["isDraft"],
+                "assignee": assignees[0] if assignees else None,
+                "labels": node["labels"]["nodes"],
+                "head": {"ref": node["headRefName"]},
+            }
+            prs.append(PRSummary.model_validate(pr_data))
+
+        return prs
+
+    def get_my_open_prs(self) -> list[PRStatus]:
+        """Get the open PRs I authored across all repos, with their reviews and checks."""
+        search_query = "is:pr is:open author:@me archived:false sort:updated-desc"
+
+        prs: list[PRStatus] = []
+        for node in self._search(MY_OPEN_PRS_QUERY, search_query):
+            last_commits = node["commits"]["nodes"]
+            rollup = last_commits[0]["commit"]["statusCheckRollup"] if last_commits else None
+            pr_data = {
+                "repo": node["repository"]["nameWithOwner"],
+                "number": node["number"],
+                "title": node["title"],
+                "draft": node["isDraft"],
+                "body": node["body"],
+                "approval_status": REVIEW_DECISIONS.get(node["reviewDecision"]),
+                "checks_state": ROLLUP_STATES.get(rollup["state"], "none") if rollup else "none",
+            }
+            prs.append(PRStatus.model_validate(pr_data))
+
+        return prs
+
+    def _search(self, query: str, search_query: str) -> Iterator[dict[str, Any]]:
+        cursor = None
+        while True:
+            data = self._graphql(query, {"searchQuery": search_query, "cursor": cursor})
+            yield from data["search"]["nodes"]
+
+            page_info = data["search"]["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            cursor = page_info["endCursor"]
+
+    def get_pr_diff(self, number: int, max_tokens: int | None = None) -> str | None:
+        """
+        Get the diff of a PR, read only as far as it could fit in a model's context.
+
+        Args:
+            number: PR number
+            max_tokens: token budget the diff is for, defaults to DEFAULT_TOKEN_LIMIT
+
+        Returns:
+            The (possibly truncated) diff, or None if the PR can't be found.
+        """
+        max_chars = (max_tokens or DEFAULT_TOKEN_LIMIT) * CHARS_PER_TOKEN
+        pr_path = f"/repos/{self._repo_name}/pulls/{number}"
+        diff_headers = {"Accept": "application/vnd.github.v3.diff"}
+        with self._http.stream("GET", pr_path, headers=diff_headers) as response:
+            if response.status_code == 200:
+                return _read_capped(response.iter_text(), max_chars)
+
+        if response.status_code == 404:
+            return None
+
+        # GitHub won't serve diffs past a size limit, but still serves each file's patch
+        return self._get_pr_diff_from_files(pr_path, max_chars)
+
+    def _get_pr_diff_from_files(self, pr_path: str, max_chars: int) -> str | None:
+        try:
+            files = self._get_json_pages(f"{pr_path}/files")
+        except httpx.HTTPStatusError:
             return None
-        return res.text
+
+        file_diffs = []
+        for file in files:
+            old_path = f"a/{file.get('previous_filename', file['filename'])}"
+            new_path = f"b/{file['filename']}"
+            if patch := file.get("patch"):
+                summary = f"--- {old_path}\n+++ {new_path}\n{patch}"
+            else:  # binary, or too large to have a patch
+                summary = f"[{file['status']}: +{file['additions']} -{file['deletions']}]"
+            file_diffs.append(f"diff --git {old_path} {new_path}\n{summary}\n")
+
+        return _read_capped(file_diffs, max_chars)
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> Any:
+        response = self._http.post("/graphql", json={"query": query, "variables": variables})
+        response.raise_for_status()
+        result = response.json()
+        if errors := result.get("errors"):
+            raise GraphQLError(errors[0]["message"])
+
+        return result["data"]
+
+    def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self._get(path, params).json()
+
+    def _get_json_pages(
+        self, path: str, params: dict[str, Any] | None = None, list_key: str | None = None
+    ) -> list[Any]:
+        page_params = {"per_page": 100, **(params or {})}
+        response = self._get(path, page_params)
+        items: list[Any] = response.json()[list_key] if list_key else response.json()
+
+        last_page = LAST_PAGE_LINK.search(response.link or "")
+        if not last_page:
+            return items
+
+        page_count = int(httpx.URL(last_page[1]).params["page"])
+        with ThreadPoolExecutor(PAGE_FETCH_WORKERS) as executor:
+            responses = executor.map(
+                lambda page: self._get(path, {**page_params, "page": page}),
+                range(2, page_count + 1),
+            )
+            for page_response in responses:
+                items += page_response.json()[list_key] if list_key else page_response.json()
+
+        return items
+
+    def _get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> CachedResponse:
+        path = httpx.URL(url).path if url.startswith("http") else url
+        ttl = next((ttl for pattern, ttl in CACHE_TTLS if pattern.match(path)), 0)
+        return cached_get(self._http, self._cache, url, params, ttl, headers)
+
+    @property
+    def rate_limit(self) -> HostBudget:
+        return get_scheduler().budget(httpx.URL(GITHUB_API_URL).host)
+
+    def _get_metadata(self, path: str) -> Any:
+        """
+        Memoize rarely changing metadata in memory, on top of the disk cache (keyed on the
+        token), so it costs at most one request per METADATA_TTL_S even in `glu daemon`.
+        """
+        with self._metadata_lock:
+            fetched_at, data = self._metadata.get(path, (0, None))
+            if time.time() - fetched_at > METADATA_TTL_S:
+                data = self._get_json(path)
+                self._metadata[path] = (time.time(), data)
+
+            return data
+
+    @property
+    def _repo(self) -> Repository:
+        return self._client.create_from_raw_data(
+            Repository, self._get_metadata(f"/repos/{self._repo_name}")
+        )
 
     @property
     def myself(self) -> str:
-        return self._client.get_user().login
+        return self._get_metadata("/user")["login"]
 
     @property
     def delete_branch_on_merge(self) -> bool:
-        return self._repo.delete_branch_on_merge
+        return self._get_metadata(f"/repos/{self._repo_name}").get("delete_branch_on_merge", False)
 
     @property
     def default_branch(self) -> str:
-        return self._repo.default_branch
+        return self._get_metadata(f"/repos/{self._repo_name}")["default_branch"]
 
 
-def get_github_client(repo_name: str) -> GithubClient:
+@cache  # keeps clients warm across commands in `glu daemon`
+def get_github_client(repo_name: str | None = None) -> GithubClient:
     if os.getenv("GLU_TEST"):
         from tests.clients.github import FakeGithubClient
 
@@ -159,34 +572,56 @@ def prompt_for_reviewers(
         )
         return [reviewer for reviewer in members if reviewer.login in selected_reviewers_login]
 
-    for i, reviewer in enumerate(reviewers):
-        matched_reviewers = [
-            MatchedUser(member, fuzz.ratio(reviewer, member.login)) for member in members
-        ]
-        sorted_reviewers = sorted(matched_reviewers, key=lambda x: x.score, reverse=True)
-        if sorted_reviewers[0].score == 100:  # exact match
-            selected_reviewers.append(sorted_reviewers[0].user)
+    all_matches = get_top_member_matches(members, reviewers)
+    for i, matches in enumerate(all_matches):
+        if matches[0].score == 100:  # exact match
+            selected_reviewers.append(matches[0].user)
             continue
 
         selected_reviewer_login = filterable_menu(
             f"Select reviewer{f' #{i + 1}' if len(reviewers) > 1 else ''}:",
-            [reviewer.user.login for reviewer in sorted_reviewers[:5]],
+            [match.user.login for match in matches],
         )
         selected_reviewer = next(
-            reviewer.user
-            for reviewer in sorted_reviewers[:5]
-            if reviewer.user.login == selected_reviewer_login
+            match.user for match in matches if match.user.login == selected_reviewer_login
         )
         selected_reviewers.append(selected_reviewer)
 
     return selected_reviewers
 
 
+def get_top_member_matches(
+    members: list[NamedUser], queries: list[str], k: int = 5
+) -> list[list[MatchedUser]]:
+    """
+    Fuzzy lookup of org members by login.
+
+    Args:
+        members: org members to match against
+        queries: logins (or parts of logins) to look up
+        k: number of matches per query
+
+    Returns:
+        The best k matches for each query, best first.
+    """
+    members_by_login = {member.login: member for member in members}
+    return [
+        [
+            MatchedUser(members_by_login[login], score)
+            for login, score in process.extract(
+                query, list(members_by_login), scorer=fuzz.ratio, processor=None, limit=k
+            )
+        ]
+        for query in queries
+    ]
+
+
 def get_repo_name_from_repo_config(project: str) -> str | None:
-    if not REPO_CONFIGS:
+    repo_configs = get_config().repos
+    if not repo_configs:
         return None
 
-    for repo, config in REPO_CONFIGS.items():
+    for repo, config in repo_configs.items():
         if config.jira_project_key == project:
             return repo
 
@@ -196,7 +631,9 @@ def get_repo_name_from_repo_config(project: str) -> str | None:
 def get_pr_approval_status(
     paginated_reviews: PaginatedList[PullRequestReview],
 ) -> Literal["approved", "changes_requested"] | None:
-    reviews = get_all_from_paginated_list(paginated_reviews)
+    reviews = get_all_from_paginated_list(
+        paginated_reviews, until=lambda review: review.state == "APPROVED"
+    )
 
     if any(review.state == "APPROVED" for review in reviews):
         return "approved"
@@ -207,23 +644,86 @@ def get_pr_approval_status(
     return None
 
 
-T = TypeVar("T", bound=GithubObject)
+def get_pr_diff(
+    gh: GithubClient, git: "GitClient | None", pr: PullRequest, max_tokens: int | None = None
+) -> str | None:
+    """
+    Get the diff of a PR from the local checkout if it has both the base and head commits,
+    falling back to downloading it from GitHub.
 
+    Args:
+        gh: client for the PR's repo
+        git: client for a checkout of the same repo, if there is one
+        pr: the PR
+        max_tokens: token budget the diff is for, defaults to DEFAULT_TOKEN_LIMIT
+    """
+    if git and (diff := git.get_merge_base_diff(pr.base.sha, pr.head.sha)) is not None:
+        return _read_capped([diff], (max_tokens or DEFAULT_TOKEN_LIMIT) * CHARS_PER_TOKEN)
 
-def get_all_from_paginated_list(paginated_list: PaginatedList[T]) -> list[T]:
-    items: list[T] = []
-    page = 0
-    while True:
-        items_from_page = paginated_list.get_page(page)
-        if not items_from_page:
-            break
-        items += items_from_page
-        page += 1
+    return gh.get_pr_diff(pr.number, max_tokens)
 
-    return items
+
+T = TypeVar("T", bound=GithubObject)
 
 
-def get_check_attrs(check: CheckRun):  # noqa: C901
+def get_all_from_paginated_list(
+    paginated_list: PaginatedList[T],
+    limit: int | None = None,
+    until: Callable[[T], bool] | None = None,
+) -> list[T]:
+    """
+    Fetch the items of a paginated list, in order. Once the first page tells us the page size
+    and the total count, the remaining pages are fetched concurrently.
+
+    Args:
+        paginated_list: list to fetch
+        limit: stop after this many items
+        until: stop at (and include) the first item this returns True for
+
+    Returns:
+        The fetched items.
+    """
+    items = paginated_list.get_page(0)
+    items, done = _truncate_items(items, 0, limit, until)
+    if done or not items:
+        return items
+
+    page_size = len(items)
+    if paginated_list.totalCount <= page_size:
+        return items
+
+    next_page = 1
+    remaining_pages = math.ceil(paginated_list.totalCount / page_size) - 1
+    with ThreadPoolExecutor(PAGE_FETCH_WORKERS) as executor:
+        while True:
+            # past the expected page count, keep going a page at a time in case the list grew
+            pages = range(next_page, next_page + max(1, min(PAGE_FETCH_WORKERS, remaining_pages)))
+            for page_items in executor.map(paginated_list.get_page, pages):
+                checked = len(items)
+                items, done = _truncate_items(items + page_items, checked, limit, until)
+                if done or len(page_items) < page_size:
+                    return items
+
+            next_page = pages.stop
+            remaining_pages -= len(pages)
+
+
+def _truncate_items(
+    items: list[T], checked: int, limit: int | None, until: Callable[[T], bool] | None
+) -> tuple[list[T], bool]:
+    """Apply `limit` and `until` to the items from index `checked` onwards."""
+    if until:
+        for i in range(checked, len(items)):
+            if until(items[i]):
+                return items[: i + 1][:limit], True
+
+    if limit is not None and len(items) >= limit:
+        return items[:limit], True
+
+    return items, False
+
+
+def get_check_attrs(check: CheckStatus):  # noqa: C901
     match (check.status, check.conclusion):
         case ("queued", _):
             return ":clock1:", "grey70"
@@ -245,9 +745,83 @@ def get_check_attrs(check: CheckRun):  # noqa: C901
             return ":question:", "red"
 
 
-def print_status_checks(checks: list[CheckRun]) -> None:  # noqa: C901
-    unique_checks = {check.name: check for check in checks}
-
-    for check_name, check in unique_checks.items():
+def print_status_checks(checks: list[CheckStatus]) -> None:
+    for check in checks:
         emoji, color = get_check_attrs(check)
-        rich.print(f"{emoji}  [{color}]{check_name}[/{color}]")
+        rich.print(f"{emoji}  [{color}]{check.name}[/{color}]")
+
+
+def watch_checks(gh: GithubClient, pr_num: int, head_sha: str) -> ChecksSummary:
+    """
+    Render the checks of a PR's head commit live until none of them are pending. Polling uses
+    conditional requests and slows down while nothing changes or the rate limit runs low.
+
+    Returns:
+        The settled checks.
+    """
+    checks_summary = gh.get_pr_checks(pr_num, head_sha)
+    interval = _next_poll_interval(checks_summary, gh.rate_limit)
+    with Live(_render_checks(pr_num, checks_summary), auto_refresh=False) as live:
+        while checks_summary.state == "pending":
+            time.sleep(interval)
+            previous_checks_summary = checks_summary
+            checks_summary = gh.get_pr_checks(pr_num, head_sha)
+            live.update(_render_checks(pr_num, checks_summary), refresh=True)
+
+            if checks_summary == previous_checks_summary:
+                interval = max(
+                    min(interval * 1.5, CHECKS_MAX_POLL_INTERVAL_S),
+                    _next_poll_interval(checks_summary, gh.rate_limit),
+                )
+            else:
+                interval = _next_poll_interval(checks_summary, gh.rate_limit)
+
+    return checks_summary
+
+
+def _next_poll_interval(checks_summary: ChecksSummary, rate_limit: HostBudget | None) -> float:
+    # nothing happens quickly until at least one check has started running
+    running = any(check.status == "in_progress" for check in checks_summary.pending)
+    interval = float(CHECKS_POLL_INTERVAL_S if running else CHECKS_POLL_INTERVAL_S * 2)
+    if not rate_limit or rate_limit.remaining is None or not rate_limit.reset_at:
+        return interval
+
+    # a poll costs up to 3 requests; spread what's left of the budget until it resets
+    seconds_until_reset = max(rate_limit.reset_at - time.time(), 0)
+    return max(interval, seconds_until_reset / max(rate_limit.remaining, 1) * 3)
+
+
+def _render_checks(pr_num: int, checks_summary: ChecksSummary) -> Panel:
+    checks_table = Table(box=None, padding=(0, 1), show_header=False)
+    for check in checks_summary.checks:
+        emoji, color = get_check_attrs(check)
+        checks_table.add_row(replace_emoji(emoji), Text(check.name, style=color))
+
+    summary = f"{len(checks_summary.passed)}/{len(checks_summary.checks)} passed"
+    if checks_summary.pending:
+        summary += f", {len(checks_summary.pending)} pending"
+
+    return Panel(
+        Group(checks_table, Text(f"\n{summary}", style="grey70")),
+        title=f"PR #{pr_num} checks",
+        title_align="left",
+        expand=False,
+        border_style="grey70",
+    )
+
+
+def _read_capped(chunks: Iterable[str], max_chars: int) -> str:
+    """Join chunks of a diff, stopping at the last full line that fits in `max_chars`."""
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        if len(text) >= max_chars:
+            last_line_end = text.rfind("\n", 0, max_chars)
+            return text[: last_line_end + 1] if last_line_end != -1 else text[:max_chars]
+
+    return text
+
+
+def _parse_datetime(value: str | None) -> dt.datetime | None:
+    # fromisoformat only understands the "Z" suffix from python 3.11
+    return dt.datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
@@ -1,42 +1,156 @@
 import os
 import re
-from typing import Literal
-
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Any, Callable, Iterator, Literal, TypeVar
+from urllib.parse import urlparse
+
+import rich
 import typer
 from InquirerPy import inquirer
 from InquirerPy.base import Choice
-from jira import JIRA, Issue, Project
+from jira import JIRA, Issue, JIRAError
 from jira.resources import Resolution
+from requests import PreparedRequest, RequestException, Response
+from requests.adapters import HTTPAdapter
 from rich.text import Text
 
 from glu.ai import ChatClient, generate_ticket
-from glu.config import EMAIL, JIRA_API_TOKEN, JIRA_SERVER, REPO_CONFIGS
-from glu.models import TICKET_PLACEHOLDER, IdReference, JiraUser, TicketGeneration
+from glu.cache import DiskCache
+from glu.config import get_config
+from glu.models import (
+    TICKET_PLACEHOLDER,
+    CreatedTicket,
+    IdReference,
+    IssuePage,
+    JiraUser,
+    TicketGeneration,
+)
+from glu.scheduler import get_scheduler
 from glu.utils import filterable_menu, print_error, print_panel
 
+# Jira caps the page size itself (at 100 on cloud, 1000 by default on server), so ask for
+# the most any instance allows and page by what actually came back
+SEARCH_PAGE_SIZE = 1000
+
+DEFAULT_SEARCH_LIMIT = 50
+
+# Jira's bulk create takes at most 50 tickets a request
+BULK_CREATE_CHUNK_SIZE = 50
+BULK_CREATE_WORKERS = 4
+
+# projects, issue types and workflows rarely change; `glu --refresh` refetches them sooner
+JIRA_METADATA_TTL_S = 24 * 60 * 60
+
+T = TypeVar("T")
+
+
+class ScheduledAdapter(HTTPAdapter):
+    """requests adapter sending every request through the request scheduler."""
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        return get_scheduler().send(
+            urlparse(str(request.url)).hostname or "",
+            "core",
+            request.method or "GET",
+            lambda: super(ScheduledAdapter, self).send(request, *args, **kwargs),
+        )
+
 
 class JiraClient:
-    def __init__(self):
-        self._client = JIRA(JIRA_SERVER, basic_auth=(EMAIL, JIRA_API_TOKEN))
+    def __init__(self) -> None:
+        env = get_config().env
+        self._jira: JIRA | None = None
+        self._connect_lock = threading.Lock()
+        # what's visible depends on the user; keys are hashed before hitting disk
+        self._cache_prefix = f"{env.jira_server}:{env.email}"
+        self._cache = DiskCache("jira")
+        # issue type and status of tickets seen by this client, to find their transitions
+        self._ticket_states: dict[str, tuple[str, str]] = {}
+
+    @property
+    def _client(self) -> JIRA:
+        # connecting costs a round trip for the server info, so it waits until it's needed
+        with self._connect_lock:
+            if self._jira is None:
+                env = get_config().env
+                self._jira = JIRA(env.jira_server, basic_auth=(env.email, env.jira_api_token))
+                self._jira._session.mount("https://", ScheduledAdapter())
+
+            return self._jira
+
+    def warm_up(self) -> None:
+        """Connect in the background, so that the first request doesn't wait on it."""
+
+        def connect() -> None:
+            try:
+                _ = self._client
+            except Exception:
+                # left unconnected, so the first request retries and reports the error
+                pass
+
+        threading.Thread(target=connect, daemon=True).start()
 
     def myself(self) -> JiraUser:
-        myself = self._client.myself()
-        return JiraUser(myself["accountId"], myself["displayName"])
+        def fetch() -> JiraUser:
+            myself = self._client.myself()
+            return JiraUser(myself["accountId"], myself["displayName"])
+
+        return self._cached("myself", fetch)
 
-    def projects(self) -> list[Project]:
-        return self._client.projects()
+    def project_keys(self) -> list[str]:
+        return self._cached(
+            "projects", lambda: [project.key for project in self._client.projects()]
+        )
 
     def search_users(self, query: str) -> list[JiraUser]:
-        return self._client.search_issues(query)
+        return self._client.search_users(query=query)
 
     def get_issuetypes(self, project: str) -> list[str]:
-        return [issuetype.name for issuetype in self._client.issue_types_for_project(project)]
+        return self._cached(
+            f"issuetypes:{project}",
+            lambda: [issuetype.name for issuetype in self._client.issue_types_for_project(project)],
+        )
 
     def get_transitions(self, ticket_id: str) -> list[str]:
-        return [transition["name"] for transition in self._client.transitions(ticket_id)]
+        return [transition["name"] for transition in self._get_transitions(ticket_id)]
 
     def transition_issue(self, ticket_id: str, transition: str) -> None:
-        self._client.transition_issue(ticket_id, transition)
+        transitions = self._get_transitions(ticket_id)
+        match = next((t for t in transitions if t["name"] == transition), None)
+        if not match:
+            # let Jira resolve the name, or say why it can't
+            self._client.transition_issue(ticket_id, transition)
+            self._ticket_states.pop(ticket_id, None)
+            return
+
+        self._apply_transition(ticket_id, match)
+
+    def move_ticket(self, ticket_id: str, transition: str) -> list[str] | None:
+        """
+        Move a ticket forward to the status a transition leads to, taking the fewest
+        transitions needed, as far as the ticket's workflow has been seen so far.
+
+        Returns:
+            The transitions taken, empty if the ticket is already at or past that status,
+            or None if it can't be reached.
+        """
+        self._get_transitions(ticket_id)
+        issuetype, status = self._ticket_states[ticket_id]
+        workflow = self._workflow(ticket_id.split("-")[0], issuetype)
+        path = plan_transitions(
+            {status: transitions for status, (_, _, transitions) in workflow.items()},
+            {status: category for status, (_, category, _) in workflow.items()},
+            status,
+            transition,
+        )
+        for step in path or []:
+            self._apply_transition(ticket_id, step)
+
+        return None if path is None else [step["name"] for step in path]
 
     def create_ticket(
         self,
@@ -59,13 +173,176 @@ class JiraClient:
 
         return self._client.create_issue(fields)
 
-    def search_issues(self, jql: str) -> list[Issue]:
-        return self._client.search_issues(jql)
+    def create_tickets(self, tickets: list[dict[str, Any]]) -> list[CreatedTicket]:
+        """
+        Create tickets through Jira's bulk endpoint, submitting chunks concurrently.
+
+        Args:
+            tickets: fields of each ticket, with project and issue type given as
+                `{"key": ...}` and `{"name": ...}` so that they aren't looked up per ticket
+
+        Returns:
+            What came of each ticket, in the order of `tickets`.
+        """
+        chunks = [
+            tickets[start : start + BULK_CREATE_CHUNK_SIZE]
+            for start in range(0, len(tickets), BULK_CREATE_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(BULK_CREATE_WORKERS) as executor:
+            results = list(executor.map(self._create_chunk, chunks))
+
+        return [created for chunk in results for created in chunk]
+
+    def _create_chunk(self, tickets: list[dict[str, Any]]) -> list[CreatedTicket]:
+        try:
+            results = self._client.create_issues(tickets, prefetch=False)
+        except (JIRAError, RequestException) as err:
+            # the other chunks carry on regardless
+            error = err.text if isinstance(err, JIRAError) else str(err)
+            return [CreatedTicket(None, error) for _ in tickets]
+
+        return [
+            CreatedTicket(result["issue"].key)
+            if result["issue"]
+            else CreatedTicket(
+                None, ", ".join(f"{field}: {msg}" for field, msg in result["error"].items())
+            )
+            for result in results
+        ]
+
+    def _get_transitions(self, ticket_id: str) -> list[dict[str, str]]:
+        """
+        Transitions depend on the issue type and status of a ticket, so they are learned per
+        status into the project's workflow for that issue type. A ticket's state is only
+        known once it has been fetched (or transitioned) by this client.
+        """
+        project = ticket_id.split("-")[0]
+        if state := self._ticket_states.get(ticket_id):
+            issuetype, status = state
+            fetched_at, _, transitions = self._workflow(project, issuetype).get(
+                status, (0, None, None)
+            )
+            if transitions is not None and time.time() - fetched_at < JIRA_METADATA_TTL_S:
+                return transitions
+
+        issue = self._client.issue(ticket_id, fields="issuetype,status", expand="transitions")
+        issuetype, status = issue.fields.issuetype.name, issue.fields.status.name
+        transitions = [
+            {
+                "id": transition["id"],
+                "name": transition["name"],
+                "to": transition["to"]["name"],
+                "category": transition["to"]["statusCategory"]["key"],
+            }
+            for transition in issue.raw["transitions"]
+        ]
+        self._ticket_states[ticket_id] = (issuetype, status)
+        workflow = self._workflow(project, issuetype)
+        workflow[status] = (time.time(), issue.fields.status.statusCategory.key, transitions)
+        self._cache.set(self._cache_key(f"workflow:v2:{project}:{issuetype}"), workflow)
+        return transitions
+
+    def _apply_transition(self, ticket_id: str, transition: dict[str, str]) -> None:
+        # by id, which saves Jira looking up the transitions again
+        self._client.transition_issue(ticket_id, transition["id"])
+        issuetype, _ = self._ticket_states[ticket_id]
+        self._ticket_states[ticket_id] = (issuetype, transition["to"])
+
+    def _workflow(
+        self, project: str, issuetype: str
+    ) -> dict[str, tuple[float, str, list[dict[str, str]]]]:
+        """
+        The transitions seen so far out of each status, with when they were fetched and the
+        status's category (new, indeterminate or done).
+        """
+        return self._cache.get(self._cache_key(f"workflow:v2:{project}:{issuetype}")) or {}
+
+    def _cached(self, key: str, fetch: Callable[[], T]) -> T:
+        if (value := self._cache.get(self._cache_key(key), max_age=JIRA_METADATA_TTL_S)) is None:
+            value = fetch()
+            self._cache.set(self._cache_key(key), value)
+
+        return value
+
+    def _cache_key(self, key: str) -> str:
+        return f"{self._cache_prefix}:{key}"
+
+    def search_issues(
+        self, jql: str, fields: list[str] | None = None, limit: int | None = DEFAULT_SEARCH_LIMIT
+    ) -> list[Issue]:
+        return [
+            issue for page in self.iter_issue_pages(jql, fields, limit) for issue in page.issues
+        ]
+
+    def iter_issue_pages(
+        self, jql: str, fields: list[str] | None = None, limit: int | None = None
+    ) -> Iterator[IssuePage]:
+        """
+        Search issues a page at a time, so they can be shown as they arrive.
+
+        Args:
+            jql: JQL query
+            fields: fields to fetch, defaults to all of them
+            limit: max number of issues, or None for all matching issues
+        """
+        if self._client._is_cloud:
+            yield from self._iter_cloud_issue_pages(jql, fields, limit)
+            return
+
+        start_at = 0
+        while limit is None or start_at < limit:
+            page_size = (
+                SEARCH_PAGE_SIZE if limit is None else min(SEARCH_PAGE_SIZE, limit - start_at)
+            )
+            results = self._client.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=page_size,
+                fields=fields or "*all",
+            )
+            yield IssuePage(list(results), results.total)  # type: ignore[union-attr]
+
+            start_at += len(results)
+            if not results or start_at >= results.total:  # type: ignore[union-attr]
+                return
+
+    def _iter_cloud_issue_pages(
+        self, jql: str, fields: list[str] | None, limit: int | None
+    ) -> Iterator[IssuePage]:
+        # Jira Cloud pages by token rather than offset, and only estimates the total
+        fetched = 0
+        total: int | None = None
+        next_page_token: str | None = None
+        while limit is None or fetched < limit:
+            page_size = (
+                SEARCH_PAGE_SIZE if limit is None else min(SEARCH_PAGE_SIZE, limit - fetched)
+            )
+            results = self._client.enhanced_search_issues(
+                jql,
+                nextPageToken=next_page_token,
+                maxResults=page_size,
+                fields=fields or "*all",
+            )
+            fetched += len(results)
+            next_page_token = results.nextPageToken  # type: ignore[union-attr]
+            if total is None:
+                # a single page is all there is, otherwise it takes another request to count
+                unordered_jql = re.sub(r"(?i)\s+order\s+by\s.*$", "", jql)
+                total = (
+                    self._client.approximate_issue_count(unordered_jql)
+                    if next_page_token
+                    else fetched
+                )
+            yield IssuePage(list(results), max(total, fetched))
+
+            if not results or not next_page_token:
+                return
 
     def get_issue(self, project: str, ticket_num: int) -> Issue:
         return self._client.issue(f"{project}-{ticket_num}")
 
 
+@cache  # keeps the client warm across commands in `glu daemon`
 def get_jira_client() -> JiraClient:
     if os.getenv("GLU_TEST"):
         from tests.clients.jira import FakeJiraClient
@@ -98,17 +375,111 @@ def get_user_from_jira(
 
 
 def get_jira_project(jira: JiraClient, repo_name: str | None, project: str | None = None) -> str:
-    if REPO_CONFIGS.get(repo_name or "") and REPO_CONFIGS[repo_name or ""].jira_project_key:
-        return REPO_CONFIGS[repo_name or ""].jira_project_key  # type: ignore
+    repo_configs = get_config().repos
+    if repo_configs.get(repo_name or "") and repo_configs[repo_name or ""].jira_project_key:
+        return repo_configs[repo_name or ""].jira_project_key  # type: ignore
 
-    projects = jira.projects()
-    project_keys = [project.key for project in projects]
-    if project and project.upper() in [project.key for project in projects]:
+    project_keys = jira.project_keys()
+    if project and project.upper() in project_keys:
         return project.upper()
 
     return filterable_menu("Select project: ", project_keys)
 
 
+def move_ticket_for_pr(jira: JiraClient, ticket_id: str, ready_for_review: bool) -> None:
+    """Move the ticket of a PR that was just opened or updated along its workflow."""
+    env = get_config().env
+    if not ready_for_review:
+        jira.move_ticket(ticket_id, env.jira_in_progress_transition)
+        return
+
+    moved = jira.move_ticket(ticket_id, env.jira_ready_for_review_transition)
+    if moved is None:
+        # the workflow past "in progress" may not have been seen yet, so go there and look
+        jira.move_ticket(ticket_id, env.jira_in_progress_transition)
+        moved = jira.move_ticket(ticket_id, env.jira_ready_for_review_transition)
+
+    if moved:
+        rich.print(f":eyes: Moved ticket [blue]{ticket_id}[/] to [green]Ready for review[/]")
+
+
+def plan_transitions(
+    workflow: dict[str, list[dict[str, str]]],
+    categories: dict[str, str],
+    status: str,
+    transition: str,
+) -> list[dict[str, str]] | None:
+    """
+    Find the shortest sequence of transitions that moves a ticket forward from a status to
+    the one the given transition leads to. Done statuses are never passed through, and
+    transitions back towards the start of the workflow are never taken.
+
+    Args:
+        workflow: transitions out of each known status, with the category of where they lead
+        categories: category (new, indeterminate or done) of the statuses fetched so far
+        status: status to start from
+        transition: name of the transition leading to the target status
+
+    Returns:
+        The transitions to take, empty if already at or past the target status, or None if
+        it can't be reached through the known statuses.
+    """
+    categories = {t["to"]: t["category"] for ts in workflow.values() for t in ts} | categories
+    targets = {t["to"] for ts in workflow.values() for t in ts if t["name"] == transition}
+    if not targets:
+        return None
+
+    if status in targets or categories.get(status) == "done":
+        return []
+
+    ranks = _status_ranks(workflow, categories)
+    target_ranks = [ranks[target] for target in targets if target in ranks]
+    if status in ranks and target_ranks and ranks[status] >= min(target_ranks):
+        return []
+
+    paths: deque[tuple[str, list[dict[str, str]]]] = deque([(status, [])])
+    seen = {status}
+    while paths:
+        current, path = paths.popleft()
+        for step in workflow.get(current, []):
+            if step["to"] in targets:
+                return [*path, step]
+            # from a status of unknown rank, only the transition itself is taken
+            is_forward = current in ranks and ranks.get(step["to"], -1) > ranks[current]
+            if is_forward and categories[step["to"]] != "done" and step["to"] not in seen:
+                seen.add(step["to"])
+                paths.append((step["to"], [*path, step]))
+
+    return None
+
+
+def _status_ranks(
+    workflow: dict[str, list[dict[str, str]]], categories: dict[str, str]
+) -> dict[str, int]:
+    """
+    How far along the workflow each status is: the fewest transitions it takes to reach it
+    from a new status (or one no known transition leads to), without going through a done one.
+    """
+    entered = {t["to"] for ts in workflow.values() for t in ts}
+    starts = [
+        status
+        for status in {*workflow, *categories}
+        if categories.get(status) == "new" or status not in entered
+    ]
+    ranks = dict.fromkeys(starts, 0)
+    statuses = deque(starts)
+    while statuses:
+        current = statuses.popleft()
+        if categories.get(current) == "done":
+            continue
+        for step in workflow.get(current, []):
+            if step["to"] not in ranks:
+                ranks[step["to"]] = ranks[current] + 1
+                statuses.append(step["to"])
+
+    return ranks
+
+
 def format_jira_ticket(jira_key: str, ticket: str | int, with_brackets: bool = False) -> str:
     try:
         ticket_num = int(ticket)
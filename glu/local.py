@@ -1,17 +1,19 @@
 import os
 from pathlib import Path
-from typing import Literal, overload
+from typing import TYPE_CHECKING, Literal, overload
 
 import rich
 import typer
 from git import Commit, GitCommandError, HookExecutionError, Repo
 from InquirerPy import inquirer
 
-from glu.ai import ChatClient, generate_branch_name
-from glu.config import PREFERENCES
+from glu.config import get_config
 from glu.models import CommitGeneration
 from glu.utils import print_error, print_panel
 
+if TYPE_CHECKING:
+    from glu.ai import ChatClient
+
 
 class GitClient:
     def __init__(self):
@@ -92,6 +94,16 @@ class GitClient:
                 print_error("Diff method not implemented")
                 raise typer.Exit(1)
 
+    def get_merge_base_diff(self, base_sha: str, head_sha: str) -> str | None:
+        """
+        Diff head_sha against its merge base with base_sha, like GitHub shows for a PR.
+        Returns None if either commit isn't available locally.
+        """
+        try:
+            return self._repo.git.diff(f"{base_sha}...{head_sha}")
+        except GitCommandError:
+            return None
+
     def create_commit(self, message: str, dry_run: bool = False, retry: int = 0) -> Commit:
         try:
             self._repo.git.add(all=True)
@@ -169,6 +181,16 @@ class GitClient:
     def current_branch(self) -> str:
         return self._repo.active_branch.name
 
+    @property
+    def remote_default_branch(self) -> str | None:
+        """The remote's default branch as of the last clone or `git remote set-head`, if known."""
+        try:
+            ref = self._repo.git.symbolic_ref("refs/remotes/origin/HEAD", short=True)
+        except GitCommandError:
+            return None
+
+        return ref.removeprefix("origin/")
+
     @property
     def is_dirty(self) -> bool:
         return self._repo.is_dirty()
@@ -183,8 +205,18 @@ def get_git_client() -> GitClient:
     return GitClient()
 
 
+def get_default_branch(git: GitClient) -> str:
+    """The repo's default branch, only asking GitHub when git doesn't know it."""
+    if default_branch := git.remote_default_branch:
+        return default_branch
+
+    from glu.gh import get_github_client
+
+    return get_github_client(git.repo_name).default_branch
+
+
 def prompt_commit_edit(commit_data: CommitGeneration) -> CommitGeneration:
-    if PREFERENCES.auto_accept_generated_commits:
+    if get_config().preferences.auto_accept_generated_commits:
         return commit_data
 
     print_panel(title="Proposed commit message", content=commit_data.message)
@@ -217,7 +249,7 @@ def prompt_commit_edit(commit_data: CommitGeneration) -> CommitGeneration:
 
 def checkout_to_branch(
     git: GitClient,
-    chat_client: ChatClient,
+    chat_client: "ChatClient",
     main_branch: str,
     commit_message: str | None,
 ) -> None:
@@ -228,6 +260,8 @@ def checkout_to_branch(
         provided_branch_name: str = typer.prompt("Enter branch name")
         branch_name = "-".join(provided_branch_name.split())
     else:
+        from glu.ai import generate_branch_name
+
         rich.print("[grey70]Checking out new branch...[/]")
         branch_name = generate_branch_name(chat_client, commit_message)
 
@@ -0,0 +1,289 @@
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import time
+from typing import Any
+
+import rich
+from jira import Issue, JIRAError
+from requests import RequestException
+
+from glu.config import cache_dir, get_config
+from glu.jira import JiraClient
+from glu.models import IssuePage, TicketQuery
+
+# what `ticket list` and `ticket view` show, plus what syncing needs
+MIRROR_FIELDS = [
+    "summary",
+    "description",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "resolution",
+    "created",
+    "updated",
+]
+
+# older than this, a mirror catches up on what changed before serving from it
+MIRROR_MAX_AGE_S = 5 * 60
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE issues (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    description TEXT,
+    issuetype TEXT,
+    status TEXT,
+    resolved INTEGER NOT NULL,
+    priority TEXT,
+    priority_id INTEGER,
+    assignee_id TEXT,
+    assignee_name TEXT,
+    reporter_id TEXT,
+    reporter_name TEXT,
+    created TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX issues_by_project ON issues (project, created);
+CREATE VIRTUAL TABLE issues_fts USING fts5(
+    summary, description, content='issues', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER issues_inserted AFTER INSERT ON issues BEGIN
+    INSERT INTO issues_fts (rowid, summary, description)
+    VALUES (new.id, new.summary, new.description);
+END;
+CREATE TRIGGER issues_deleted AFTER DELETE ON issues BEGIN
+    INSERT INTO issues_fts (issues_fts, rowid, summary, description)
+    VALUES ('delete', old.id, old.summary, old.description);
+END;
+CREATE TRIGGER issues_updated AFTER UPDATE ON issues BEGIN
+    INSERT INTO issues_fts (issues_fts, rowid, summary, description)
+    VALUES ('delete', old.id, old.summary, old.description);
+    INSERT INTO issues_fts (rowid, summary, description)
+    VALUES (new.id, new.summary, new.description);
+END;
+CREATE TABLE syncs (project TEXT PRIMARY KEY, synced_at REAL NOT NULL);
+"""
+
+UPSERT_ISSUE = """
+INSERT INTO issues (
+    key, project, summary, description, issuetype, status, resolved, priority, priority_id,
+    assignee_id, assignee_name, reporter_id, reporter_name, created, raw
+)
+VALUES (
+    :key, :project, :summary, :description, :issuetype, :status, :resolved, :priority,
+    :priority_id, :assignee_id, :assignee_name, :reporter_id, :reporter_name, :created, :raw
+)
+ON CONFLICT (key) DO UPDATE SET
+    project = excluded.project,
+    summary = excluded.summary,
+    description = excluded.description,
+    issuetype = excluded.issuetype,
+    status = excluded.status,
+    resolved = excluded.resolved,
+    priority = excluded.priority,
+    priority_id = excluded.priority_id,
+    assignee_id = excluded.assignee_id,
+    assignee_name = excluded.assignee_name,
+    reporter_id = excluded.reporter_id,
+    reporter_name = excluded.reporter_name,
+    created = excluded.created,
+    raw = excluded.raw
+"""
+
+
+class JiraMirror:
+    """
+    Local copy of Jira projects in SQLite, with full text search over summaries and
+    descriptions. Syncs only fetch tickets updated since the last one, so tickets deleted or
+    moved out of a project linger until a full sync.
+    """
+
+    def __init__(self, server: str, email: str):
+        # what's visible depends on the user, so each gets their own mirror
+        account = hashlib.sha256(f"{server}:{email}".encode()).hexdigest()[:16]
+        path = cache_dir() / f"jira-mirror-{account}.sqlite3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode = WAL")  # readers don't wait on a sync
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._reset()
+
+    def synced_at(self, project: str) -> float | None:
+        row = self._db.execute(
+            "SELECT synced_at FROM syncs WHERE project = ?", (project,)
+        ).fetchone()
+        return row["synced_at"] if row else None
+
+    def sync(self, jira: JiraClient, project: str, full: bool = False) -> int:
+        """
+        Fetch the tickets of a project updated since its last sync, or all of them if it has
+        never been synced (or `full`).
+
+        Returns:
+            The number of tickets fetched.
+        """
+        started_at = time.time()
+        synced_at = None if full else self.synced_at(project)
+
+        jql = f"project = {project}"
+        if synced_at is not None:
+            # relative dates sidestep the server's time zone, an extra minute its rounding
+            minutes = math.ceil((started_at - synced_at) / 60) + 1
+            jql += f" AND updated >= -{minutes}m"
+
+        # everything is fetched before anything is written, so a failed sync leaves the mirror
+        # as it was, without holding the write lock while waiting on Jira
+        rows = [
+            _issue_row(project, issue.raw)
+            for page in jira.iter_issue_pages(f"{jql} ORDER BY updated ASC", MIRROR_FIELDS)
+            for issue in page.issues
+        ]
+
+        with self._db:
+            if full:
+                self._db.execute("DELETE FROM issues WHERE project = ?", (project,))
+            self._db.executemany(UPSERT_ISSUE, rows)
+            # tickets updated mid-sync may have shifted pages, the next sync picks them up
+            self._db.execute(
+                "INSERT OR REPLACE INTO syncs (project, synced_at) VALUES (?, ?)",
+                (project, started_at),
+            )
+
+        return len(rows)
+
+    def search(
+        self, query: TicketQuery, account_id: str | None = None, limit: int | None = None
+    ) -> IssuePage:
+        """
+        Tickets matching a query, like Jira would find them with `query.to_jql()`.
+
+        Args:
+            query: ticket filters
+            account_id: Jira account ID of the current user, for `query.only_mine`
+            limit: max number of tickets, or None for all matching tickets
+        """
+        conditions = ["project = ?"]
+        params: list[Any] = [query.project]
+        if query.only_mine:
+            conditions.append("assignee_id = ?")
+            params.append(account_id)
+        elif query.assignee:
+            conditions.append("(assignee_id = ? OR lower(assignee_name) = lower(?))")
+            params += [query.assignee, query.assignee]
+
+        if query.reporter:
+            conditions.append("(reporter_id = ? OR lower(reporter_name) = lower(?))")
+            params += [query.reporter, query.reporter]
+
+        if query.statuses:
+            conditions.append(_in_condition("status", query.statuses))
+            params += [status.lower() for status in query.statuses]
+        else:
+            if query.open:
+                conditions.append("NOT resolved")
+            if query.in_progress_only:
+                conditions.append("lower(status) != 'to do'")
+
+        if query.types:
+            conditions.append(_in_condition("issuetype", query.types))
+            params += [issuetype.lower() for issuetype in query.types]
+
+        if query.priorities:
+            conditions.append(_in_condition("priority", query.priorities))
+            params += [priority.lower() for priority in query.priorities]
+
+        if query.search and (terms := re.findall(r"\w+", query.search)):
+            conditions.append("id IN (SELECT rowid FROM issues_fts WHERE issues_fts MATCH ?)")
+            params.append(" ".join(f'"{term}"*' for term in terms))
+
+        where = " AND ".join(conditions)
+        total = self._db.execute(f"SELECT count(*) FROM issues WHERE {where}", params).fetchone()
+
+        # Jira ranks its default priorities by ID, from Highest (1) to Lowest (5)
+        order = "priority_id ASC, created DESC" if query.order_by_priority else "created DESC"
+        rows = self._db.execute(
+            f"SELECT raw FROM issues WHERE {where} ORDER BY {order} LIMIT ?",
+            [*params, -1 if limit is None else limit],
+        )
+        return IssuePage([_issue(row["raw"]) for row in rows], total[0])
+
+    def get_issue(self, key: str) -> Issue | None:
+        row = self._db.execute("SELECT raw FROM issues WHERE key = ?", (key,)).fetchone()
+        return _issue(row["raw"]) if row else None
+
+    def _reset(self) -> None:
+        with self._db:
+            for table in ("issues_fts", "issues", "syncs"):
+                self._db.execute(f"DROP TABLE IF EXISTS {table}")
+        self._db.executescript(SCHEMA)
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def get_jira_mirror(jira: JiraClient, project: str) -> JiraMirror | None:
+    """
+    The mirror of a project, caught up with Jira if it's stale.
+
+    Returns:
+        None if the project isn't mirrored or has never been synced, to query Jira instead.
+    """
+    config = get_config()
+    if project not in config.preferences.mirror_jira_projects:
+        return None
+
+    mirror = JiraMirror(config.env.jira_server, config.env.email)
+    synced_at = mirror.synced_at(project)
+    if synced_at is None:
+        return None
+
+    if time.time() - synced_at > MIRROR_MAX_AGE_S:
+        try:
+            mirror.sync(jira, project)
+        except (JIRAError, RequestException):
+            minutes = round((time.time() - synced_at) / 60)
+            rich.print(f"[grey70]Couldn't reach Jira, showing {project} as of {minutes}m ago[/]")
+
+    return mirror
+
+
+def _issue_row(project: str, raw: dict) -> dict[str, Any]:
+    fields = raw["fields"]
+    priority = fields.get("priority") or {}
+    assignee = fields.get("assignee") or {}
+    reporter = fields.get("reporter") or {}
+    return {
+        "key": raw["key"],
+        "project": project,
+        "summary": fields["summary"],
+        "description": fields.get("description"),
+        "issuetype": (fields.get("issuetype") or {}).get("name"),
+        "status": (fields.get("status") or {}).get("name"),
+        "resolved": fields.get("resolution") is not None,
+        "priority": priority.get("name"),
+        "priority_id": int(priority["id"]) if str(priority.get("id", "")).isdigit() else None,
+        "assignee_id": assignee.get("accountId"),
+        "assignee_name": assignee.get("displayName"),
+        "reporter_id": reporter.get("accountId"),
+        "reporter_name": reporter.get("displayName"),
+        "created": fields.get("created"),
+        "raw": json.dumps({"key": raw["key"], "fields": fields}),
+    }
+
+
+def _issue(raw: str) -> Issue:
+    # never refreshed from Jira, so it needs no session
+    return Issue({}, None, raw=json.loads(raw))  # type: ignore[arg-type]
+
+
+def _in_condition(column: str, values: list[str]) -> str:
+    return f"lower({column}) IN ({', '.join('?' * len(values))})"
@@ -1,12 +1,16 @@
+import datetime as dt
 import re
 from dataclasses import dataclass
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from github.NamedUser import NamedUser
 from pydantic import BaseModel, model_validator
 
 from glu.utils import capitalize_first_word, load_json
 
+if TYPE_CHECKING:
+    from github.NamedUser import NamedUser
+    from jira import Issue
+
 ChatProvider = Literal["OpenAI", "Glean", "Gemini", "Anthropic", "xAI", "Ollama"]
 
 CHAT_PROVIDERS: list[ChatProvider] = ["OpenAI", "Glean", "Gemini", "Anthropic", "xAI", "Ollama"]
@@ -16,10 +20,112 @@ TICKET_PLACEHOLDER = "[XY-1234]"
 
 @dataclass
 class MatchedUser:
-    user: NamedUser
+    user: "NamedUser"
     score: float
 
 
+class PRLabel(BaseModel):
+    name: str
+    color: str
+
+
+class PRUser(BaseModel):
+    login: str
+
+
+class PRHead(BaseModel):
+    ref: str
+
+
+class PRSummary(BaseModel):
+    """The fields of a PR shown by `glu pr list`."""
+
+    number: int
+    title: str
+    draft: bool
+    assignee: PRUser | None
+    labels: list[PRLabel]
+    head: PRHead
+
+
+class PRStatus(BaseModel):
+    """One of my open PRs, as shown by `glu status`."""
+
+    repo: str
+    number: int
+    title: str
+    draft: bool
+    body: str | None
+    approval_status: Literal["approved", "changes_requested"] | None
+    checks_state: Literal["success", "failure", "pending", "none"]
+
+
+@dataclass
+class CheckStatus:
+    """A check run, check suite or commit status, in check run terms."""
+
+    name: str
+    status: str
+    conclusion: str | None
+    started_at: dt.datetime | None = None
+    url: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "completed" and self.conclusion in ["success", "neutral"]
+
+
+@dataclass
+class ChecksSummary:
+    """The latest attempt of each check on a commit, leaving out skipped and waiting ones."""
+
+    checks: list[CheckStatus]
+
+    @classmethod
+    def from_checks(cls, checks: list[CheckStatus]) -> "ChecksSummary":
+        latest_checks: dict[str, CheckStatus] = {}
+        for check in checks:
+            latest_check = latest_checks.get(check.name)
+            if not latest_check or _started_before(latest_check, check):
+                latest_checks[check.name] = check
+
+        return cls(
+            [
+                check
+                for check in latest_checks.values()
+                if check.conclusion != "skipped" and check.status != "waiting"
+            ]
+        )
+
+    @property
+    def passed(self) -> list[CheckStatus]:
+        return [check for check in self.checks if check.passed]
+
+    @property
+    def pending(self) -> list[CheckStatus]:
+        return [check for check in self.checks if check.status != "completed"]
+
+    @property
+    def failing(self) -> list[CheckStatus]:
+        return [check for check in self.checks if check.status == "completed" and not check.passed]
+
+    @property
+    def state(self) -> Literal["success", "failure", "pending", "none"]:
+        if not self.checks:
+            return "none"
+        if self.failing:
+            return "failure"
+        if self.pending:
+            return "pending"
+        return "success"
+
+
+def _started_before(check: CheckStatus, other: CheckStatus) -> bool:
+    if not check.started_at or not other.started_at:
+        return not check.started_at
+    return check.started_at < other.started_at
+
+
 class TicketGeneration(BaseModel):
     description: str
     summary: str
@@ -50,6 +156,63 @@ class JiraUser:
     displayName: str
 
 
+@dataclass
+class IssuePage:
+    issues: list["Issue"]
+    total: int  # matching issues across all pages
+
+
+@dataclass
+class CreatedTicket:
+    key: str | None
+    error: str | None = None  # why Jira didn't create it
+
+
+@dataclass
+class TicketQuery:
+    project: str
+    search: str | None = None
+    only_mine: bool = False
+    assignee: str | None = None
+    reporter: str | None = None
+    statuses: list[str] | None = None
+    open: bool = True
+    in_progress_only: bool = False
+    types: list[str] | None = None
+    priorities: list[str] | None = None
+    order_by_priority: bool = False
+
+    def to_jql(self) -> str:
+        issue_filters = [f"project={self.project}"]
+        if self.only_mine:
+            issue_filters.append("assignee = currentUser()")
+        elif self.assignee:
+            issue_filters.append(f'assignee="{self.assignee}"')
+
+        if self.reporter:
+            issue_filters.append(f'reporter="{self.reporter}"')
+
+        if self.statuses:
+            issue_filters.append(f"status IN ({','.join(self.statuses)})")
+        else:
+            if self.open:
+                issue_filters.append("resolution = unresolved")
+            if self.in_progress_only:
+                issue_filters.append('status != "to do"')
+
+        if self.types:
+            issue_filters.append(f"issuetype IN ({','.join(self.types)})")
+
+        if self.priorities:
+            issue_filters.append(f"priority IN ({','.join(self.priorities)})")
+
+        if self.search:
+            issue_filters.append(f'text ~ "{self.search}"')
+
+        order = "priority" if self.order_by_priority else "created"
+        return f"{' and '.join(issue_filters)} order by {order} desc"
+
+
 class CommitGeneration(BaseModel):
     title: str
     body: str
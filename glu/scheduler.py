@@ -0,0 +1,240 @@
+"""
+Throttling, queueing and retrying of API requests based on the rate limits servers report.
+
+Budgets are learned from response headers and kept in the glu cache dir, so a burst of
+separate glu processes (e.g. from a script) shares them rather than each tripping the limit.
+"""
+
+import datetime as dt
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import Protocol, TypeVar
+
+import rich
+from rich.console import Console
+
+from glu.cache import DiskCache
+
+MAX_CONCURRENT_REQUESTS_PER_HOST = 8
+MAX_RETRIES = 4
+BACKOFF_BASE_S = 1
+MAX_BACKOFF_S = 60
+# waiting longer than this for a budget to reset is worse than failing
+MAX_WAIT_S = 5 * 60
+# once fewer requests than this are left, they are spread out until the budget resets
+LOW_BUDGET = 50
+MAX_SPREAD_DELAY_S = 10
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# a server error may come after the request was applied, so only these are safe to resend
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class _Response(Protocol):
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def close(self) -> None: ...
+
+
+R = TypeVar("R", bound=_Response)
+
+
+@dataclass
+class HostBudget:
+    remaining: int | None = None
+    limit: int | None = None
+    reset_at: float | None = None
+    blocked_until: float = 0  # set from Retry-After
+
+    def wait_time(self, now: float) -> float:
+        wait = max(self.blocked_until - now, 0)
+        if self.remaining is None or not self.reset_at or self.reset_at <= now:
+            return wait
+
+        if self.remaining <= 0:
+            return max(wait, self.reset_at - now)
+
+        if self.remaining < LOW_BUDGET:
+            return max(wait, min((self.reset_at - now) / self.remaining, MAX_SPREAD_DELAY_S))
+
+        return wait
+
+
+class RequestScheduler:
+    def __init__(self) -> None:
+        self._budgets: dict[str, HostBudget] = {}
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._store = DiskCache("ratelimit")
+
+    def budget(self, host: str, resource: str = "core") -> HostBudget:
+        key = f"{host}:{resource}"
+        with self._lock:
+            if key not in self._budgets:
+                self._budgets[key] = self._store.get(key) or HostBudget()
+            return self._budgets[key]
+
+    def budgets(self) -> dict[str, HostBudget]:
+        with self._lock:
+            return dict(self._budgets)
+
+    def send(self, host: str, resource: str, method: str, send_request: Callable[[], R]) -> R:
+        """
+        Send a request once the host's budget allows it, retrying rate limited requests (and
+        failed idempotent ones) with jittered exponential backoff.
+
+        Returns:
+            The last response, which may still be an error once retries are exhausted.
+        """
+        budget = self.budget(host, resource)
+        with self._semaphore(host):
+            for attempt in range(MAX_RETRIES + 1):
+                self._wait(host, budget)
+                response = send_request()
+                self._record(host, resource, budget, response)
+
+                delay = _retry_delay(budget, response, method, attempt)
+                if delay is None or attempt == MAX_RETRIES or delay > MAX_WAIT_S:
+                    return response
+
+                response.close()
+                time.sleep(delay)
+
+        return response
+
+    def record_budget(self, host: str, resource: str, budget: HostBudget) -> None:
+        with self._lock:
+            self._budgets[f"{host}:{resource}"] = budget
+        self._store.set(f"{host}:{resource}", budget)
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(
+                    MAX_CONCURRENT_REQUESTS_PER_HOST
+                )
+            return self._semaphores[host]
+
+    def _wait(self, host: str, budget: HostBudget) -> None:
+        with self._lock:
+            wait = budget.wait_time(time.time())
+            if budget.remaining:
+                budget.remaining -= 1  # account for requests in flight until headers say otherwise
+
+        if wait <= 0 or wait > MAX_WAIT_S:
+            return  # past MAX_WAIT_S, let the server reject the request instead
+
+        if wait > 1:
+            Console(stderr=True).print(f"[grey70]Rate limited by {host}, waiting {wait:.0f}s...[/]")
+        time.sleep(wait)
+
+    def _record(self, host: str, resource: str, budget: HostBudget, response: _Response) -> None:
+        headers = response.headers
+        if "X-RateLimit-Resource" in headers and headers["X-RateLimit-Resource"] != resource:
+            return  # budget of another resource than we guessed; don't mix them up
+
+        with self._lock:
+            window = (budget.limit, budget.reset_at, budget.blocked_until)
+            if (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+                budget.remaining = int(remaining)
+            if (limit := headers.get("X-RateLimit-Limit")) is not None:
+                budget.limit = int(limit)
+            if (reset := headers.get("X-RateLimit-Reset")) is not None:
+                budget.reset_at = _parse_timestamp(reset)
+            if (retry_after := headers.get("Retry-After")) is not None:
+                budget.blocked_until = time.time() + _parse_retry_after(retry_after)
+
+            # other processes only need a new window, or the count once it's low enough to
+            # hold them back, rather than a write for every response
+            changed = (budget.limit, budget.reset_at, budget.blocked_until) != window or (
+                budget.remaining is not None and budget.remaining < LOW_BUDGET
+            )
+
+        if changed:
+            self._store.set(f"{host}:{resource}", budget)
+
+
+@cache
+def get_scheduler() -> RequestScheduler:
+    return RequestScheduler()
+
+
+def resource_for_path(path: str) -> str:
+    """GitHub keeps separate budgets for GraphQL and search; everything else is "core"."""
+    if path.endswith("/graphql"):
+        return "graphql"
+    if path.startswith("/search"):
+        return "search"
+    return "core"
+
+
+def print_budgets(budgets: dict[str, HostBudget]) -> None:
+    if not budgets:
+        rich.print("No rate limits observed yet")
+        return
+
+    now = time.time()
+    for key, budget in sorted(budgets.items()):
+        line = f"[deep_sky_blue1]{key}[/] "
+        if budget.remaining is None:
+            line += "[grey70]no rate limit reported[/]"
+        else:
+            line += f"{budget.remaining}{f'/{budget.limit}' if budget.limit else ''} requests left"
+        if budget.reset_at and budget.reset_at > now:
+            line += f", resets in {_format_duration(budget.reset_at - now)}"
+        if budget.blocked_until > now:
+            line += f" [red](blocked for {_format_duration(budget.blocked_until - now)})[/]"
+        rich.print(line)
+
+
+def _retry_delay(
+    budget: HostBudget, response: _Response, method: str, attempt: int
+) -> float | None:
+    status_code = response.status_code
+    rate_limited = status_code == 429 or (
+        status_code == 403
+        and (
+            "Retry-After" in response.headers
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+    )
+    failed = status_code in RETRYABLE_STATUS_CODES and method.upper() in IDEMPOTENT_METHODS
+    if not rate_limited and not failed:
+        return None
+
+    now = time.time()
+    if budget.blocked_until > now:
+        return budget.blocked_until - now
+    if budget.remaining == 0 and budget.reset_at and budget.reset_at > now:
+        return budget.reset_at - now
+
+    # full jitter, so retrying clients don't come back in lockstep
+    return random.uniform(0, min(MAX_BACKOFF_S, BACKOFF_BASE_S * 2**attempt))
+
+
+def _parse_timestamp(value: str) -> float:
+    # GitHub sends epoch seconds, Jira an ISO 8601 timestamp
+    try:
+        return float(value)
+    except ValueError:
+        return dt.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _parse_retry_after(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return BACKOFF_BASE_S  # HTTP dates are rare enough not to bother parsing
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    return f"{seconds // 60:.0f}m{seconds % 60:02.0f}s"
@@ -0,0 +1,138 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+from tests import TESTS_DATA_DIR
+
+BASELINES_PATH = TESTS_DATA_DIR / "startup_baselines.json"
+
+# entry points are run against the fake clients (GLU_TEST), so they must not prompt
+ENTRY_POINTS: dict[str, list[str]] = {
+    "version": ["--version"],
+    "help": ["--help"],
+    "pr-list": ["pr", "list"],
+    "pr-view": ["pr", "view", "345"],
+    "ticket-list": ["ticket", "list"],
+    "ticket-view": ["ticket", "view", "354"],
+    "commit-list": ["commit", "list"],
+    "commit-count": ["commit", "count"],
+}
+
+# packages whose import cost dominates startup; any new one showing up is a regression
+HEAVY_PACKAGES = {
+    "git",
+    "github",
+    "httpx",
+    "InquirerPy",
+    "jira",
+    "langchain_core",
+    "openai",
+    "requests",
+    "thefuzz",
+    "tiktoken",
+    "toml",
+}
+
+# what the installed `glu` console script runs (`glu.cli.entry:main`)
+CONSOLE_SCRIPT_CMD = ["-c", "import sys; from glu.cli.entry import main; sys.exit(main())"]
+
+# a fixed workload used to normalize wall times across machines
+CALIBRATION_CMD = ["-c", "import typer, rich.console, pydantic"]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ModuleImport:
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class StartupProfile:
+    wall_s: float
+    imports: list[ModuleImport] = field(default_factory=list)
+
+    @property
+    def imported_packages(self) -> set[str]:
+        return {module.name.split(".")[0] for module in self.imports}
+
+    @property
+    def heavy_packages(self) -> set[str]:
+        return self.imported_packages & HEAVY_PACKAGES
+
+    def slowest(self, n: int = 10) -> list[ModuleImport]:
+        return sorted(self.imports, key=lambda module: module.self_us, reverse=True)[:n]
+
+
+def measure(args: list[str], env: dict[str, str], repeat: int = 3) -> StartupProfile:
+    """
+    Run `python -X importtime <args>` `repeat` times and return the fastest run, which is
+    the least affected by noise from the rest of the machine.
+    """
+    profiles = [_run_once(args, env) for _ in range(repeat)]
+    return min(profiles, key=lambda profile: profile.wall_s)
+
+
+def measure_entry_point(name: str, env: dict[str, str], repeat: int = 3) -> StartupProfile:
+    return measure([*CONSOLE_SCRIPT_CMD, *ENTRY_POINTS[name]], env, repeat)
+
+
+def measure_calibration(env: dict[str, str], repeat: int = 3) -> StartupProfile:
+    return measure(CALIBRATION_CMD, env, repeat)
+
+
+def load_baselines() -> dict:
+    if not BASELINES_PATH.exists():
+        return {}
+
+    with open(BASELINES_PATH, "r") as f:
+        return json.load(f)
+
+
+def write_baselines(baselines: dict) -> None:
+    BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def format_report(name: str, profile: StartupProfile, calibration: StartupProfile) -> str:
+    lines = [
+        f"{name}: {profile.wall_s * 1000:.0f}ms "
+        f"({profile.wall_s / calibration.wall_s:.2f}x calibration)"
+    ]
+    for module in profile.slowest():
+        lines.append(f"  {module.self_us / 1000:8.1f}ms  {module.name}")
+    return "\n".join(lines)
+
+
+def _run_once(args: list[str], env: dict[str, str]) -> StartupProfile:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    wall_s = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"`{' '.join(args)}` failed:\n{_strip_import_times(result.stderr)}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if match := IMPORT_TIME_LINE.match(line):
+            imports.append(ModuleImport(match[4], int(match[1]), int(match[2])))
+
+    return StartupProfile(wall_s, imports)
+
+
+def _strip_import_times(stderr: str) -> str:
+    return os.linesep.join(
+        line for line in stderr.splitlines() if not line.startswith("import time:")
+    )
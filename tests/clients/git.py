@@ -38,6 +38,10 @@ class FakeGitClient:
         with open(TESTS_DATA_DIR / "diff_to_main.txt", "r") as f:
             return f.read()
 
+    def get_merge_base_diff(self, base_sha: str, head_sha: str) -> str | None:
+        with open(TESTS_DATA_DIR / "diff_to_main.txt", "r") as f:
+            return f.read()
+
     def create_commit(self, message: str, dry_run: bool = False, retry: int = 0) -> Commit:
         if os.getenv("RAISE_HOOK_EXECUTION_ERROR"):
             raise HookExecutionError(
@@ -100,6 +104,10 @@ class FakeGitClient:
     def current_branch(self) -> str:
         return "add-tests"
 
+    @property
+    def remote_default_branch(self) -> str | None:
+        return "main"
+
     @property
     def is_dirty(self) -> bool:
         return os.getenv("IS_GIT_DIRTY") == "1"
@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Callable
 
 from git import Commit
-from github.CheckRun import CheckRun
 from github.NamedUser import NamedUser
 from github.PaginatedList import PaginatedList
 from github.PullRequest import PullRequest
@@ -14,6 +13,8 @@ from github.PullRequestReview import PullRequestReview
 from pydantic import BaseModel, TypeAdapter
 
 from glu import ROOT_DIR
+from glu.gh import GraphQLError
+from glu.models import ChecksSummary, CheckStatus, PRStatus, PRSummary
 from tests import TESTS_DATA_DIR
 from tests.utils import load_json
 
@@ -24,8 +25,10 @@ class FakeUser:
 
 
 class FakeGithubClient:
-    def __init__(self, repo_name: str):
-        pass
+    rate_limit = None
+
+    def __init__(self, repo_name: str | None = None):
+        self.repo_name = repo_name
 
     def get_members(self, repo_name: str) -> list[NamedUser]:
         return [FakeUser("teddy"), FakeUser("jack"), FakeUser("peter")]  # type: ignore
@@ -36,6 +39,7 @@ class FakeGithubClient:
         title: str,
         body: str | None,
         draft: bool,
+        reviewers: list[NamedUser] | None = None,
     ) -> PullRequest:
         @dataclass
         class FakePullRequest:
@@ -150,8 +154,18 @@ class FakeGithubClient:
                 @dataclass
                 class Head:
                     ref: str
+                    sha: str
+
+                return Head("fix-ticket-not-in-pr-description", "1c4ce7d")
+
+            @property
+            def base(self):
+                @dataclass
+                class Base:
+                    ref: str
+                    sha: str
 
-                return Head("fix-ticket-not-in-pr-description")
+                return Base("main", "9a0f3b2")
 
         pr_data = load_json("pr_data.json")
         if os.getenv("PR_NOT_MERGEABLE"):
@@ -169,39 +183,29 @@ class FakeGithubClient:
 
         return FakePullRequest.model_validate(pr_data)  # type: ignore
 
-    def get_prs(self, only_mine: bool = False, no_draft: bool = False) -> list[PullRequest]:
-        class FakeLabel(BaseModel):
-            name: str
-            color: str
-
-        class FakeAssignee(BaseModel):
-            login: str
+    def get_my_open_prs(self) -> list[PRStatus]:
+        return TypeAdapter(list[PRStatus]).validate_python(load_json("my_open_prs.json"))
 
-        class FakePullRequest(BaseModel):
-            number: int
-            title: str
-            draft: bool
-            review_comments: int
-            assignee: FakeAssignee
-            commits: int
-            labels: list[FakeLabel]
+    def get_prs(self, only_mine: bool = False, no_draft: bool = False) -> list[PRSummary]:
+        if self.repo_name == "github/Missing-Repo":
+            raise GraphQLError("Could not resolve to a Repository with the name 'Missing-Repo'.")
 
-        prs = TypeAdapter(list[FakePullRequest]).validate_python(load_json("prs.json"))
+        prs = TypeAdapter(list[PRSummary]).validate_python(load_json("prs.json"))
 
-        filters: list[Callable[[PullRequest], bool]] = []
+        filters: list[Callable[[PRSummary], bool]] = []
         if only_mine:
             filters.append(lambda pr: bool(pr.assignee and pr.assignee.login == self.myself))
 
         if no_draft:
             filters.append(lambda pr: not pr.draft)
 
-        return [pr for pr in prs if all(f(pr) for f in filters)]  # type: ignore
+        return [pr for pr in prs if all(f(pr) for f in filters)]
 
     @property
     def myself(self) -> str:
         return "jack"
 
-    def get_pr_checks(self, number: int) -> list[CheckRun]:
+    def get_pr_checks(self, number: int, head_sha: str | None = None) -> ChecksSummary:
         class FakeCheckRun(BaseModel):
             id: int
             status: str
@@ -214,9 +218,15 @@ class FakeGithubClient:
         if os.getenv("IS_CICD_FAILING"):
             checks[-1]["conclusion"] = "failure"
 
-        return TypeAdapter(list[FakeCheckRun]).validate_python(checks)  # type: ignore
+        check_runs = TypeAdapter(list[FakeCheckRun]).validate_python(checks)
+        return ChecksSummary.from_checks(
+            [
+                CheckStatus(check.name, check.status, check.conclusion, check.started_at)
+                for check in check_runs
+            ]
+        )
 
-    def get_pr_diff(self, number: int) -> str | None:
+    def get_pr_diff(self, number: int, max_tokens: int | None = None) -> str | None:
         if os.getenv("PR_DIFF_TOO_LARGE"):
             return None
 
@@ -229,6 +239,7 @@ class FakeGithubClient:
         title: str | None,
         body: str | None,
         draft: bool | None,
+        reviewers: list[NamedUser] | None = None,
     ) -> None:
         pass
 
@@ -1,13 +1,14 @@
 # ruff: noqa: ARG002, E501, C901
 import os
 import random
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-from jira import Issue, Project
+from jira import Issue
 from pydantic import BaseModel, TypeAdapter
 
-from glu.config import JIRA_SERVER
-from glu.models import IdReference, JiraUser
+from glu.config import get_config
+from glu.models import CreatedTicket, IdReference, IssuePage, JiraUser
 from tests import TESTS_DATA_DIR
 from tests.utils import load_json
 
@@ -37,15 +38,14 @@ class FakeIssue(BaseModel):
 
 
 class FakeJiraClient:
+    def warm_up(self) -> None:
+        pass
+
     def myself(self) -> JiraUser:
         return JiraUser("2662", "peter")
 
-    def projects(self) -> list[Project]:
-        @dataclass
-        class FakeProject:
-            key: str
-
-        return [FakeProject("TEST"), FakeProject("GLU")]  # type: ignore
+    def project_keys(self) -> list[str]:
+        return ["TEST", "GLU"]
 
     def search_users(self, query: str) -> list[JiraUser]:
         return [
@@ -68,6 +68,9 @@ class FakeJiraClient:
     def transition_issue(self, ticket_id: str, transition: str) -> None:
         pass
 
+    def move_ticket(self, ticket_id: str, transition: str) -> list[str] | None:
+        return [transition] if transition in self.get_transitions(ticket_id) else None
+
     def create_ticket(
         self,
         project: str,
@@ -83,14 +86,32 @@ class FakeJiraClient:
             key: str
 
             def permalink(self) -> str:
-                return f"{JIRA_SERVER}/browse/{self.key}"
+                return f"{get_config().env.jira_server}/browse/{self.key}"
 
         new_ticket = f"{project}-{random.randint(100, 1000)}"
         return FakeTicket(new_ticket)  # type: ignore
 
-    def search_issues(self, query: str) -> list[Issue]:
+    def create_tickets(self, tickets: list[dict]) -> list[CreatedTicket]:
+        return [
+            CreatedTicket(f"{ticket['project']['key']}-{num}")
+            for num, ticket in enumerate(tickets, start=500)
+        ]
+
+    def search_issues(
+        self, query: str, fields: list[str] | None = None, limit: int | None = 50
+    ) -> list[Issue]:
+        return [
+            issue for page in self.iter_issue_pages(query, fields, limit) for issue in page.issues
+        ]
+
+    def iter_issue_pages(
+        self, query: str, fields: list[str] | None = None, limit: int | None = None
+    ) -> Iterator[IssuePage]:
         ticket_data = load_json(TESTS_DATA_DIR / "ticket_list.json")
-        return TypeAdapter(list[FakeIssue]).validate_python(ticket_data)  # type: ignore
+        issues = TypeAdapter(list[FakeIssue]).validate_python(ticket_data)
+        # two issues a page, to exercise streaming and the limit
+        for start in range(0, min(len(issues), limit or len(issues)), 2):
+            yield IssuePage(issues[start : min(start + 2, limit or len(issues))], len(issues))  # type: ignore
 
     def get_issue(self, jira_project: str, ticket_num: int) -> Issue:
         ticket_data = load_json(TESTS_DATA_DIR / "ticket_detail.json")
@@ -1,10 +1,13 @@
 # ruff: noqa: ARG002, E501, C901
 import os
+import threading
 
 import pytest
 import toml
 
+from glu.cache import DiskCache
 from glu.config import Config, EnvConfig, Preferences, RepoConfig
+from glu.jira import JiraClient
 from tests import TESTS_DATA_DIR
 
 
@@ -32,4 +35,23 @@ def env_cli():
     env["TERM"] = "dumb"
     env["GLU_TEST"] = "1"
     env["VISUAL"] = "vim"
+    env["GLU_NO_DAEMON"] = "1"  # never forward to a daemon the developer may have running
     return env
+
+
+@pytest.fixture
+def jira_client_factory(monkeypatch, tmp_path):
+    """Builds JiraClients around a fake `jira.JIRA`, caching under a temporary dir."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GLU_TEST", raising=False)
+
+    def jira_client(fake_jira) -> JiraClient:
+        client = JiraClient.__new__(JiraClient)  # skips loading the config
+        client._jira = fake_jira
+        client._connect_lock = threading.Lock()
+        client._cache = DiskCache("jira")
+        client._cache_prefix = "https://jira.atlassian.com:me"
+        client._ticket_states = {}
+        return client
+
+    return jira_client
@@ -0,0 +1,72 @@
+# ruff: noqa: ARG001
+import httpx
+import pytest
+
+from glu.cache import DiskCache, cached_get
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GLU_TEST", raising=False)
+    return DiskCache("test")
+
+
+def _client(requests: list[httpx.Request]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"number": 1}, headers={"ETag": '"v1"'})
+
+    return httpx.Client(base_url="https://api.github.com", transport=httpx.MockTransport(handler))
+
+
+def test_cached_get_revalidates_with_etag(disk_cache):
+    requests: list[httpx.Request] = []
+    client = _client(requests)
+
+    assert cached_get(client, disk_cache, "/pulls/1").json() == {"number": 1}
+    assert cached_get(client, disk_cache, "/pulls/1").json() == {"number": 1}
+
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_cached_get_skips_request_within_ttl(disk_cache):
+    requests: list[httpx.Request] = []
+    client = _client(requests)
+
+    cached_get(client, disk_cache, "/orgs/github/members", ttl=60)
+    cached_get(client, disk_cache, "/orgs/github/members", ttl=60)
+
+    assert len(requests) == 1
+
+
+def test_disk_cache_evicts_least_recently_used(disk_cache):
+    bounded_cache = DiskCache("bounded", max_bytes=2500)
+    bounded_cache.set("a", b"a" * 1000)
+    bounded_cache.set("b", b"b" * 1000)
+    assert bounded_cache.get("a")  # "a" is now more recently used than "b"
+
+    bounded_cache.set("c", b"c" * 1000)
+
+    assert bounded_cache.get("a")
+    assert bounded_cache.get("b") is None
+    assert bounded_cache.get("c")
+
+
+def test_cached_get_keys_entries_by_accept_header(disk_cache):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["Accept"] == "application/vnd.github.v3.diff":
+            return httpx.Response(200, text="diff --git a/x b/x", headers={"ETag": '"d1"'})
+        return httpx.Response(200, json={"number": 1}, headers={"ETag": '"j1"'})
+
+    client = httpx.Client(base_url="https://api.github.com", transport=httpx.MockTransport(handler))
+    diff_headers = {"Accept": "application/vnd.github.v3.diff"}
+
+    assert cached_get(client, disk_cache, "/pulls/1", ttl=60).json() == {"number": 1}
+    assert cached_get(client, disk_cache, "/pulls/1", ttl=60, headers=diff_headers).text == (
+        "diff --git a/x b/x"
+    )
@@ -0,0 +1,83 @@
+# ruff: noqa: ARG001
+import os
+import stat
+
+import pytest
+import toml
+
+from glu import config as glu_config
+from glu.config import Config, EnvConfig, RepoConfig
+from tests import TESTS_DATA_DIR
+
+
+@pytest.fixture
+def snapshot_env(monkeypatch, write_base_config):
+    monkeypatch.setenv("GLU_TEST", "1")
+    glu_config.snapshot_path().unlink(missing_ok=True)
+
+    validations: list[Config] = []
+    validate_config = glu_config._validate_config
+
+    def _counting_validate_config(raw: bytes) -> Config:
+        validations.append(validate_config(raw))
+        return validations[-1]
+
+    monkeypatch.setattr(glu_config, "_validate_config", _counting_validate_config)
+    return validations
+
+
+def test_config_snapshot_skips_validation_when_unchanged(snapshot_env):
+    config = glu_config._load_config()
+    assert len(snapshot_env) == 1
+
+    # racily clean snapshot: verified by hash without revalidating
+    assert glu_config._load_config() == config
+    assert len(snapshot_env) == 1
+
+    # snapshot older than the file's mtime: trusted from stat alone
+    path = TESTS_DATA_DIR / "config.toml"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+    assert glu_config._load_config() == config
+    assert glu_config._load_config() == config
+    assert len(snapshot_env) == 1
+
+
+def test_config_snapshot_revalidates_on_change(snapshot_env):
+    glu_config._load_config()
+
+    updated = Config(
+        env=EnvConfig.defaults(), repos={"github/Test-Repo": RepoConfig(jira_project_key="GLU")}
+    )
+    (TESTS_DATA_DIR / "config.toml").write_text(toml.dumps(updated.model_dump()))
+
+    config = glu_config._load_config()
+    assert len(snapshot_env) == 2
+    assert config.repos["github/Test-Repo"].jira_project_key == "GLU"
+
+
+def test_config_snapshot_is_private_to_the_user(snapshot_env):
+    glu_config._load_config()
+
+    assert stat.S_IMODE(glu_config.snapshot_path().stat().st_mode) == 0o600
+
+
+def test_config_snapshot_is_per_config_file(snapshot_env, monkeypatch, tmp_path):
+    monkeypatch.setattr(glu_config, "cache_dir", lambda: tmp_path / "cache")
+    old_ns = (TESTS_DATA_DIR / "config.toml").stat().st_mtime_ns - 10_000_000_000
+
+    # same size and mtime, so that only the path tells them apart
+    for project in ("AAA", "BBB"):
+        path = tmp_path / project / "config.toml"
+        path.parent.mkdir()
+        config = Config(
+            env=EnvConfig.defaults(),
+            repos={"github/Test-Repo": RepoConfig(jira_project_key=project)},
+        )
+        path.write_text(toml.dumps(config.model_dump()))
+        os.utime(path, ns=(old_ns, old_ns))
+
+        monkeypatch.setattr(glu_config, "config_path", lambda path=path: path)
+        assert glu_config._load_config().repos["github/Test-Repo"].jira_project_key == project
+
+    assert len(snapshot_env) == 2
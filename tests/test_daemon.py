@@ -0,0 +1,67 @@
+# ruff: noqa: ARG001
+import subprocess
+
+import pytest
+import toml
+import typer
+
+from glu.config import Config, EnvConfig
+from glu.daemon import _invoke, forward_to_daemon, ping
+from tests import TESTS_DATA_DIR
+
+
+@pytest.fixture
+def daemon_env(env_cli, tmp_path, write_config_w_repo_config):
+    env_cli.pop("GLU_NO_DAEMON")
+    env_cli["GLU_DAEMON_SOCKET"] = str(tmp_path / "glu.sock")
+
+    subprocess.run(["glu", "daemon", "start"], env=env_cli, check=True)
+    yield env_cli
+    subprocess.run(["glu", "daemon", "stop"], env=env_cli, check=True)
+
+
+def test_daemon_forwards_commands(daemon_env, tmp_path, monkeypatch, capsys):
+    assert ping(tmp_path / "glu.sock")
+
+    result = subprocess.run(
+        ["glu", "commit", "count"], env=daemon_env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    assert "Commits since main: 5" in result.stdout
+
+    # served by the daemon, rather than falling back to running in-process
+    monkeypatch.setenv("GLU_DAEMON_SOCKET", daemon_env["GLU_DAEMON_SOCKET"])
+    monkeypatch.delenv("GLU_NO_DAEMON", raising=False)
+    assert forward_to_daemon(["commit", "count"]) == 0
+    assert "Commits since main: 5" in capsys.readouterr().out
+
+
+def test_daemon_falls_back_on_prompts(daemon_env, monkeypatch):
+    # without a repo config, the Jira project is prompted for
+    (TESTS_DATA_DIR / "config.toml").write_text(
+        toml.dumps(Config(env=EnvConfig.defaults()).model_dump()), encoding="utf-8"
+    )
+    monkeypatch.setenv("GLU_DAEMON_SOCKET", daemon_env["GLU_DAEMON_SOCKET"])
+    monkeypatch.delenv("GLU_NO_DAEMON", raising=False)
+
+    assert forward_to_daemon(["ticket", "view", "354"]) is None
+
+
+def test_no_forwarding_without_daemon(monkeypatch, tmp_path):
+    monkeypatch.delenv("GLU_NO_DAEMON", raising=False)
+    monkeypatch.setenv("GLU_DAEMON_SOCKET", str(tmp_path / "glu.sock"))
+
+    assert forward_to_daemon(["commit", "count"]) is None
+    assert forward_to_daemon(["pr", "create"]) is None
+
+
+def test_invoke_reports_unexpected_errors(capsys):
+    app = typer.Typer()
+
+    @app.command()
+    def fail():
+        raise RuntimeError("Jira is down")
+
+    assert _invoke(app, []) == 1
+    assert "RuntimeError: Jira is down" in capsys.readouterr().err
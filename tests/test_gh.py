@@ -0,0 +1,143 @@
+# ruff: noqa: ARG002
+import datetime as dt
+import json
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+import httpx
+
+from glu.gh import (
+    GithubClient,
+    _read_capped,
+    get_all_from_paginated_list,
+    get_pr_diff,
+    get_top_member_matches,
+)
+from glu.models import ChecksSummary, CheckStatus
+from tests.clients.github import FakeGithubClient, FakeUser
+
+
+@dataclass
+class FakePaginatedList:
+    items: list[int]
+    page_size: int = 10
+    fetched_pages: list[int] = field(default_factory=list)
+    stale_count: int | None = None
+
+    @property
+    def totalCount(self) -> int:
+        return self.stale_count or len(self.items)
+
+    def get_page(self, page: int) -> list[int]:
+        self.fetched_pages.append(page)
+        return self.items[page * self.page_size : (page + 1) * self.page_size]
+
+
+def test_get_all_from_paginated_list_preserves_order():
+    paginated_list = FakePaginatedList(list(range(95)))
+
+    assert get_all_from_paginated_list(paginated_list) == list(range(95))  # type: ignore
+    assert sorted(paginated_list.fetched_pages) == list(range(10))
+
+
+def test_get_all_from_paginated_list_keeps_going_if_list_grew():
+    paginated_list = FakePaginatedList(list(range(45)), stale_count=30)
+
+    items = get_all_from_paginated_list(paginated_list)  # type: ignore
+    assert items == list(range(45))
+
+
+def test_get_all_from_paginated_list_stops_early():
+    paginated_list = FakePaginatedList(list(range(500)))
+
+    assert get_all_from_paginated_list(paginated_list, limit=25) == list(range(25))  # type: ignore
+
+    paginated_list.fetched_pages.clear()
+    items = get_all_from_paginated_list(paginated_list, until=lambda i: i == 12)  # type: ignore
+    assert items == list(range(13))
+    assert max(paginated_list.fetched_pages) < 10
+
+
+def test_get_top_member_matches():
+    members = [FakeUser(f"user-{i}") for i in range(1000)] + [FakeUser("teddy")]
+
+    teddy_matches, user_matches = get_top_member_matches(
+        members,  # type: ignore
+        ["teddy", "user-99"],
+        k=3,
+    )
+
+    assert teddy_matches[0].user.login == "teddy"
+    assert teddy_matches[0].score == 100
+    assert [match.user.login for match in user_matches][0] == "user-99"
+    assert len(user_matches) == 3
+
+
+def test_checks_summary_keeps_latest_attempt():
+    first_attempt = dt.datetime(2025, 6, 14, 22, 0, tzinfo=dt.timezone.utc)
+    retry = first_attempt + dt.timedelta(minutes=5)
+    summary = ChecksSummary.from_checks(
+        [
+            CheckStatus("tests", "completed", "failure", first_attempt),
+            CheckStatus("tests", "completed", "success", retry),
+            CheckStatus("lint", "in_progress", None, retry),
+            CheckStatus("deploy", "waiting", None, retry),
+            CheckStatus("release", "completed", "skipped", retry),
+        ]
+    )
+
+    assert [check.name for check in summary.checks] == ["tests", "lint"]
+    assert [check.name for check in summary.passed] == ["tests"]
+    assert [check.name for check in summary.pending] == ["lint"]
+    assert summary.state == "pending"
+
+
+def test_read_capped_cuts_at_line_boundary():
+    chunks = ["diff --git a/x b/x\n+one\n", "+two\n+three\n"]
+
+    assert _read_capped(iter(chunks), 1000) == "".join(chunks)
+    assert _read_capped(iter(chunks), 30) == "diff --git a/x b/x\n+one\n+two\n"
+
+
+class LocalGit:
+    def __init__(self, diff: str | None):
+        self.diff = diff
+
+    def get_merge_base_diff(self, base_sha: str, head_sha: str) -> str | None:
+        return self.diff
+
+
+def test_get_pr_diff_prefers_local_checkout(monkeypatch):
+    gh = FakeGithubClient("github/Test-Repo")
+    pr = gh.get_pr(1)
+    monkeypatch.setattr(gh, "get_pr_diff", lambda *_: "diff from github")
+
+    assert get_pr_diff(gh, LocalGit("local diff"), pr) == "local diff"  # type: ignore
+    assert get_pr_diff(gh, LocalGit(None), pr) == "diff from github"  # type: ignore
+    assert get_pr_diff(gh, None, pr) == "diff from github"  # type: ignore
+
+
+def test_add_reviewers_reports_dropped_and_invalid_logins(capsys):
+    def request_reviews(request: httpx.Request) -> httpx.Response:
+        logins = json.loads(request.content)["reviewers"]
+        if "ghost" in logins:
+            return httpx.Response(422, json={"message": "Reviews may only be requested..."})
+        # GitHub leaves out the PR's author rather than failing
+        requested = [{"login": login} for login in logins if login != "jack"]
+        return httpx.Response(201, json={"requested_reviewers": requested})
+
+    gh = GithubClient.__new__(GithubClient)  # skips loading the config
+    gh._repo_name = "github/Test-Repo"
+    gh._http = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(request_reviews)
+    )
+    pr = SimpleNamespace(number=263)
+
+    gh.add_reviewers_to_pr(pr, [FakeUser("melissa"), FakeUser("jack")])  # type: ignore
+    assert "Failed to add reviewer jack: review not requested" in capsys.readouterr().out
+
+    gh.add_reviewers_to_pr(pr, [FakeUser("melissa"), FakeUser("jack"), FakeUser("ghost")])  # type: ignore
+    output = capsys.readouterr().out
+    assert "Failed to add reviewer jack: review not requested" in output
+    assert "Failed to add reviewer ghost" in output
+    assert "melissa" not in output
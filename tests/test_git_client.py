@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+from git import GitCommandError
+
 from glu.local import GitClient
 
 
@@ -19,6 +21,16 @@ def test_push_without_upstream_flag_when_tracking_set():
     git.push.assert_called_once_with("origin", "push-test")
 
 
+def test_remote_default_branch_from_origin_head():
+    client, _, git = _make_client(branch_name="push-test", has_tracking=True)
+    git.symbolic_ref.return_value = "origin/develop"
+
+    assert client.remote_default_branch == "develop"
+
+    git.symbolic_ref.side_effect = GitCommandError("symbolic-ref", 128)
+    assert client.remote_default_branch is None
+
+
 def _make_client(branch_name: str, has_tracking: bool):
     # GitClient() already returns the fake client in tests, but this is scoped narrowly.
     # Client has a _repo attribute
@@ -0,0 +1,231 @@
+# ruff: noqa: ARG002
+from types import SimpleNamespace
+
+from jira import JIRAError
+from jira.client import ResultList
+
+from glu import jira as glu_jira
+from glu.jira import plan_transitions
+
+CATEGORIES = {"To Do": "new", "In Progress": "indeterminate", "In Review": "indeterminate"}
+
+
+def _transition(transition_id: str, name: str, to: str) -> dict:
+    category = CATEGORIES.get(to, "done")
+    return {
+        "id": transition_id,
+        "name": name,
+        "to": {"name": to, "statusCategory": {"key": category}},
+    }
+
+
+WORKFLOW = {
+    "To Do": [_transition("11", "Starting", "In Progress")],
+    "In Progress": [_transition("21", "Ready for review", "In Review")],
+    "In Review": [_transition("31", "Finished", "Done")],
+}
+
+# tickets can also be sent back, stopped or reopened
+WORKFLOW_W_BACK_EDGES = {
+    "To Do": WORKFLOW["To Do"],
+    "In Progress": [*WORKFLOW["In Progress"], _transition("12", "Stop", "To Do")],
+    "In Review": [*WORKFLOW["In Review"], _transition("22", "Back", "In Progress")],
+    "Done": [_transition("41", "Reopen", "To Do")],
+}
+
+
+class FakeJira:
+    def __init__(self, requests: list[str]):
+        self.requests = requests
+        self.status = "To Do"
+        self.workflow = WORKFLOW
+
+    def issue(self, ticket_id: str, fields: str, expand: str) -> SimpleNamespace:
+        self.requests.append(f"GET {ticket_id}")
+        return SimpleNamespace(
+            fields=SimpleNamespace(
+                issuetype=SimpleNamespace(name="Story"),
+                status=SimpleNamespace(
+                    name=self.status,
+                    statusCategory=SimpleNamespace(key=CATEGORIES.get(self.status, "done")),
+                ),
+            ),
+            raw={"transitions": self.workflow[self.status]},
+        )
+
+    def create_issues(self, field_list: list[dict], prefetch: bool) -> list[dict]:
+        self.requests.append(f"POST bulk {len(field_list)}")
+        if field_list[0]["summary"] == "rejected":
+            raise JIRAError("Unauthorized", status_code=401)
+
+        return [
+            {"issue": None, "error": {"summary": "required"}}
+            if not fields["summary"]
+            else {"issue": SimpleNamespace(key=fields["summary"]), "error": None}
+            for fields in field_list
+        ]
+
+    def projects(self) -> list[SimpleNamespace]:
+        self.requests.append("GET projects")
+        return [SimpleNamespace(key="TEST")]
+
+    def transition_issue(self, ticket_id: str, transition: str) -> None:
+        self.requests.append(f"POST {ticket_id} {transition}")
+        self.status = next(
+            t["to"]["name"] for t in self.workflow[self.status] if t["id"] == transition
+        )
+
+
+def test_transitions_are_cached_per_workflow_state(jira_client_factory):
+    jira = jira_client_factory(FakeJira([]))
+    assert jira.get_transitions("TEST-1") == ["Starting"]
+    jira.transition_issue("TEST-1", "Starting")
+    assert jira.get_transitions("TEST-1") == ["Ready for review"]
+
+    requests: list[str] = []
+    jira = jira_client_factory(FakeJira(requests))  # as another glu process would
+    jira.get_transitions("TEST-2")
+    jira.transition_issue("TEST-2", "Starting")
+
+    assert jira.get_transitions("TEST-2") == ["Ready for review"]
+    assert requests == ["GET TEST-2", "POST TEST-2 11"]
+
+
+def test_metadata_is_cached_until_stale(jira_client_factory, monkeypatch):
+    requests: list[str] = []
+    assert jira_client_factory(FakeJira(requests)).project_keys() == ["TEST"]
+    assert jira_client_factory(FakeJira(requests)).project_keys() == ["TEST"]
+    assert requests == ["GET projects"]
+
+    monkeypatch.setattr(glu_jira, "JIRA_METADATA_TTL_S", 0)
+    jira_client_factory(FakeJira(requests)).project_keys()
+    assert requests == ["GET projects", "GET projects"]
+
+
+def test_move_ticket_takes_learned_multi_hop_path(jira_client_factory):
+    jira = jira_client_factory(FakeJira([]))
+    jira.transition_issue("TEST-1", "Starting")
+    jira.transition_issue("TEST-1", "Ready for review")
+    jira.get_transitions("TEST-1")  # learns the whole workflow
+
+    requests: list[str] = []
+    jira = jira_client_factory(FakeJira(requests))
+
+    assert jira.move_ticket("TEST-2", "Finished") == ["Starting", "Ready for review", "Finished"]
+    assert requests == ["GET TEST-2", "POST TEST-2 11", "POST TEST-2 21", "POST TEST-2 31"]
+
+
+def _planned(workflow: dict, status: str, transition: str) -> list[str] | None:
+    # as learned by JiraClient
+    learned = {
+        source: [
+            {
+                "id": t["id"],
+                "name": t["name"],
+                "to": t["to"]["name"],
+                "category": t["to"]["statusCategory"]["key"],
+            }
+            for t in transitions
+        ]
+        for source, transitions in workflow.items()
+    }
+    categories = {source: CATEGORIES.get(source, "done") for source in workflow}
+
+    path = plan_transitions(learned, categories, status, transition)
+    return None if path is None else [t["name"] for t in path]
+
+
+def test_plan_transitions():
+    assert _planned(WORKFLOW, "To Do", "Ready for review") == ["Starting", "Ready for review"]
+    assert _planned(WORKFLOW, "In Progress", "Starting") == []  # already there
+    assert _planned(WORKFLOW, "In Review", "Starting") == []  # already past it
+    assert _planned({"To Do": WORKFLOW["To Do"]}, "To Do", "Finished") is None
+
+
+def test_plan_transitions_only_moves_forward():
+    workflow = WORKFLOW_W_BACK_EDGES
+
+    assert _planned(workflow, "To Do", "Finished") == ["Starting", "Ready for review", "Finished"]
+    assert _planned(workflow, "In Review", "Starting") == []
+    assert _planned(workflow, "In Review", "Ready for review") == []
+    assert _planned(workflow, "Done", "Starting") == []
+    assert _planned(workflow, "Done", "Ready for review") == []
+    assert _planned(workflow, "In Progress", "Stop") == []
+
+
+def test_move_ticket_leaves_tickets_past_the_target(jira_client_factory):
+    jira = jira_client_factory(FakeJira([]))
+    jira._jira.workflow = WORKFLOW_W_BACK_EDGES
+    for transition in ("Starting", "Ready for review", "Finished"):
+        jira.transition_issue("TEST-1", transition)
+    jira.get_transitions("TEST-1")  # learns the whole workflow, back edges included
+
+    requests: list[str] = []
+    jira = jira_client_factory(FakeJira(requests))
+    jira._jira.workflow = WORKFLOW_W_BACK_EDGES
+    jira._jira.status = "In Review"
+
+    assert jira.move_ticket("TEST-2", "Starting") == []
+    jira._ticket_states.clear()
+    jira._jira.status = "Done"
+    assert jira.move_ticket("TEST-2", "Ready for review") == []
+    assert requests == ["GET TEST-2", "GET TEST-2"]
+
+
+def test_create_tickets_in_concurrent_chunks(jira_client_factory):
+    requests: list[str] = []
+    jira = jira_client_factory(FakeJira(requests))
+
+    summaries = [f"TEST-{num}" for num in range(120)]
+    summaries[3] = ""
+    summaries[100] = "rejected"  # the whole third chunk
+    created = jira.create_tickets([{"summary": summary} for summary in summaries])
+
+    assert sorted(requests) == ["POST bulk 20", "POST bulk 50", "POST bulk 50"]
+    assert [ticket.key for ticket in created[:3]] == ["TEST-0", "TEST-1", "TEST-2"]
+    assert created[3].key is None
+    assert created[3].error == "summary: required"
+    assert created[99].key == "TEST-99"
+    assert all(ticket.key is None and ticket.error for ticket in created[100:])
+
+
+class FakeCloudJira:
+    _is_cloud = True
+
+    def __init__(self, issue_count: int, page_size: int):
+        self.keys = [f"TEST-{num}" for num in range(issue_count)]
+        self.page_size = page_size
+        self.counted: list[str] = []
+
+    def enhanced_search_issues(
+        self, jql: str, nextPageToken: str | None, maxResults: int, fields: list[str]
+    ) -> ResultList:
+        # like Cloud, the page size is capped and the total is only that of the page
+        start = int(nextPageToken or 0)
+        end = min(start + min(maxResults, self.page_size), len(self.keys))
+        return ResultList(
+            [SimpleNamespace(key=key) for key in self.keys[start:end]],
+            _nextPageToken=str(end) if end < len(self.keys) else None,
+        )
+
+    def approximate_issue_count(self, jql: str) -> int:
+        self.counted.append(jql)
+        return len(self.keys)
+
+
+def test_iter_issue_pages_on_cloud(jira_client_factory):
+    jira = jira_client_factory(FakeCloudJira(issue_count=250, page_size=100))
+
+    pages = list(jira.iter_issue_pages("project = TEST ORDER BY created DESC"))
+    assert [len(page.issues) for page in pages] == [100, 100, 50]
+    assert pages[0].total == 250
+    assert [issue.key for page in pages for issue in page.issues] == jira._jira.keys
+    assert jira._jira.counted == ["project = TEST"]
+
+    pages = list(jira.iter_issue_pages("project = TEST", limit=120))
+    assert [len(page.issues) for page in pages] == [100, 20]
+    assert pages[0].total == 250
+
+    jira._jira = FakeCloudJira(issue_count=30, page_size=100)  # type: ignore
+    assert [page.total for page in jira.iter_issue_pages("project = TEST")] == [30]
+    assert jira._jira.counted == []  # one page is all there is
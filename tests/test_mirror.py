@@ -0,0 +1,144 @@
+# ruff: noqa: ARG002
+from types import SimpleNamespace
+
+import pytest
+from jira.client import ResultList
+from requests import RequestException
+
+from glu.mirror import JiraMirror
+from glu.models import IssuePage, TicketQuery
+
+
+def _raw_issue(key: str, summary: str, status: str = "To Do", **fields) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "description": None,
+            "issuetype": {"name": "Story"},
+            "status": {"name": status},
+            "priority": {"id": "3", "name": "Medium"},
+            "assignee": {"accountId": "2662", "displayName": "Peter Parker"},
+            "reporter": {"accountId": "5234", "displayName": "Jack Daly"},
+            "resolution": None,
+            "created": f"2025-06-0{key[-1]}T10:00:00.000+0000",
+        }
+        | fields,
+    }
+
+
+class FakeJira:
+    def __init__(self, issues: list[dict]):
+        self.issues = issues
+        self.queries: list[str] = []
+
+    def iter_issue_pages(self, jql: str, fields: list[str] | None = None):
+        self.queries.append(jql)
+        yield IssuePage([SimpleNamespace(raw=issue) for issue in self.issues], len(self.issues))
+
+
+class FakeCloudJira:
+    """Pages of 100 issues by token, with a total of just the page, as Jira Cloud does."""
+
+    _is_cloud = True
+
+    def __init__(self, issues: list[dict], fail_at_page: int | None = None):
+        self.issues = issues
+        self.fail_at_page = fail_at_page
+
+    def enhanced_search_issues(
+        self, jql: str, nextPageToken: str | None, maxResults: int, fields: list[str]
+    ) -> ResultList:
+        start = int(nextPageToken or 0)
+        if start // 100 == self.fail_at_page:
+            raise RequestException("Connection reset by peer")
+
+        end = min(start + 100, len(self.issues))
+        return ResultList(
+            [SimpleNamespace(raw=issue) for issue in self.issues[start:end]],
+            _nextPageToken=str(end) if end < len(self.issues) else None,
+        )
+
+    def approximate_issue_count(self, jql: str) -> int:
+        return len(self.issues)
+
+
+@pytest.fixture
+def mirror(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GLU_TEST", raising=False)
+    return JiraMirror("https://jira.atlassian.com", "me")
+
+
+def test_sync_is_incremental(mirror):
+    jira = FakeJira(
+        [
+            _raw_issue("TEST-1", "Add list tickets command"),
+            _raw_issue("TEST-2", "Index error on pr merge", description="Crashes when merging"),
+        ]
+    )
+    assert mirror.synced_at("TEST") is None
+    assert mirror.sync(jira, "TEST") == 2  # type: ignore[arg-type]
+    assert jira.queries == ["project = TEST ORDER BY updated ASC"]
+
+    jira.issues = [_raw_issue("TEST-1", "Add list tickets command", status="In Progress")]
+    assert mirror.sync(jira, "TEST") == 1  # type: ignore[arg-type]
+    assert jira.queries[-1] == "project = TEST AND updated >= -2m ORDER BY updated ASC"
+
+    issue = mirror.get_issue("TEST-1")
+    assert issue and issue.fields.status.name == "In Progress"
+    assert mirror.get_issue("TEST-3") is None
+
+
+def test_search(mirror):
+    jira = FakeJira(
+        [
+            _raw_issue("TEST-1", "Add list tickets command"),
+            _raw_issue("TEST-2", "Index error on pr merge", description="Crashes when merging"),
+            _raw_issue(
+                "TEST-3",
+                "Add list PRs command",
+                status="Done",
+                resolution={"name": "Done"},
+                priority={"id": "1", "name": "Highest"},
+                assignee=None,
+            ),
+        ]
+    )
+    mirror.sync(jira, "TEST")  # type: ignore[arg-type]
+
+    def keys(query: TicketQuery, **kwargs) -> list[str]:
+        return [issue.key for issue in mirror.search(query, **kwargs).issues]
+
+    assert keys(TicketQuery("TEST")) == ["TEST-2", "TEST-1"]
+    assert keys(TicketQuery("TEST", open=False)) == ["TEST-3", "TEST-2", "TEST-1"]
+    assert keys(TicketQuery("TEST", open=False, order_by_priority=True))[0] == "TEST-3"
+    assert keys(TicketQuery("TEST", search="merged")) == ["TEST-2"]  # stemmed, in description
+    assert keys(TicketQuery("TEST", search="list comm", open=False)) == ["TEST-3", "TEST-1"]
+    assert keys(TicketQuery("TEST", statuses=["done"])) == ["TEST-3"]
+    assert keys(TicketQuery("TEST", open=False, assignee="peter parker")) == ["TEST-2", "TEST-1"]
+    assert keys(TicketQuery("TEST", only_mine=True), account_id="5234") == []
+    assert keys(TicketQuery("OTHER")) == []
+
+    page = mirror.search(TicketQuery("TEST", open=False), limit=1)
+    assert len(page.issues) == 1
+    assert page.total == 3
+
+
+def test_sync_fetches_every_page(mirror, jira_client_factory):
+    issues = [_raw_issue(f"TEST-{num}", f"Ticket {num}") for num in range(250)]
+    assert mirror.sync(jira_client_factory(FakeCloudJira(issues)), "TEST") == 250
+    assert mirror.search(TicketQuery("TEST")).total == 250
+    assert mirror.get_issue("TEST-249")
+
+
+def test_failed_full_sync_keeps_the_mirror(mirror, jira_client_factory):
+    issues = [_raw_issue(f"TEST-{num}", f"Ticket {num}") for num in range(250)]
+    mirror.sync(jira_client_factory(FakeCloudJira(issues)), "TEST")
+    synced_at = mirror.synced_at("TEST")
+
+    with pytest.raises(RequestException):
+        mirror.sync(jira_client_factory(FakeCloudJira(issues, fail_at_page=2)), "TEST", full=True)
+
+    assert mirror.search(TicketQuery("TEST")).total == 250
+    assert mirror.synced_at("TEST") == synced_at
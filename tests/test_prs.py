@@ -134,6 +134,34 @@ def test_list_prs_only_mine(env_cli, write_config_w_repo_config):
     assert "372" in pr_table
 
 
+def test_list_prs_across_repos(env_cli, write_config_w_repo_config):
+    child = pexpect.spawn(
+        "glu pr list --repos github/Test-Repo,github/Other-Repo",
+        env=env_cli,
+        encoding="utf-8",
+    )
+
+    child.expect("2/2 repos")
+    child.expect(pexpect.EOF)
+    pr_table = get_terminal_text(child.before)
+    assert "Other-Repo#373" in pr_table
+    assert "Test-Repo#372" in pr_table
+
+
+def test_list_prs_across_repos_shows_repo_errors(env_cli, write_config_w_repo_config):
+    child = pexpect.spawn(
+        "glu pr list --repos github/Test-Repo,github/Missing-Repo",
+        env=env_cli,
+        encoding="utf-8",
+    )
+
+    child.expect(pexpect.EOF)
+    pr_table = get_terminal_text(child.before)
+    assert "Test-Repo#372" in pr_table
+    assert "Missing-Repo" in pr_table
+    assert "failed to fetch PRs" in pr_table
+
+
 def test_view_pr(env_cli, write_config_w_repo_config):
     env_cli["PR_HAS_NO_REVIEWERS"] = "1"
     child = pexpect.spawn("glu pr view 345", env=env_cli, encoding="utf-8")
@@ -151,6 +179,20 @@ def test_view_pr(env_cli, write_config_w_repo_config):
     assert "2" in pr_detail
 
 
+def test_view_pr_watch_checks(env_cli, write_config_w_repo_config):
+    env_cli["IS_CICD_FAILING"] = "1"
+    child = pexpect.spawn("glu pr view 345 --watch", env=env_cli, encoding="utf-8")
+
+    child.expect(pexpect.EOF)
+    checks = get_terminal_text(child.before)
+    child.close()
+
+    assert "PR #345 checks" in checks
+    assert "Validate PR title" in checks
+    assert "4/5 passed" in checks
+    assert child.exitstatus == 1
+
+
 def test_update_pr(env_cli, write_config_w_repo_config):
     child = pexpect.spawn("glu pr update 353", env=env_cli, encoding="utf-8")
 
@@ -0,0 +1,112 @@
+import time
+
+import httpx
+import pytest
+
+from glu import scheduler as glu_scheduler
+from glu.scheduler import HostBudget, RequestScheduler
+
+
+@pytest.fixture
+def request_scheduler(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GLU_TEST", raising=False)
+    monkeypatch.setattr(glu_scheduler, "BACKOFF_BASE_S", 0)
+    return RequestScheduler()
+
+
+def _sender(responses: list[httpx.Response]):
+    sent: list[httpx.Response] = []
+
+    def send_request() -> httpx.Response:
+        sent.append(responses[len(sent)])
+        return sent[-1]
+
+    return send_request, sent
+
+
+def test_scheduler_retries_rate_limited_and_failed_requests(request_scheduler):
+    send_request, sent = _sender(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(502),
+            httpx.Response(200, headers={"X-RateLimit-Remaining": "4999"}),
+        ]
+    )
+
+    response = request_scheduler.send("api.github.com", "core", "GET", send_request)
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert request_scheduler.budget("api.github.com").remaining == 4999
+
+
+def test_scheduler_only_resends_idempotent_requests_that_failed(request_scheduler):
+    send_request, sent = _sender(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(502),
+            httpx.Response(201),
+        ]
+    )
+
+    # the ticket may well have been created before the 502
+    assert (
+        request_scheduler.send("jira.atlassian.com", "core", "POST", send_request).status_code
+        == 502
+    )
+    assert len(sent) == 2
+
+
+def test_scheduler_does_not_retry_client_errors(request_scheduler):
+    send_request, sent = _sender([httpx.Response(404), httpx.Response(200)])
+
+    assert request_scheduler.send("api.github.com", "core", "GET", send_request).status_code == 404
+    assert len(sent) == 1
+
+
+def test_scheduler_shares_budgets_between_processes(request_scheduler):
+    reset_at = time.time() + 600
+    send_request, _ = _sender(
+        [
+            httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Reset": str(reset_at),
+                },
+            )
+        ]
+    )
+    request_scheduler.send("api.github.com", "core", "GET", send_request)
+
+    budget = RequestScheduler().budget("api.github.com")  # as seen by another glu process
+    assert budget == HostBudget(0, 5000, reset_at)
+    assert budget.wait_time(time.time()) > 590
+
+
+def test_scheduler_persists_budgets_only_when_they_change(request_scheduler, monkeypatch):
+    monkeypatch.setattr(glu_scheduler, "MAX_SPREAD_DELAY_S", 0)
+    writes: list[HostBudget] = []
+    monkeypatch.setattr(request_scheduler._store, "set", lambda key, budget: writes.append(budget))
+
+    reset_at = str(time.time() + 600)
+    send_request, _ = _sender(
+        [
+            httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Remaining": str(remaining),
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Reset": reset_at,
+                },
+            )
+            for remaining in (4999, 4998, 4997, 49, 48)
+        ]
+    )
+    for _ in range(5):
+        request_scheduler.send("api.github.com", "core", "GET", send_request)
+
+    # once for the new window, then for every response once the budget runs low
+    assert len(writes) == 3
@@ -0,0 +1,64 @@
+# ruff: noqa: ARG001
+import os
+
+import pytest
+
+from tests.benchmark import (
+    ENTRY_POINTS,
+    format_report,
+    load_baselines,
+    measure_calibration,
+    measure_entry_point,
+    write_baselines,
+)
+
+# allowed slowdown relative to the stored baseline before failing
+THRESHOLD = float(os.getenv("GLU_STARTUP_THRESHOLD", "0.5"))
+
+# timings depend on the machine and its load, so they're only checked when asked for
+CHECK_WALL_TIME = bool(os.getenv("GLU_STARTUP_BENCHMARK"))
+
+
+@pytest.fixture(scope="module")
+def calibration():
+    return measure_calibration(os.environ.copy())
+
+
+@pytest.mark.parametrize("entry_point", ENTRY_POINTS)
+def test_startup(entry_point, calibration, env_cli, tmp_path, write_config_w_repo_config):
+    # as users run it: forwarding to a daemon is tried first, here without one running
+    env_cli.pop("GLU_NO_DAEMON")
+    env_cli["GLU_DAEMON_SOCKET"] = str(tmp_path / "glu.sock")
+
+    profile = measure_entry_point(entry_point, env_cli)
+    wall_ratio = profile.wall_s / calibration.wall_s
+    print(format_report(entry_point, profile, calibration))  # noqa: T201
+
+    if os.getenv("GLU_UPDATE_STARTUP_BASELINES"):
+        baselines = load_baselines()
+        baselines[entry_point] = {
+            "wall_ratio": round(wall_ratio, 3),
+            "heavy_packages": sorted(profile.heavy_packages),
+        }
+        write_baselines(baselines)
+        return
+
+    baseline = load_baselines().get(entry_point)
+    assert baseline, (
+        f"No startup baseline for '{entry_point}', "
+        f"run with GLU_UPDATE_STARTUP_BASELINES=1 to record one"
+    )
+
+    new_heavy_packages = profile.heavy_packages - set(baseline["heavy_packages"])
+    assert not new_heavy_packages, (
+        f"'{entry_point}' now imports {', '.join(sorted(new_heavy_packages))} at startup"
+    )
+
+    if not CHECK_WALL_TIME:
+        return
+
+    max_ratio = baseline["wall_ratio"] * (1 + THRESHOLD)
+    assert wall_ratio <= max_ratio, (
+        f"'{entry_point}' startup regressed: {wall_ratio:.2f}x calibration "
+        f"(baseline {baseline['wall_ratio']:.2f}x, max {max_ratio:.2f}x)"
+    )
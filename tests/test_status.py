@@ -0,0 +1,15 @@
+# ruff: noqa: ARG001
+import pexpect
+
+from tests.utils import get_terminal_text
+
+
+def test_status(env_cli, write_config_w_repo_config):
+    child = pexpect.spawn("glu status", env=env_cli, encoding="utf-8")
+
+    child.expect(pexpect.EOF)
+    status = get_terminal_text(child.before)
+    assert "github/Test-Repo#373" in status
+    assert "approved" in status
+    assert "checks: failure" in status
+    assert "TEST-452" in status
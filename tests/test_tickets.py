@@ -4,6 +4,7 @@ import re
 import pexpect
 from pexpect import spawn
 
+from tests import TESTS_DATA_DIR
 from tests.utils import Key, get_terminal_text
 
 
@@ -41,6 +42,16 @@ def test_list_tickets(write_config_w_repo_config, env_cli):
     assert "For rev" in ticket_table
 
 
+def test_list_tickets_limit(write_config_w_repo_config, env_cli):
+    child = pexpect.spawn("glu ticket list --limit 3", env=env_cli, encoding="utf-8")
+
+    child.expect(pexpect.EOF)
+    output = get_terminal_text(child.before)
+    assert "Add list PRs command" in output
+    assert "Add update PR description command" not in output
+    assert "Showing 3 of" in output
+
+
 def test_view_ticket(write_config_w_repo_config, env_cli):
     child = pexpect.spawn("glu ticket view 354", env=env_cli, encoding="utf-8")
 
@@ -110,3 +121,55 @@ def _create_ticket(child: spawn, with_ai: bool = False, select_project: bool = F
     lines = text.splitlines()
     assert lines[-1].startswith("View at http")
     assert lines[0] in lines[-1]
+
+
+def test_create_tickets_from_file(write_config_w_repo_config, env_cli):
+    child = pexpect.spawn(
+        f"glu ticket create --from {TESTS_DATA_DIR / 'tickets.yaml'}",
+        env=env_cli,
+        encoding="utf-8",
+    )
+
+    child.expect("Create 3 tickets?")
+    child.sendline("y")
+    child.expect(pexpect.EOF)
+    output = get_terminal_text(child.before)
+
+    assert "Created 3 of 3 tickets" in output
+    assert "TEST-500" in output
+    assert "Add bulk ticket creation" in output
+    assert "TEST-502" in output
+
+
+def test_create_tickets_from_file_validates_all_rows(write_config_w_repo_config, env_cli):
+    child = pexpect.spawn(
+        f"glu ticket create --from {TESTS_DATA_DIR / 'tickets.csv'}",
+        env=env_cli,
+        encoding="utf-8",
+    )
+
+    child.expect(pexpect.EOF)
+    output = get_terminal_text(child.before)
+
+    assert "Invalid tickets in tickets.csv" in output
+    assert "Row 1" not in output
+    assert "missing summary" in output
+    assert "unknown type Incident for TEST" in output
+    assert "unknown project NOPE" in output
+    assert "Create" not in output
+
+
+def test_create_tickets_from_file_rejects_non_text_values(write_config_w_repo_config, env_cli):
+    child = pexpect.spawn(
+        f"glu ticket create --from {TESTS_DATA_DIR / 'invalid_tickets.yaml'}",
+        env=env_cli,
+        encoding="utf-8",
+    )
+
+    child.expect(pexpect.EOF)
+    output = get_terminal_text(child.before)
+
+    assert "Invalid tickets in invalid_tickets.yaml" in output
+    assert "Row 1" not in output
+    assert "unknown project 123" in output
+    assert "invalid assignee" in output